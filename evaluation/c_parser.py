@@ -3,6 +3,63 @@
 import re
 from typing import Dict, List, Tuple
 
+# Fenced code blocks with optional filename
+# Matches: ```c filename.c or ```c or ```
+# Also handles cpp, h extensions
+_CODE_BLOCK_RE = re.compile(
+    r"```(?:c(?:pp)?|h)?\s*(?:([^\n`]+\.(?:c|h|cpp)))?\n(.*?)```", re.DOTALL | re.IGNORECASE
+)
+
+# Filename comments at the top of a block
+_BLOCK_COMMENT_RE = re.compile(r"/\*\s*(?:file:?\s*)?([^\s*/]+\.(?:c|h|cpp))\s*\*/", re.IGNORECASE)
+_LINE_COMMENT_RE = re.compile(r"//\s*(?:file:?\s*)?([^\s]+\.(?:c|h|cpp))", re.IGNORECASE)
+_BARE_FILENAME_RE = re.compile(r"([a-z_][a-z0-9_]*\.(?:c|h|cpp))", re.IGNORECASE)
+
+# Known Quake functions and the files that define them
+_CONTENT_FILENAME_PATTERNS = [
+    (re.compile(pattern), filename)
+    for pattern, filename in [
+        (r"\bR_RecursiveWorldNode\s*\(", "r_bsp.c"),
+        (r"\bZ_Malloc\s*\(|Z_TagMalloc\s*\(", "zone.c"),
+        (r"\bCL_AdjustAngles\s*\(|CL_BaseMove\s*\(", "cl_input.c"),
+        (r"\bS_PaintChannelFrom\s*\(|SND_PaintChannelFrom\s*\(", "snd_mix.c"),
+        (r"\bMod_DecompressVis\s*\(", "model.c"),
+        (r"\bSV_LinkEdict\s*\(|SV_AreaEdicts\s*\(", "world.c"),
+        (r"\bR_BuildLightMap\s*\(|R_AddDynamicLights\s*\(", "r_light.c"),
+        (r"\bSkeleton_Init\s*\(|Skeleton_Blend\s*\(", "skeleton.c"),
+        (r"\bR_SetupAliasFrame\s*\(", "r_alias.c"),
+        (r"\bPortal_Create\s*\(|Portal_Cull\s*\(", "portal.c"),
+        (r"\bTerrain_Init\s*\(|Terrain_GetHeight\s*\(", "terrain.c"),
+    ]
+]
+
+# Header indicators
+_HEADER_RES = [
+    re.compile(pattern, re.MULTILINE)
+    for pattern in [
+        r"#ifndef\s+\w+_H",
+        r"#define\s+\w+_H",
+        r"#pragma\s+once",
+        r"typedef\s+struct\s+\w+\s*\{",
+        r"typedef\s+enum\s*\{",
+    ]
+]
+
+# Implementation indicators
+_IMPL_RES = [
+    re.compile(pattern, re.MULTILINE)
+    for pattern in [
+        r"^\s*\w+\s+\w+\s*\([^)]*\)\s*\{",  # Function definition with body
+        r"#include\s+[<\"][^>\"]+\.c[>\"]",  # Including .c file
+    ]
+]
+
+# "filename.c:" or "Here's the fixed filename.c:"
+_FILE_SECTION_RE = re.compile(
+    r"(?:(?:here'?s?|the|modified|fixed|updated)\s+)?([a-z_][a-z0-9_]*\.(?:c|h|cpp))\s*:",
+    re.IGNORECASE,
+)
+
 
 def parse_c_code_blocks(response: str) -> Dict[str, str]:
     """Parse C code blocks from model response.
@@ -21,13 +78,11 @@ def parse_c_code_blocks(response: str) -> Dict[str, str]:
     """
     changes: Dict[str, str] = {}
 
-    # Pattern for fenced code blocks with optional filename
-    # Matches: ```c filename.c or ```c or ```
-    # Also handles cpp, h extensions
-    pattern = r"```(?:c(?:pp)?|h)?\s*(?:([^\n`]+\.(?:c|h|cpp)))?\n(.*?)```"
-    matches = re.findall(pattern, response, re.DOTALL | re.IGNORECASE)
+    # Responses without any fence (a common failure) skip the regex scan
+    if "```" not in response:
+        return changes
 
-    for filename, code in matches:
+    for filename, code in _CODE_BLOCK_RE.findall(response):
         filename = filename.strip() if filename else ""
         code = code.strip()
 
@@ -69,17 +124,17 @@ def _extract_filename_from_comments(code: str) -> str:
         line = line.strip()
 
         # Check C-style comment: /* filename.c */
-        match = re.search(r"/\*\s*(?:file:?\s*)?([^\s*/]+\.(?:c|h|cpp))\s*\*/", line, re.IGNORECASE)
+        match = _BLOCK_COMMENT_RE.search(line)
         if match:
             return match.group(1)
 
         # Check C++ style comment: // filename.c
-        match = re.search(r"//\s*(?:file:?\s*)?([^\s]+\.(?:c|h|cpp))", line, re.IGNORECASE)
+        match = _LINE_COMMENT_RE.search(line)
         if match:
             return match.group(1)
 
         # Check preprocessor style: /* -*- filename.c -*- */
-        match = re.search(r"([a-z_][a-z0-9_]*\.(?:c|h|cpp))", line, re.IGNORECASE)
+        match = _BARE_FILENAME_RE.search(line)
         if match:
             # Make sure it's in a comment context
             if "/*" in line or "//" in line:
@@ -98,23 +153,8 @@ def _infer_filename_from_content(code: str) -> str:
         Inferred filename or empty string
     """
     # Look for known Quake file patterns
-    patterns = [
-        # Function definitions that indicate specific files
-        (r"\bR_RecursiveWorldNode\s*\(", "r_bsp.c"),
-        (r"\bZ_Malloc\s*\(|Z_TagMalloc\s*\(", "zone.c"),
-        (r"\bCL_AdjustAngles\s*\(|CL_BaseMove\s*\(", "cl_input.c"),
-        (r"\bS_PaintChannelFrom\s*\(|SND_PaintChannelFrom\s*\(", "snd_mix.c"),
-        (r"\bMod_DecompressVis\s*\(", "model.c"),
-        (r"\bSV_LinkEdict\s*\(|SV_AreaEdicts\s*\(", "world.c"),
-        (r"\bR_BuildLightMap\s*\(|R_AddDynamicLights\s*\(", "r_light.c"),
-        (r"\bSkeleton_Init\s*\(|Skeleton_Blend\s*\(", "skeleton.c"),
-        (r"\bR_SetupAliasFrame\s*\(", "r_alias.c"),
-        (r"\bPortal_Create\s*\(|Portal_Cull\s*\(", "portal.c"),
-        (r"\bTerrain_Init\s*\(|Terrain_GetHeight\s*\(", "terrain.c"),
-    ]
-
-    for pattern, filename in patterns:
-        if re.search(pattern, code):
+    for pattern, filename in _CONTENT_FILENAME_PATTERNS:
+        if pattern.search(code):
             return filename
 
     return ""
@@ -129,23 +169,8 @@ def _looks_like_header(code: str) -> bool:
     Returns:
         True if code appears to be a header file
     """
-    # Header indicators
-    header_patterns = [
-        r"#ifndef\s+\w+_H",
-        r"#define\s+\w+_H",
-        r"#pragma\s+once",
-        r"typedef\s+struct\s+\w+\s*\{",
-        r"typedef\s+enum\s*\{",
-    ]
-
-    # Implementation indicators
-    impl_patterns = [
-        r"^\s*\w+\s+\w+\s*\([^)]*\)\s*\{",  # Function definition with body
-        r"#include\s+[<\"][^>\"]+\.c[>\"]",  # Including .c file
-    ]
-
-    header_score = sum(1 for p in header_patterns if re.search(p, code, re.MULTILINE))
-    impl_score = sum(1 for p in impl_patterns if re.search(p, code, re.MULTILINE))
+    header_score = sum(1 for p in _HEADER_RES if p.search(code))
+    impl_score = sum(1 for p in _IMPL_RES if p.search(code))
 
     return header_score > impl_score
 
@@ -164,11 +189,7 @@ def extract_file_sections(response: str) -> List[Tuple[str, str]]:
     """
     sections = []
 
-    # Pattern for "filename.c:" or "Here's the fixed filename.c:"
-    pattern = r"(?:(?:here'?s?|the|modified|fixed|updated)\s+)?([a-z_][a-z0-9_]*\.(?:c|h|cpp))\s*:"
-
-    matches = re.finditer(pattern, response, re.IGNORECASE)
-    for match in matches:
+    for match in _FILE_SECTION_RE.finditer(response):
         filename = match.group(1)
         # Get context around the match
         start = max(0, match.start() - 50)
@@ -11,6 +11,27 @@ from typing import Dict, List, Optional
 
 from harness.c_sandbox import CSandbox
 
+# Common GCC/Clang error patterns
+_COMPILE_ERROR_RES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"error:\s+(.+)",
+        r"undefined reference to\s+(.+)",
+        r"fatal error:\s+(.+)",
+        r"cannot find\s+-l(\w+)",
+        r"No rule to make target",
+    ]
+]
+
+# "Results: X/Y tests passed" (Quake test format)
+_RESULTS_RE = re.compile(r"Results:\s*(\d+)/(\d+)\s*tests?\s*passed", re.IGNORECASE)
+
+# "X passed, Y failed"
+_PASSED_FAILED_RE = re.compile(r"(\d+)\s+passed.*?(\d+)\s+failed", re.IGNORECASE)
+
+# Lines starting with PASS or FAIL, counted in one pass
+_PASS_FAIL_LINE_RE = re.compile(r"^\s*(PASS|FAIL)\b", re.MULTILINE | re.IGNORECASE)
+
 
 @dataclass
 class CTestResult:
@@ -116,7 +137,7 @@ class CTestRunner:
                 skipped=0,
                 total=0,
                 success=False,
-                output=f"Test timeout after {self.timeout}s\n{e.stdout or ''}\n{e.stderr or ''}",
+                output=f"Test timeout after {self.timeout}s\n{e.stdout or ''}",
                 elapsed_time=elapsed,
             )
 
@@ -147,9 +168,12 @@ class CTestRunner:
 
         cmd = ["make", "-C", str(tests_path), target]
 
+        # stderr is merged into stdout so compiler errors stay in order with
+        # the make output and no second buffer has to be concatenated
         return subprocess.run(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
             timeout=self.timeout + 30,  # Extra time for compilation
             env=env,
@@ -169,7 +193,7 @@ class CTestRunner:
         Returns:
             CTestResult with parsed outcomes
         """
-        output = result.stdout + result.stderr
+        output = result.stdout
 
         # Check for compilation errors
         compilation_error = self._check_compilation_error(output)
@@ -220,17 +244,8 @@ class CTestRunner:
         Returns:
             Error message if compilation failed, None otherwise
         """
-        # Common GCC/Clang error patterns
-        error_patterns = [
-            r"error:\s+(.+)",
-            r"undefined reference to\s+(.+)",
-            r"fatal error:\s+(.+)",
-            r"cannot find\s+-l(\w+)",
-            r"No rule to make target",
-        ]
-
-        for pattern in error_patterns:
-            match = re.search(pattern, output, re.IGNORECASE)
+        for pattern in _COMPILE_ERROR_RES:
+            match = pattern.search(output)
             if match:
                 return match.group(0)
 
@@ -255,7 +270,7 @@ class CTestRunner:
         total = 0
 
         # Format: "Results: X/Y tests passed" (Quake test format)
-        match = re.search(r"Results:\s*(\d+)/(\d+)\s*tests?\s*passed", output, re.IGNORECASE)
+        match = _RESULTS_RE.search(output)
         if match:
             passed = int(match.group(1))
             total = int(match.group(2))
@@ -263,7 +278,7 @@ class CTestRunner:
             return passed, failed, total
 
         # Format: "X passed, Y failed"
-        match = re.search(r"(\d+)\s+passed.*?(\d+)\s+failed", output, re.IGNORECASE)
+        match = _PASSED_FAILED_RE.search(output)
         if match:
             passed = int(match.group(1))
             failed = int(match.group(2))
@@ -271,8 +286,11 @@ class CTestRunner:
             return passed, failed, total
 
         # Format: Count PASS/FAIL lines
-        pass_count = len(re.findall(r"^\s*PASS\b", output, re.MULTILINE | re.IGNORECASE))
-        fail_count = len(re.findall(r"^\s*FAIL\b", output, re.MULTILINE | re.IGNORECASE))
+        line_counts = {"PASS": 0, "FAIL": 0}
+        for match in _PASS_FAIL_LINE_RE.finditer(output):
+            line_counts[match.group(1).upper()] += 1
+        pass_count = line_counts["PASS"]
+        fail_count = line_counts["FAIL"]
 
         if pass_count > 0 or fail_count > 0:
             passed = pass_count
@@ -2,6 +2,7 @@
 
 import os
 import random
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -344,8 +345,6 @@ class GameplayRunner:
         Returns:
             GameplayResult with session outcomes
         """
-        import time
-
         # Create game instance
         Game = getattr(self.game_module, "Game", None)
         if Game is None:
@@ -10,6 +10,10 @@ Maximum score: 5 points (4 base + 1 bonus)
 """
 
 import json
+import os
+import shutil
+import subprocess
+import tempfile
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -427,7 +431,6 @@ class JuliusEvaluator:
                 if model_patch.startswith("REVERSE:"):
                     # Apply buggy patch in reverse to fix the code
                     actual_patch = model_patch[8:]  # Remove "REVERSE:" prefix
-                    from harness.patch_utils import apply_patch
                     fix_result = apply_patch(actual_patch, sandbox.repo_dir, reverse=True)
                 else:
                     fix_result = sandbox.apply_model_fix(model_patch)
@@ -524,10 +527,6 @@ class JuliusEvaluator:
         Returns:
             JuliusEvaluationResult
         """
-        import os
-        import subprocess
-        import tempfile
-
         self.log(f"Running synthetic evaluation for {task_config.id}")
 
         # Extract synthetic source files from the buggy patch
@@ -592,7 +591,6 @@ class JuliusEvaluator:
                 temp_path = Path(temp_dir)
 
                 # Copy test files to temp directory
-                import shutil
                 for item in test_dir.iterdir():
                     if item.is_file():
                         shutil.copy2(item, temp_path / item.name)
@@ -7,6 +7,7 @@ This module handles running tests for Julius tasks, including:
 - Determining test pass/fail status
 """
 
+import os
 import re
 import shutil
 import subprocess
@@ -130,7 +131,6 @@ class JuliusTestRunner:
         shutil.copytree(test_dir, sandbox_tests)
 
         # Set up environment with Julius source path
-        import os
         env = os.environ.copy()
         if self.sandbox.repo_dir:
             env["JULIUS_SRC"] = str(self.sandbox.repo_dir / "src")
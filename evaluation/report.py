@@ -1,15 +1,259 @@
 """Results aggregation and report generation."""
 
 import json
+import os
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from html import escape
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 from jinja2 import Template
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "perf" extra
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+# Append-only results sink; one compact JSON result per line
+RESULTS_FILE = "results.jsonl"
+
+# Buffer size for result file reads; large results need far fewer syscalls
+_READ_BUFFER_SIZE = 128 * 1024
+
+# Result counts above which aggregation switches to NumPy arrays (and the
+# Numba kernel when available); below this array setup and JIT warm-up
+# cost more than they save
+_VECTORIZE_THRESHOLD = 5000
+
+# Shared fallback for results without metadata; never mutated.
+_EMPTY_META: dict[str, Any] = {}
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        obj: Object to serialize
+        pretty: Indent with two spaces instead of the compact form
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temp file and rename, so readers never see it partial."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def append_result(results_dir: Path, result: dict[str, Any]) -> Path:
+    """Append one evaluation result to the results directory's JSONL sink.
+
+    The line is written with a single O_APPEND write under an exclusive
+    lock, so concurrent evaluations can share one results file.
+
+    Args:
+        results_dir: Directory holding the results file
+        result: Result dictionary to record
+
+    Returns:
+        Path to the results file
+    """
+    path = Path(results_dir) / RESULTS_FILE
+    line = _dumps(result) + b"\n"
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+    return path
+
+
+def _parse_jsonl(lines: Iterable[bytes]) -> list[dict[str, Any]]:
+    """Parse JSON Lines, skipping blank and truncated lines."""
+    results = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            results.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return results
+
+
+def _bucket_stats(data: dict[str, Any]) -> dict[str, Any]:
+    """Turn raw category/tier counters into reported statistics."""
+    total = data["total"]
+    return {
+        "total": total,
+        "passed": data["passed"],
+        "pass_rate": data["passed"] / total if total > 0 else 0,
+        "avg_score": data["score_sum"] / total if total > 0 else 0,
+    }
+
+
+def _reduce_python(results: list[dict]) -> tuple[int, float, dict, dict]:
+    """Aggregate pass counts and score sums overall, by category and by tier.
+
+    Returns:
+        Tuple of (passed, score_sum, by_category, by_tier) where the
+        per-bucket dicts hold "total", "passed" and "score_sum" counters
+    """
+    passed = 0
+    score_sum = 0.0
+
+    # Single pass over results, aggregating by category and tier together
+    by_category: dict[str, dict[str, Any]] = {}
+    by_tier: dict[int, dict[str, Any]] = {}
+    for result in results:
+        success = bool(result.get("success", False))
+        score = result.get("score", 0.0)
+        if success:
+            passed += 1
+        score_sum += score
+
+        meta = result.get("metadata") or _EMPTY_META
+        category = meta.get("task_category", "unknown")
+        tier = meta.get("task_tier", 0)
+
+        cat_data = by_category.get(category)
+        if cat_data is None:
+            cat_data = by_category[category] = {"total": 0, "passed": 0, "score_sum": 0.0}
+        cat_data["total"] += 1
+        cat_data["passed"] += success
+        cat_data["score_sum"] += score
+
+        tier_data = by_tier.get(tier)
+        if tier_data is None:
+            tier_data = by_tier[tier] = {"total": 0, "passed": 0, "score_sum": 0.0}
+        tier_data["total"] += 1
+        tier_data["passed"] += success
+        tier_data["score_sum"] += score
+
+    return passed, score_sum, by_category, by_tier
+
+
+@lru_cache(maxsize=1)
+def _get_reduce_kernel() -> Callable | None:
+    """Compile the bucketed reduction kernel with Numba.
+
+    Returns:
+        Compiled kernel, or None if numba is not installed
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=False, nogil=True)
+    def kernel(scores, succ, cat_ids, tier_ids, num_categories, num_tiers):
+        cat_passed = np.zeros(num_categories, dtype=np.int64)
+        cat_total = np.zeros(num_categories, dtype=np.int64)
+        cat_sum = np.zeros(num_categories, dtype=np.float64)
+        tier_passed = np.zeros(num_tiers, dtype=np.int64)
+        tier_total = np.zeros(num_tiers, dtype=np.int64)
+        tier_sum = np.zeros(num_tiers, dtype=np.float64)
+        for i in range(scores.shape[0]):
+            c = cat_ids[i]
+            t = tier_ids[i]
+            cat_total[c] += 1
+            cat_passed[c] += succ[i]
+            cat_sum[c] += scores[i]
+            tier_total[t] += 1
+            tier_passed[t] += succ[i]
+            tier_sum[t] += scores[i]
+        return cat_passed, cat_total, cat_sum, tier_passed, tier_total, tier_sum
+
+    return kernel
+
+
+def _reduce_vectorized(results: list[dict]) -> tuple[int, float, dict, dict] | None:
+    """Aggregate like _reduce_python over NumPy arrays.
+
+    Numeric fields are extracted into parallel arrays and category/tier keys
+    are interned to integer ids in first-seen order. The buckets are reduced
+    by the Numba kernel when numba is installed, otherwise by np.bincount.
+
+    Returns:
+        Same tuple as _reduce_python, or None if numpy is unavailable
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    n = len(results)
+    metas = [r.get("metadata") or _EMPTY_META for r in results]
+    cat_index: dict[str, int] = {}
+    tier_index: dict[int, int] = {}
+    scores = np.fromiter((r.get("score", 0.0) for r in results), dtype=np.float64, count=n)
+    succ = np.fromiter(
+        (1 if r.get("success", False) else 0 for r in results), dtype=np.int64, count=n
+    )
+    cat_ids = np.fromiter(
+        (cat_index.setdefault(m.get("task_category", "unknown"), len(cat_index)) for m in metas),
+        dtype=np.intp,
+        count=n,
+    )
+    tier_ids = np.fromiter(
+        (tier_index.setdefault(m.get("task_tier", 0), len(tier_index)) for m in metas),
+        dtype=np.intp,
+        count=n,
+    )
+
+    num_categories = len(cat_index)
+    num_tiers = len(tier_index)
+    kernel = _get_reduce_kernel()
+    if kernel is not None:
+        cat_passed, cat_total, cat_sum, tier_passed, tier_total, tier_sum = kernel(
+            scores, succ, cat_ids, tier_ids, num_categories, num_tiers
+        )
+    else:
+        cat_total = np.bincount(cat_ids, minlength=num_categories)
+        cat_passed = np.bincount(cat_ids, weights=succ, minlength=num_categories)
+        cat_sum = np.bincount(cat_ids, weights=scores, minlength=num_categories)
+        tier_total = np.bincount(tier_ids, minlength=num_tiers)
+        tier_passed = np.bincount(tier_ids, weights=succ, minlength=num_tiers)
+        tier_sum = np.bincount(tier_ids, weights=scores, minlength=num_tiers)
+
+    by_category = {
+        cat: {
+            "total": int(cat_total[i]),
+            "passed": int(cat_passed[i]),
+            "score_sum": float(cat_sum[i]),
+        }
+        for cat, i in cat_index.items()
+    }
+    by_tier = {
+        tier: {
+            "total": int(tier_total[i]),
+            "passed": int(tier_passed[i]),
+            "score_sum": float(tier_sum[i]),
+        }
+        for tier, i in tier_index.items()
+    }
+    return int(succ.sum()), float(scores.sum()), by_category, by_tier
 
-@dataclass
+
+@dataclass(slots=True)
 class ModelScore:
     """Aggregate scores for a model."""
 
@@ -23,7 +267,7 @@ class ModelScore:
     by_tier: dict[int, dict[str, float]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkReport:
     """Complete benchmark run report."""
 
@@ -45,20 +289,52 @@ class ReportGenerator:
             results_dir: Directory containing result JSON files
         """
         self.results_dir = Path(results_dir)
+        self._results_signature: tuple | None = None
+        # (results signature, (results, sorted model scores)) of the last report
+        self._report_cache: tuple | None = None
+
+    def _scan_results(self) -> tuple[tuple[str, int, int], ...]:
+        """Fingerprint the result files in the results directory.
+
+        Returns:
+            Sorted (name, mtime_ns, size) tuples for every result file,
+            including the JSONL sink
+        """
+        if not self.results_dir.is_dir():
+            return ()
+        entries = []
+        with os.scandir(self.results_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(".") or not entry.is_file():
+                    continue
+                if not name.endswith(".json") and name != RESULTS_FILE:
+                    continue
+                stat = entry.stat()
+                entries.append((name, stat.st_mtime_ns, stat.st_size))
+        entries.sort()
+        return tuple(entries)
 
     def load_results(self) -> list[dict[str, Any]]:
-        """Load all result files from the results directory.
+        """Load all results from the results directory.
+
+        Reads the results.jsonl sink as well as per-task result JSON files
+        written by older runs.
 
         Returns:
             List of result dictionaries
         """
+        # Recorded so generate_report can tell when its cached report is stale
+        signature = self._results_signature = self._scan_results()
+
         results = []
-        for result_file in self.results_dir.glob("*.json"):
-            if result_file.name.startswith("."):
-                continue
+        for name, _, _ in signature:
             try:
-                with open(result_file) as f:
-                    results.append(json.load(f))
+                with open(self.results_dir / name, "rb", buffering=_READ_BUFFER_SIZE) as f:
+                    if name == RESULTS_FILE:
+                        results.extend(_parse_jsonl(f))
+                    else:
+                        results.append(json.loads(f.read()))
             except (json.JSONDecodeError, IOError):
                 continue
         return results
@@ -70,8 +346,16 @@ class ReportGenerator:
             results: List of result dictionaries
 
         Returns:
-            Dictionary mapping model names to their results
+            Dictionary mapping model names to their results. When every result
+            belongs to one model, the input list itself is returned as its
+            value rather than a copy.
         """
+        # Fast path: typical runs evaluate a single model
+        if results:
+            first = results[0].get("model_name", "unknown")
+            if all(r.get("model_name", "unknown") == first for r in results):
+                return {first: results}
+
         by_model: dict[str, list[dict]] = {}
         for result in results:
             model = result.get("model_name", "unknown")
@@ -91,51 +375,18 @@ class ReportGenerator:
             ModelScore with aggregated statistics
         """
         total = len(results)
-        passed = sum(1 for r in results if r.get("success", False))
+        reduced = None
+        if total > _VECTORIZE_THRESHOLD:
+            reduced = _reduce_vectorized(results)
+        if reduced is None:
+            reduced = _reduce_python(results)
+        passed, score_sum, by_category, by_tier = reduced
+
         failed = total - passed
+        avg_score = score_sum / total if total else 0.0
 
-        scores = [r.get("score", 0.0) for r in results]
-        avg_score = sum(scores) / len(scores) if scores else 0.0
-
-        # Aggregate by category
-        by_category: dict[str, dict[str, Any]] = {}
-        for result in results:
-            category = result.get("metadata", {}).get("task_category", "unknown")
-            if category not in by_category:
-                by_category[category] = {"total": 0, "passed": 0, "scores": []}
-            by_category[category]["total"] += 1
-            if result.get("success"):
-                by_category[category]["passed"] += 1
-            by_category[category]["scores"].append(result.get("score", 0.0))
-
-        category_stats = {}
-        for cat, data in by_category.items():
-            category_stats[cat] = {
-                "total": data["total"],
-                "passed": data["passed"],
-                "pass_rate": data["passed"] / data["total"] if data["total"] > 0 else 0,
-                "avg_score": sum(data["scores"]) / len(data["scores"]) if data["scores"] else 0,
-            }
-
-        # Aggregate by tier
-        by_tier: dict[int, dict[str, Any]] = {}
-        for result in results:
-            tier = result.get("metadata", {}).get("task_tier", 0)
-            if tier not in by_tier:
-                by_tier[tier] = {"total": 0, "passed": 0, "scores": []}
-            by_tier[tier]["total"] += 1
-            if result.get("success"):
-                by_tier[tier]["passed"] += 1
-            by_tier[tier]["scores"].append(result.get("score", 0.0))
-
-        tier_stats = {}
-        for tier, data in by_tier.items():
-            tier_stats[tier] = {
-                "total": data["total"],
-                "passed": data["passed"],
-                "pass_rate": data["passed"] / data["total"] if data["total"] > 0 else 0,
-                "avg_score": sum(data["scores"]) / len(data["scores"]) if data["scores"] else 0,
-            }
+        category_stats = {cat: _bucket_stats(data) for cat, data in by_category.items()}
+        tier_stats = {tier: _bucket_stats(data) for tier, data in by_tier.items()}
 
         return ModelScore(
             model_name=model_name,
@@ -157,22 +408,28 @@ class ReportGenerator:
         Returns:
             BenchmarkReport with all aggregated data
         """
-        results = self.load_results()
-        by_model = self.aggregate_by_model(results)
-
-        model_scores = [
-            self.calculate_model_score(model, model_results)
-            for model, model_results in by_model.items()
-        ]
-
-        # Sort by pass rate, then by average score
-        model_scores.sort(key=lambda x: (x.pass_rate, x.avg_score), reverse=True)
+        # Reuse the previous aggregation while the result files are unchanged
+        cache = self._report_cache
+        if cache is not None and cache[0] == self._scan_results():
+            results, model_scores = cache[1]
+        else:
+            results = self.load_results()
+            by_model = self.aggregate_by_model(results)
+
+            model_scores = [
+                self.calculate_model_score(model, model_results)
+                for model, model_results in by_model.items()
+            ]
+
+            # Sort by pass rate, then by average score
+            model_scores.sort(key=lambda x: (x.pass_rate, x.avg_score), reverse=True)
+            self._report_cache = (self._results_signature, (results, model_scores))
 
         return BenchmarkReport(
             run_id=run_id or datetime.now().strftime("%Y%m%d_%H%M%S"),
             timestamp=datetime.now().isoformat(),
             total_tasks=len(results),
-            models=model_scores,
+            models=list(model_scores),
             task_results=results,
             metadata={
                 "results_dir": str(self.results_dir),
@@ -180,13 +437,26 @@ class ReportGenerator:
             },
         )
 
-    def save_report(self, report: BenchmarkReport, output_path: Path) -> None:
+    def save_report(
+        self, report: BenchmarkReport, output_path: Path, pretty: bool = False
+    ) -> None:
         """Save report to JSON file.
 
+        The JSON report is meant for tooling and is written compactly by
+        default; the HTML report is the human-facing artifact.
+
+        Per-task results are streamed to a JSON Lines sidecar next to the
+        report (``<name>.tasks.jsonl``), referenced by ``tasks_file``, so they
+        are never serialized as one large in-memory array. Both files are
+        written to a temp file and renamed into place, so readers never see
+        a partial report.
+
         Args:
             report: Report to save
             output_path: Output file path
+            pretty: Indent the JSON for human reading
         """
+        output_path = Path(output_path)
         report_dict = {
             "run_id": report.run_id,
             "timestamp": report.timestamp,
@@ -195,20 +465,33 @@ class ReportGenerator:
             "metadata": report.metadata,
         }
 
-        with open(output_path, "w") as f:
-            json.dump(report_dict, f, indent=2)
+        if report.task_results:
+            tasks_path = output_path.with_suffix(".tasks.jsonl")
+            tmp_path = tasks_path.with_name(f"{tasks_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                for result in report.task_results:
+                    f.write(_dumps(result))
+                    f.write(b"\n")
+            os.replace(tmp_path, tasks_path)
+            report_dict["tasks_file"] = str(tasks_path)
+
+        _write_atomic(output_path, _dumps(report_dict, pretty=pretty))
 
-    def generate_html(self, report: BenchmarkReport) -> str:
+    def generate_html(self, report: BenchmarkReport, use_template: bool = False) -> str:
         """Generate HTML report.
 
         Args:
             report: Report to render
+            use_template: Render through the Jinja HTML_TEMPLATE instead of
+                the built-in string renderer
 
         Returns:
             HTML string
         """
-        template = Template(HTML_TEMPLATE)
-        return template.render(report=report)
+        if use_template:
+            template = Template(HTML_TEMPLATE, autoescape=True)
+            return template.render(report=report, rate_class=_rate_class)
+        return _render_html(report)
 
     def save_html(self, report: BenchmarkReport, output_path: Path) -> None:
         """Save HTML report.
@@ -217,18 +500,117 @@ class ReportGenerator:
             report: Report to render
             output_path: Output file path
         """
-        html = self.generate_html(report)
-        with open(output_path, "w") as f:
-            f.write(html)
+        _write_atomic(Path(output_path), self.generate_html(report).encode("utf-8"))
+
+
+def _rate_class(rate: float) -> str:
+    """CSS class for a pass rate: high (>= 80%), medium (>= 50%) or low."""
+    return "high" if rate >= 0.8 else "medium" if rate >= 0.5 else "low"
+
+
+def _render_html(report: BenchmarkReport) -> str:
+    """Render the HTML report with plain string building.
+
+    Produces the same content as HTML_TEMPLATE without going through Jinja:
+    names are escaped and numbers formatted the same way, only the
+    whitespace between tags differs.
+    """
+    run_id = escape(report.run_id)
+    parts = [
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n"
+        "    <meta charset=\"UTF-8\">\n"
+        "    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">\n",
+        f"    <title>Game Development Benchmark - {run_id}</title>\n",
+        _HTML_STYLE,
+        "</head>\n<body>\n    <div class=\"container\">\n"
+        "        <h1>Game Development Benchmark</h1>\n",
+        f"        <p class=\"subtitle\">Run ID: {run_id} | {escape(report.timestamp)}</p>\n",
+        _LEADERBOARD_HEAD,
+    ]
+    append = parts.append
+
+    for i, model in enumerate(report.models, 1):
+        rate = model.pass_rate
+        rate_class = _rate_class(rate)
+        append(
+            f"                    <tr>\n"
+            f"                        <td>{i}</td>\n"
+            f"                        <td>{escape(model.model_name)}</td>\n"
+            f"                        <td class=\"pass-rate {rate_class}\">{rate * 100:.1f}%</td>\n"
+            f"                        <td>{model.avg_score * 100:.2f}%</td>\n"
+            f"                        <td><span class=\"badge badge-success\">{model.passed}</span></td>\n"
+            f"                        <td><span class=\"badge badge-failure\">{model.failed}</span></td>\n"
+            f"                    </tr>\n"
+        )
+    append(_TABLE_TAIL)
 
+    for model in report.models:
+        append(
+            f"        <div class=\"card\">\n"
+            f"            <h2>{escape(model.model_name)} - By Category</h2>\n"
+        )
+        append(_CATEGORY_HEAD)
+        for cat, stats in model.by_category.items():
+            rate = stats["pass_rate"]
+            rate_class = _rate_class(rate)
+            append(
+                f"                    <tr>\n"
+                f"                        <td>{escape(str(cat))}</td>\n"
+                f"                        <td class=\"pass-rate {rate_class}\">{rate * 100:.1f}%</td>\n"
+                f"                        <td>{stats['avg_score'] * 100:.2f}%</td>\n"
+                f"                        <td>{stats['total']}</td>\n"
+                f"                    </tr>\n"
+            )
+        append(_TABLE_TAIL)
+
+    append(_HTML_FOOT)
+    return "".join(parts)
+
+
+_LEADERBOARD_HEAD = """
+        <div class="card">
+            <h2>Leaderboard</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Rank</th>
+                        <th>Model</th>
+                        <th>Pass Rate</th>
+                        <th>Avg Score</th>
+                        <th>Passed</th>
+                        <th>Failed</th>
+                    </tr>
+                </thead>
+                <tbody>
+"""
 
-HTML_TEMPLATE = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Game Development Benchmark - {{ report.run_id }}</title>
-    <style>
+_CATEGORY_HEAD = """            <table>
+                <thead>
+                    <tr>
+                        <th>Category</th>
+                        <th>Pass Rate</th>
+                        <th>Avg Score</th>
+                        <th>Total</th>
+                    </tr>
+                </thead>
+                <tbody>
+"""
+
+_TABLE_TAIL = """                </tbody>
+            </table>
+        </div>
+"""
+
+_HTML_FOOT = """
+        <footer style="text-align: center; color: #666; margin-top: 2rem;">
+            Generated by Game Development Benchmark
+        </footer>
+    </div>
+</body>
+</html>
+"""
+
+_HTML_STYLE = """    <style>
         :root {
             --bg-color: #1a1a2e;
             --card-bg: #16213e;
@@ -283,7 +665,15 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         .badge-success { background: rgba(74, 222, 128, 0.2); color: var(--success); }
         .badge-failure { background: rgba(248, 113, 113, 0.2); color: var(--failure); }
     </style>
-</head>
+"""
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Game Development Benchmark - {{ report.run_id }}</title>
+""" + _HTML_STYLE + """</head>
 <body>
     <div class="container">
         <h1>Game Development Benchmark</h1>
@@ -307,7 +697,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                     <tr>
                         <td>{{ loop.index }}</td>
                         <td>{{ model.model_name }}</td>
-                        <td class="pass-rate {% if model.pass_rate >= 0.8 %}high{% elif model.pass_rate >= 0.5 %}medium{% else %}low{% endif %}">
+                        <td class="pass-rate {{ rate_class(model.pass_rate) }}">
                             {{ "%.1f"|format(model.pass_rate * 100) }}%
                         </td>
                         <td>{{ "%.2f"|format(model.avg_score * 100) }}%</td>
@@ -335,7 +725,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                     {% for cat, stats in model.by_category.items() %}
                     <tr>
                         <td>{{ cat }}</td>
-                        <td class="pass-rate {% if stats.pass_rate >= 0.8 %}high{% elif stats.pass_rate >= 0.5 %}medium{% else %}low{% endif %}">
+                        <td class="pass-rate {{ rate_class(stats.pass_rate) }}">
                             {{ "%.1f"|format(stats.pass_rate * 100) }}%
                         </td>
                         <td>{{ "%.2f"|format(stats.avg_score * 100) }}%</td>
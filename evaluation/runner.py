@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 """Main evaluation harness for running benchmark tasks."""
 
+import codecs
 import json
+import os
 import re
 import shutil
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import click
 
@@ -15,13 +20,115 @@ from evaluation.test_runner import TestRunner, TestResult
 from evaluation.c_parser import parse_c_code_blocks
 from evaluation.c_test_runner import CTestRunner, convert_to_test_result
 from evaluation.julius_evaluator import JuliusEvaluator, JuliusEvaluationResult
-from harness.sandbox import Sandbox, SandboxConfig, SandboxResult
+from evaluation.report import append_result
+from harness.sandbox import Sandbox, SandboxConfig, SandboxPool, SandboxResult
 from harness.c_sandbox import CSandbox, CSandboxConfig
+from harness.fs_utils import link_tree
 from harness.julius_sandbox import JuliusSandboxConfig
 from models.base import ModelInterface, GenerationResult, create_model
+from models.cache import CACHE_MODES, DEFAULT_CACHE_DIR, CacheMode, CachedModel, ResponseCache
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "perf" extra
+    orjson = None
 
-@dataclass
+
+# Trees with more files than this are read on a thread pool
+_PARALLEL_READ_THRESHOLD = 8
+_READ_WORKERS = 16
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+# Bound UTF-8 decoder, looked up once instead of on every file read
+_UTF8_DECODE = codecs.getdecoder("utf-8")
+
+
+def _read_utf8(path: Path) -> str:
+    """Read a file as UTF-8, replacing undecodable bytes."""
+    return _UTF8_DECODE(path.read_bytes(), "replace")[0]
+
+
+# Test output kept in results; longer output is cut to its tail
+_OUTPUT_TAIL_CHARS = 4096
+
+# Directories never searched for context source files
+_SKIP_DIRS = frozenset(
+    {".git", "__pycache__", "build", ".cache", "node_modules", ".venv", "venv"}
+)
+
+# Filename hint in the first line of an untagged code block, e.g. "# File: main.py"
+_FILENAME_HINT_RE = re.compile(r"(?:file:?\s*)?(\w+\.py)", re.IGNORECASE)
+
+
+# Decoded source files by path with the (mtime_ns, size) they were read at.
+# Pooled sandboxes keep their paths across evaluations, so unchanged files
+# are served from here; the cache is dropped once it grows past the limit
+# since fresh sandboxes never repeat a path.
+_SOURCE_CACHE: dict[str, tuple[tuple[int, int], str]] = {}
+_SOURCE_CACHE_MAX_FILES = 4096
+
+
+def _read_source_file(path: Path) -> str:
+    """Read a source file, reusing cached contents while it is unchanged."""
+    key = str(path)
+    stat = os.stat(key)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    entry = _SOURCE_CACHE.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    text = _read_utf8(path)
+    if len(_SOURCE_CACHE) >= _SOURCE_CACHE_MAX_FILES:
+        _SOURCE_CACHE.clear()
+    _SOURCE_CACHE[key] = (stamp, text)
+    return text
+
+
+def _read_source_files(root: Path, paths: list[Path]) -> dict[str, str]:
+    """Read source files into a {relative path: contents} mapping.
+
+    Unchanged files are served from _SOURCE_CACHE, larger trees are read
+    on a thread pool so the file IO overlaps, and files with identical
+    contents share a single string. Bytes that are not valid UTF-8 become
+    U+FFFD rather than failing the read, so the model still sees that
+    something is there.
+
+    Args:
+        root: Directory the keys are relative to
+        paths: Files to read
+
+    Returns:
+        Dictionary mapping relative paths to file contents, in input order
+    """
+
+    def read(path: Path) -> tuple[str, str]:
+        return str(path.relative_to(root)), _read_source_file(path)
+
+    if len(paths) <= _PARALLEL_READ_THRESHOLD:
+        files = list(map(read, paths))
+    else:
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+            files = list(executor.map(read, paths))
+
+    # Identical files (common for headers) share one string object
+    bodies: dict[str, str] = {}
+    return {rel: bodies.setdefault(text, text) for rel, text in files}
+
+
+@dataclass(slots=True)
 class TaskConfig:
     """Configuration loaded from task.json."""
 
@@ -39,7 +146,57 @@ class TaskConfig:
     hints: list[str] = field(default_factory=list)
 
 
-@dataclass
+# Parsed task.json / prompt.md contents by resolved path, with the
+# (mtime_ns, size) they were read at. One entry per file, so editing a task
+# replaces its entry rather than adding another.
+_TASK_CACHE: dict[str, tuple[tuple[int, int], TaskConfig]] = {}
+_PROMPT_CACHE: dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def _parse_task(path: Path) -> TaskConfig:
+    """Parse a task.json file into a TaskConfig."""
+    data = _json_loads(path.read_bytes())
+    return TaskConfig(
+        id=data["id"],
+        name=data["name"],
+        category=data["category"],
+        tier=data["tier"],
+        engine=data["engine"],
+        description=data["description"],
+        evaluation=data["evaluation"],
+        tags=data.get("tags", []),
+        baseline=data.get("baseline"),
+        timeout=data.get("timeout", 60),
+        files_to_modify=data.get("files_to_modify", []),
+        hints=data.get("hints", []),
+    )
+
+
+def _load_cached(
+    cache: dict[str, tuple[tuple[int, int], Any]], path: Path, load: Callable[[Path], Any]
+) -> Any:
+    """Return load(path), reusing the cached value while the file is unchanged.
+
+    Args:
+        cache: Module-level cache to consult
+        path: File to load
+        load: Parser for the file
+
+    Returns:
+        Loaded value
+    """
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = str(path.resolve())
+    entry = cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    value = load(path)
+    cache[key] = (stamp, value)
+    return value
+
+
+@dataclass(slots=True)
 class EvaluationResult:
     """Result of evaluating a task."""
 
@@ -75,6 +232,12 @@ class EvaluationRunner:
         model: ModelInterface,
         sandbox_config: SandboxConfig | None = None,
         verbose: bool = False,
+        cache_mode: CacheMode = "disabled",
+        cache_dir: Path | None = None,
+        checkpoint_dir: Path | None = None,
+        resume: bool = False,
+        sandbox_pool: SandboxPool | None = None,
+        log_dir: Path | None = None,
     ):
         """Initialize the evaluation runner.
 
@@ -83,18 +246,153 @@ class EvaluationRunner:
             model: Model interface to use
             sandbox_config: Optional sandbox configuration
             verbose: Enable verbose output
+            cache_mode: Model response cache mode ("enabled", "replay",
+                "write-only" or "disabled")
+            cache_dir: Response cache directory (defaults to .eval_cache)
+            checkpoint_dir: Directory for per-task progress checkpoints
+                (no checkpoints are written if None)
+            resume: Resume from an existing checkpoint instead of starting over
+            sandbox_pool: Pool to reuse set-up sandboxes across runs of the
+                same task (a fresh sandbox per run if None)
+            log_dir: Directory for full test output logs; results keep only
+                the tail of long outputs
         """
         self.task_dir = Path(task_dir)
+        if cache_mode != "disabled":
+            model = CachedModel(model, ResponseCache(cache_dir or DEFAULT_CACHE_DIR, cache_mode))
         self.model = model
         self.sandbox_config = sandbox_config or SandboxConfig()
         self.verbose = verbose
         self.task_config: TaskConfig | None = None
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        self.resume = resume
+        self._checkpoint: dict[str, Any] = {}
+        self.sandbox_pool = sandbox_pool
+        self.log_dir = Path(log_dir) if log_dir else None
 
     def log(self, message: str) -> None:
         """Log a message if verbose mode is enabled."""
         if self.verbose:
             click.echo(message)
 
+    @contextmanager
+    def _open_sandbox(
+        self, sandbox_cls: type, config: Any, game_dir: Path
+    ) -> Iterator[Sandbox | CSandbox]:
+        """Set up a sandbox for game_dir, taking it from the pool if there is one.
+
+        Pooled sandboxes are returned to the pool afterwards; a sandbox whose
+        evaluation raised is discarded instead.
+        """
+        if self.sandbox_pool is None:
+            with sandbox_cls(config) as sandbox:
+                sandbox.setup(game_dir)
+                yield sandbox
+            return
+
+        sandbox = self.sandbox_pool.acquire(sandbox_cls, config, game_dir)
+        try:
+            yield sandbox
+        except BaseException:
+            sandbox.cleanup()
+            raise
+        self.sandbox_pool.release(sandbox, game_dir)
+
+    @property
+    def _run_name(self) -> str:
+        """File name stem identifying the current task and model."""
+        model = self.model.get_name().replace(":", "_").replace("/", "_")
+        return f"{self.task_config.id}_{model}"
+
+    @property
+    def _checkpoint_path(self) -> Path | None:
+        """Checkpoint file for the current task and model."""
+        if not self.checkpoint_dir or not self.task_config:
+            return None
+        return self.checkpoint_dir / f"{self._run_name}.ckpt.json"
+
+    def _output_tail(self, output: str) -> str:
+        """Trim test output to its tail, saving the full text to the log dir.
+
+        Test counts are parsed before this, and failures are summarized at
+        the end of the output, so the tail is what results need to keep.
+
+        Args:
+            output: Full test output
+
+        Returns:
+            Output unchanged if short, otherwise its last _OUTPUT_TAIL_CHARS
+            characters behind a truncation marker
+        """
+        if len(output) <= _OUTPUT_TAIL_CHARS:
+            return output
+        note = "truncated"
+        if self.log_dir and self.task_config:
+            log_path = self.log_dir / f"{self._run_name}.log"
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            log_path.write_text(output, encoding="utf-8", errors="replace")
+            note += f"; full output in {log_path}"
+        return f"... ({note})\n{output[-_OUTPUT_TAIL_CHARS:]}"
+
+    def _load_checkpoint(self) -> dict[str, Any]:
+        """Load the checkpoint for the current task when resuming.
+
+        Returns:
+            Checkpoint data, or an empty dict if there is nothing to resume
+        """
+        self._checkpoint = {}
+        path = self._checkpoint_path
+        if not self.resume or path is None or not path.exists():
+            return self._checkpoint
+        try:
+            self._checkpoint = _json_loads(path.read_bytes())
+        except (ValueError, OSError):
+            return self._checkpoint
+        self.log(f"Resuming from checkpoint ({self._checkpoint.get('stage')}): {path}")
+        return self._checkpoint
+
+    def _save_checkpoint(self, stage: str, **data: Any) -> None:
+        """Record progress after an expensive phase.
+
+        Args:
+            stage: Completed stage ("generated", "applied" or "evaluated")
+            **data: Stage outputs to store alongside earlier ones
+        """
+        path = self._checkpoint_path
+        if path is None:
+            return
+        self._checkpoint.update(data)
+        self._checkpoint.update(
+            task_id=self.task_config.id, model=self.model.get_name(), stage=stage
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(_json_dumps(self._checkpoint))
+        tmp_path.replace(path)
+
+    def _stored_eval_results(self) -> dict[str, Any] | None:
+        """Return checkpointed evaluation results when resuming a finished evaluation.
+
+        Returns:
+            Stored phase results, or None if the evaluation still has to run
+        """
+        if self._checkpoint.get("stage") != "evaluated":
+            return None
+        return self._checkpoint.get("eval_results")
+
+    def _generate(self, prompt: str, context: dict[str, Any]) -> GenerationResult:
+        """Invoke the model, reusing a checkpointed response when resuming."""
+        if "model_response" in self._checkpoint:
+            self.log("Reusing model response from checkpoint")
+            return GenerationResult(
+                content=self._checkpoint["model_response"], model=self.model.get_name()
+            )
+
+        self.log(f"Invoking model: {self.model.get_name()} (timeout: {self.model.config.timeout}s)")
+        model_result = self.model.generate(prompt, context)
+        self._save_checkpoint("generated", model_response=model_result.content)
+        return model_result
+
     def load_task(self) -> TaskConfig:
         """Load the task configuration.
 
@@ -109,24 +407,7 @@ class EvaluationRunner:
         if not task_json_path.exists():
             raise FileNotFoundError(f"task.json not found in {self.task_dir}")
 
-        with open(task_json_path) as f:
-            data = json.load(f)
-
-        self.task_config = TaskConfig(
-            id=data["id"],
-            name=data["name"],
-            category=data["category"],
-            tier=data["tier"],
-            engine=data["engine"],
-            description=data["description"],
-            evaluation=data["evaluation"],
-            tags=data.get("tags", []),
-            baseline=data.get("baseline"),
-            timeout=data.get("timeout", 60),
-            files_to_modify=data.get("files_to_modify", []),
-            hints=data.get("hints", []),
-        )
-
+        self.task_config = _load_cached(_TASK_CACHE, task_json_path, _parse_task)
         return self.task_config
 
     def load_prompt(self) -> str:
@@ -142,7 +423,7 @@ class EvaluationRunner:
         if not prompt_path.exists():
             raise FileNotFoundError(f"prompt.md not found in {self.task_dir}")
 
-        return prompt_path.read_text()
+        return _load_cached(_PROMPT_CACHE, prompt_path, _read_utf8)
 
     def build_context(self, sandbox: Sandbox | CSandbox) -> dict[str, Any]:
         """Build context for the model including file contents.
@@ -158,6 +439,28 @@ class EvaluationRunner:
         else:
             return self._build_python_context(sandbox)
 
+    def _add_game_files(
+        self, context: dict[str, Any], game_dir: Path, suffixes: tuple[str, ...]
+    ) -> None:
+        """Add game source files to a model context.
+
+        Every file with one of the suffixes is included, skipping VCS, cache
+        and build directories. Models only see what is in context["files"],
+        so files outside files_to_modify are still sent as context.
+
+        Args:
+            context: Context dictionary to populate
+            game_dir: Game directory in the sandbox
+            suffixes: Source file extensions, e.g. (".c", ".h")
+        """
+        paths: list[Path] = []
+        # One walk for all suffixes rather than an rglob per pattern,
+        # pruning VCS, cache and build output directories
+        for dirpath, dirnames, names in os.walk(game_dir):
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+            paths.extend(Path(dirpath) / name for name in names if name.endswith(suffixes))
+        context["files"] = _read_source_files(game_dir, paths)
+
     def _build_python_context(self, sandbox: Sandbox) -> dict[str, Any]:
         """Build context for Python/pygame tasks.
 
@@ -184,9 +487,7 @@ class EvaluationRunner:
         # Read game files from sandbox
         game_dir = sandbox.game_dir
         if game_dir and game_dir.exists():
-            for py_file in game_dir.rglob("*.py"):
-                rel_path = py_file.relative_to(game_dir)
-                context["files"][str(rel_path)] = py_file.read_text()
+            self._add_game_files(context, game_dir, (".py",))
 
         return context
 
@@ -220,13 +521,7 @@ class EvaluationRunner:
         # Read C/H files from sandbox
         game_dir = sandbox.game_dir
         if game_dir and game_dir.exists():
-            for ext in ["*.c", "*.h"]:
-                for src_file in game_dir.rglob(ext):
-                    rel_path = src_file.relative_to(game_dir)
-                    try:
-                        context["files"][str(rel_path)] = src_file.read_text()
-                    except UnicodeDecodeError:
-                        pass
+            self._add_game_files(context, game_dir, (".c", ".h"))
 
         return context
 
@@ -244,20 +539,43 @@ class EvaluationRunner:
         """
         changes: dict[str, str] = {}
 
-        # Pattern for fenced code blocks with optional filename
-        # Matches: ```python filename.py or ```python or ```
-        pattern = r"```(?:python)?\s*(?:([^\n`]+\.py))?\n(.*?)```"
-        matches = re.findall(pattern, response, re.DOTALL | re.IGNORECASE)
-
-        for filename, code in matches:
-            filename = filename.strip() if filename else ""
+        # Scan fence to fence with str.find so long responses with stray
+        # backticks stay linear. Blocks look like ```python filename.py,
+        # ```python, ```filename.py or bare ```; other languages are skipped.
+        pos = 0
+        while True:
+            start = response.find("```", pos)
+            if start < 0:
+                break
+            header_end = response.find("\n", start + 3)
+            if header_end < 0:
+                break
+            header = response[start + 3:header_end]
+            if "`" in header:
+                # Inline backticks, not an opening fence; step past any
+                # matching inline closer so it is not taken as an opener
+                inline_end = header.find("```")
+                pos = start + 3 + (inline_end + 3 if inline_end >= 0 else 0)
+                continue
+            end = response.find("```", header_end + 1)
+            if end < 0:
+                break
+            pos = end + 3
+
+            words = header.split()
+            if words and words[0].lower() == "python":
+                words = words[1:]
+            filename = " ".join(words)
+            if filename and not filename.lower().endswith(".py"):
+                continue
+            code = response[header_end + 1:end]
 
             # Try to extract filename from code comments
             if not filename:
                 first_line = code.strip().split("\n")[0] if code else ""
                 if first_line.startswith("#") and ".py" in first_line:
                     # Extract filename from comment like "# main.py" or "# File: main.py"
-                    match = re.search(r"(?:file:?\s*)?(\w+\.py)", first_line, re.IGNORECASE)
+                    match = _FILENAME_HINT_RE.search(first_line)
                     if match:
                         filename = match.group(1)
 
@@ -292,17 +610,16 @@ class EvaluationRunner:
         # Run unit/integration tests
         if "unit-test" in evaluation_methods or "integration-test" in evaluation_methods:
             self.log("Running tests...")
-            test_runner = TestRunner(sandbox)
+            test_runner = TestRunner(sandbox, collect_cases=False)
 
             # Copy test files to sandbox
             tests_dir = self.task_dir / "tests"
             if tests_dir.exists():
-                import shutil
                 sandbox_tests = sandbox.working_dir / "tests" if sandbox.working_dir else None
                 if sandbox_tests:
                     if sandbox_tests.exists():
                         shutil.rmtree(sandbox_tests)
-                    shutil.copytree(tests_dir, sandbox_tests)
+                    link_tree(tests_dir, sandbox_tests)
 
             test_result = test_runner.run()
             results["test"] = {
@@ -312,7 +629,7 @@ class EvaluationRunner:
                 "skipped": test_result.skipped,
                 "total": test_result.total,
                 "success": test_result.success,
-                "output": test_result.output,
+                "output": self._output_tail(test_result.output),
             }
 
         # Run gameplay evaluation
@@ -338,36 +655,34 @@ class EvaluationRunner:
         Returns:
             Score from 0.0 to 1.0
         """
-        scores = []
+        # Running sum/count of phase scores; test results always carry
+        # "passed" and "total" (see run_evaluation_phases)
+        score_sum = 0.0
+        count = 0
 
         # Test score
         test_results = eval_results.get("test")
         if test_results:
-            total = test_results.get("total", 0)
-            passed = test_results.get("passed", 0)
+            total = test_results["total"]
             if total > 0:
-                scores.append(passed / total)
+                score_sum += test_results["passed"] / total
+                count += 1
 
         # Gameplay score (placeholder)
         gameplay = eval_results.get("gameplay")
         if gameplay and gameplay.get("status") != "not_implemented":
             if gameplay.get("success"):
-                scores.append(1.0)
-            else:
-                scores.append(0.0)
+                score_sum += 1.0
+            count += 1
 
         # Performance score (placeholder)
         performance = eval_results.get("performance")
         if performance and performance.get("status") != "not_implemented":
             if performance.get("meets_target"):
-                scores.append(1.0)
-            else:
-                scores.append(0.0)
+                score_sum += 1.0
+            count += 1
 
-        if not scores:
-            return 0.0
-
-        return sum(scores) / len(scores)
+        return score_sum / count if count else 0.0
 
     def run(self) -> EvaluationResult:
         """Run the full evaluation pipeline.
@@ -424,12 +739,12 @@ class EvaluationRunner:
             EvaluationResult with all evaluation data
         """
         prompt = self.load_prompt()
+        self._load_checkpoint()
 
         # Set up sandbox
         self.log("Setting up Python sandbox...")
         game_dir = self.task_dir / "game"
-        with Sandbox(self.sandbox_config) as sandbox:
-            sandbox.setup(game_dir)
+        with self._open_sandbox(Sandbox, self.sandbox_config, game_dir) as sandbox:
 
             # Build context with file contents
             context = self.build_context(sandbox)
@@ -439,8 +754,7 @@ class EvaluationRunner:
                 self.model.config.timeout = task_config.timeout
 
             # Generate response from model
-            self.log(f"Invoking model: {self.model.get_name()} (timeout: {self.model.config.timeout}s)")
-            model_result = self.model.generate(prompt, context)
+            model_result = self._generate(prompt, context)
 
             # Parse code changes from response
             self.log("Parsing model response...")
@@ -455,9 +769,14 @@ class EvaluationRunner:
             # Apply changes to sandbox
             self.log(f"Applying {len(changes)} file changes...")
             sandbox.apply_changes(changes)
+            eval_results = self._stored_eval_results()
+            if eval_results is None:
+                self._save_checkpoint("applied", changes=changes)
 
             # Run evaluation phases
-            eval_results = self.run_evaluation_phases(sandbox)
+            if eval_results is None:
+                eval_results = self.run_evaluation_phases(sandbox)
+                self._save_checkpoint("evaluated", eval_results=eval_results)
 
             # Calculate score
             score = self.calculate_score(eval_results)
@@ -497,6 +816,7 @@ class EvaluationRunner:
             EvaluationResult with all evaluation data
         """
         prompt = self.load_prompt()
+        self._load_checkpoint()
 
         # Set up C sandbox with longer timeout for compilation
         c_config = CSandboxConfig(
@@ -509,8 +829,7 @@ class EvaluationRunner:
         self.log("Setting up C sandbox...")
         game_dir = self.task_dir / "game"
 
-        with CSandbox(c_config) as sandbox:
-            sandbox.setup(game_dir)
+        with self._open_sandbox(CSandbox, c_config, game_dir) as sandbox:
 
             # Build context with file contents
             context = self._build_c_context(sandbox)
@@ -520,8 +839,7 @@ class EvaluationRunner:
                 self.model.config.timeout = task_config.timeout
 
             # Generate response from model
-            self.log(f"Invoking model: {self.model.get_name()} (timeout: {self.model.config.timeout}s)")
-            model_result = self.model.generate(prompt, context)
+            model_result = self._generate(prompt, context)
 
             # Parse C code changes from response
             self.log("Parsing C code from response...")
@@ -536,6 +854,9 @@ class EvaluationRunner:
             # Apply changes to sandbox
             self.log(f"Applying {len(changes)} file changes...")
             sandbox.apply_changes(changes)
+            eval_results = self._stored_eval_results()
+            if eval_results is None:
+                self._save_checkpoint("applied", changes=changes)
 
             # Copy test files to sandbox
             tests_dir = self.task_dir / "tests"
@@ -543,10 +864,12 @@ class EvaluationRunner:
                 sandbox_tests = sandbox.working_dir / "tests"
                 if sandbox_tests.exists():
                     shutil.rmtree(sandbox_tests)
-                shutil.copytree(tests_dir, sandbox_tests)
+                link_tree(tests_dir, sandbox_tests)
 
             # Run C tests
-            eval_results = self._run_c_evaluation_phases(sandbox)
+            if eval_results is None:
+                eval_results = self._run_c_evaluation_phases(sandbox)
+                self._save_checkpoint("evaluated", eval_results=eval_results)
 
             # Calculate score
             score = self.calculate_score(eval_results)
@@ -625,7 +948,7 @@ class EvaluationRunner:
                 skipped=0,
                 total=julius_result.test_results.total,
                 success=julius_result.test_results.success,
-                output=julius_result.test_results.output,
+                output=self._output_tail(julius_result.test_results.output),
                 elapsed_time=julius_result.test_results.elapsed_time,
             )
 
@@ -689,7 +1012,7 @@ class EvaluationRunner:
                 "skipped": c_result.skipped,
                 "total": c_result.total,
                 "success": c_result.success,
-                "output": c_result.output,
+                "output": self._output_tail(c_result.output),
             }
 
             if c_result.compilation_error:
@@ -715,12 +1038,30 @@ class EvaluationRunner:
 @click.option("--output", "-o", type=click.Path(path_type=Path), help="Output directory for results")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option("--timeout", default=60, type=int, help="Execution timeout in seconds")
-def main(task: Path, model: str, output: Path | None, verbose: bool, timeout: int):
+@click.option("--cache-mode", type=click.Choice(CACHE_MODES), default="disabled",
+              help="Model response cache mode")
+@click.option("--cache-dir", type=click.Path(path_type=Path), default=DEFAULT_CACHE_DIR,
+              help="Model response cache directory")
+@click.option("--resume", is_flag=True,
+              help="Resume from the checkpoint in <output>/checkpoints (requires --output)")
+def main(
+    task: Path,
+    model: str,
+    output: Path | None,
+    verbose: bool,
+    timeout: int,
+    cache_mode: CacheMode,
+    cache_dir: Path,
+    resume: bool,
+):
     """Run evaluation on a single task.
 
     Example:
         python runner.py --task tasks/pygame/bug-fix/pong-001/ --model openai:gpt-4
     """
+    if resume and not output:
+        raise click.UsageError("--resume requires --output")
+
     # Create model
     model_interface = create_model(model)
 
@@ -738,6 +1079,11 @@ def main(task: Path, model: str, output: Path | None, verbose: bool, timeout: in
         model=model_interface,
         sandbox_config=sandbox_config,
         verbose=verbose,
+        cache_mode=cache_mode,
+        cache_dir=cache_dir,
+        checkpoint_dir=output / "checkpoints" if output else None,
+        log_dir=output / "logs" if output else None,
+        resume=resume,
     )
 
     # Run evaluation
@@ -771,7 +1117,6 @@ def main(task: Path, model: str, output: Path | None, verbose: bool, timeout: in
     # Save results if output specified
     if output:
         output.mkdir(parents=True, exist_ok=True)
-        result_file = output / f"{result.task_id}_{model.replace(':', '_')}.json"
 
         result_dict = {
             "task_id": result.task_id,
@@ -790,8 +1135,7 @@ def main(task: Path, model: str, output: Path | None, verbose: bool, timeout: in
                 "total": result.test_results.total,
             }
 
-        with open(result_file, "w") as f:
-            json.dump(result_dict, f, indent=2)
+        result_file = append_result(output, result_dict)
 
         click.echo(f"\nResults saved to: {result_file}")
 
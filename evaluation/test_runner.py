@@ -5,11 +5,110 @@ import os
 import re
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 from harness.sandbox import Sandbox
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "perf" extra
+    orjson = None
+
+# Combined pytest stdout/stderr, written to a file in the sandbox rather
+# than piped into memory
+_OUTPUT_LOG = ".pytest_out.log"
+
+# Only the end of the log is kept; failure details and the summary are there
+_OUTPUT_TAIL_BYTES = 64 * 1024
+
+# pytest is killed once its log grows past this (e.g. a test stuck printing)
+_MAX_OUTPUT_BYTES = 8 * 1024 * 1024
+
+# How often the log size is checked while pytest runs
+_OUTPUT_CHECK_INTERVAL = 0.5
+
+# Run game tests headless
+_TEST_ENV_OVERRIDES = MappingProxyType({"SDL_VIDEODRIVER": "dummy", "SDL_AUDIODRIVER": "dummy"})
+
+# pytest's final summary line, e.g. "==== 2 failed, 3 passed in 0.52s ===="
+# (the "=" rule is absent under -q)
+_SUMMARY_RE = re.compile(r"^=*\s*(.+?) in [\d.]+s\b")
+
+# The summary is among the last lines; stderr may follow it
+_SUMMARY_SCAN_LINES = 200
+
+# Summary outcome words and the TestResult counters they feed
+_SUMMARY_KINDS = {
+    "passed": "passed",
+    "failed": "failed",
+    "error": "errors",
+    "errors": "errors",
+    "skipped": "skipped",
+}
+
+
+def _read_tail(path: Path, limit: int = _OUTPUT_TAIL_BYTES) -> str:
+    """Read up to the last `limit` bytes of a file as text.
+
+    Args:
+        path: File to read
+        limit: Maximum number of bytes to read
+
+    Returns:
+        Decoded tail of the file, or "" if it cannot be read
+    """
+    try:
+        with open(path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - limit))
+            data = f.read()
+    except OSError:
+        return ""
+    return data.decode("utf-8", "replace")
+
+
+def _run_logged(
+    cmd: list[str], cwd: Path, env: dict[str, str], out_path: Path, timeout: float
+) -> tuple[int, bool]:
+    """Run a command with its output going to a log file, bounding its size.
+
+    Args:
+        cmd: Command to run
+        cwd: Working directory
+        env: Environment variables
+        out_path: Log file for combined stdout/stderr
+        timeout: Seconds before the process is killed
+
+    Returns:
+        Tuple of (return code, whether the process was killed for exceeding
+        _MAX_OUTPUT_BYTES)
+
+    Raises:
+        subprocess.TimeoutExpired: If the process ran past the timeout
+    """
+    deadline = time.monotonic() + timeout
+    with open(out_path, "wb") as out:
+        proc = subprocess.Popen(cmd, cwd=str(cwd), env=env, stdout=out, stderr=subprocess.STDOUT)
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                try:
+                    return proc.wait(timeout=min(remaining, _OUTPUT_CHECK_INTERVAL)), False
+                except subprocess.TimeoutExpired:
+                    pass
+                if os.fstat(out.fileno()).st_size > _MAX_OUTPUT_BYTES:
+                    proc.kill()
+                    return proc.wait(), True
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
 
 @dataclass
 class TestResult:
@@ -41,6 +140,7 @@ class TestRunner:
         sandbox: Sandbox,
         timeout: int = 60,
         python_executable: str | None = None,
+        collect_cases: bool = False,
     ):
         """Initialize the test runner.
 
@@ -48,10 +148,33 @@ class TestRunner:
             sandbox: Sandbox containing the game and test files
             timeout: Maximum test execution time in seconds
             python_executable: Python executable to use
+            collect_cases: Record per-test outcomes in TestResult.test_cases
+                (otherwise only the counts are collected)
         """
         self.sandbox = sandbox
         self.timeout = timeout
         self.python_executable = python_executable or sys.executable
+        self.collect_cases = collect_cases
+        # Snapshot of os.environ taken on first use
+        self._base_env: dict[str, str] | None = None
+
+    def _build_env(self) -> dict[str, str]:
+        """Build the pytest environment: headless SDL, game dir on PYTHONPATH.
+
+        Returns:
+            Environment for the pytest subprocess
+        """
+        if self._base_env is None:
+            self._base_env = os.environ.copy()
+        env = self._base_env.copy()
+        env.update(_TEST_ENV_OVERRIDES)
+
+        # Add game directory to Python path
+        game_dir = self.sandbox.game_dir
+        if game_dir:
+            python_path = env.get("PYTHONPATH", "")
+            env["PYTHONPATH"] = f"{game_dir}:{python_path}" if python_path else str(game_dir)
+        return env
 
     def run(self, test_path: str | None = None) -> TestResult:
         """Run tests in the sandbox.
@@ -90,16 +213,7 @@ class TestRunner:
                 output=f"Test directory not found: {tests_dir}",
             )
 
-        # Set up environment
-        env = os.environ.copy()
-        env["SDL_VIDEODRIVER"] = "dummy"
-        env["SDL_AUDIODRIVER"] = "dummy"
-
-        # Add game directory to Python path
-        game_dir = self.sandbox.game_dir
-        if game_dir:
-            python_path = env.get("PYTHONPATH", "")
-            env["PYTHONPATH"] = f"{game_dir}:{python_path}" if python_path else str(game_dir)
+        env = self._build_env()
 
         # Build pytest command
         cmd = [
@@ -112,25 +226,36 @@ class TestRunner:
             "--json-report",
             "--json-report-file=.pytest_results.json",
         ]
+        if self.collect_cases:
+            # Only per-test outcomes are read back; tracebacks and captured
+            # streams are already in the output log
+            cmd += [
+                "--json-report-omit",
+                "collectors", "log", "traceback", "streams", "warnings", "keywords",
+            ]
+        else:
+            cmd.append("--json-report-summary")
 
-        import time
         start_time = time.time()
 
+        # A pooled sandbox may hold the previous run's report
+        (self.sandbox.working_dir / ".pytest_results.json").unlink(missing_ok=True)
+
+        out_path = self.sandbox.working_dir / _OUTPUT_LOG
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=str(self.sandbox.working_dir),
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout + 30,
+            return_code, overflowed = _run_logged(
+                cmd, self.sandbox.working_dir, env, out_path, timeout=self.timeout + 30
             )
             elapsed = time.time() - start_time
 
+            output = _read_tail(out_path)
+            if overflowed:
+                output = f"Test output exceeded {_MAX_OUTPUT_BYTES} bytes; pytest was killed\n{output}"
+
             # Parse results
-            return self._parse_results(result, elapsed)
+            return self._parse_results(return_code, output, elapsed)
 
-        except subprocess.TimeoutExpired as e:
+        except subprocess.TimeoutExpired:
             elapsed = time.time() - start_time
             return TestResult(
                 passed=0,
@@ -139,7 +264,7 @@ class TestRunner:
                 skipped=0,
                 total=0,
                 success=False,
-                output=f"Test timeout after {self.timeout}s\n{e.stdout or ''}\n{e.stderr or ''}",
+                output=f"Test timeout after {self.timeout}s\n{_read_tail(out_path)}",
                 elapsed_time=elapsed,
             )
 
@@ -156,26 +281,25 @@ class TestRunner:
                 elapsed_time=elapsed,
             )
 
-    def _parse_results(self, result: subprocess.CompletedProcess, elapsed: float) -> TestResult:
+    def _parse_results(self, return_code: int, output: str, elapsed: float) -> TestResult:
         """Parse pytest output to extract test results.
 
         Args:
-            result: Subprocess result from pytest
+            return_code: pytest exit code
+            output: Tail of pytest's combined stdout/stderr
             elapsed: Elapsed time
 
         Returns:
             TestResult with parsed outcomes
         """
-        output = result.stdout + result.stderr
-
         # Try to load JSON report if available
         json_report_path = self.sandbox.working_dir / ".pytest_results.json" if self.sandbox.working_dir else None
         test_cases = None
 
         if json_report_path and json_report_path.exists():
             try:
-                with open(json_report_path) as f:
-                    report = json.load(f)
+                data = json_report_path.read_bytes()
+                report = orjson.loads(data) if orjson is not None else json.loads(data)
 
                 summary = report.get("summary", {})
                 passed = summary.get("passed", 0)
@@ -185,15 +309,15 @@ class TestRunner:
                 total = summary.get("total", passed + failed + errors + skipped)
 
                 # Extract individual test cases
-                tests = report.get("tests", [])
-                test_cases = [
-                    {
-                        "name": t.get("nodeid", ""),
-                        "outcome": t.get("outcome", ""),
-                        "duration": t.get("duration", 0),
-                    }
-                    for t in tests
-                ]
+                if self.collect_cases:
+                    test_cases = [
+                        {
+                            "name": t.get("nodeid", ""),
+                            "outcome": t.get("outcome", ""),
+                            "duration": t.get("duration", 0),
+                        }
+                        for t in report.get("tests", [])
+                    ]
 
                 return TestResult(
                     passed=passed,
@@ -201,7 +325,7 @@ class TestRunner:
                     errors=errors,
                     skipped=skipped,
                     total=total,
-                    success=result.returncode == 0,
+                    success=return_code == 0,
                     output=output,
                     elapsed_time=elapsed,
                     test_cases=test_cases,
@@ -211,7 +335,7 @@ class TestRunner:
                 pass
 
         # Fallback: parse pytest output
-        return self._parse_pytest_output(output, result.returncode, elapsed)
+        return self._parse_pytest_output(output, return_code, elapsed)
 
     def _parse_pytest_output(self, output: str, return_code: int, elapsed: float) -> TestResult:
         """Parse pytest text output as fallback.
@@ -224,32 +348,31 @@ class TestRunner:
         Returns:
             TestResult with parsed outcomes
         """
-        passed = 0
-        failed = 0
-        errors = 0
-        skipped = 0
-
-        # Look for summary line like "1 passed, 2 failed, 1 error in 0.5s"
-        summary_pattern = r"(\d+)\s+passed|(\d+)\s+failed|(\d+)\s+error|(\d+)\s+skipped"
-        matches = re.findall(summary_pattern, output)
-
-        for match in matches:
-            if match[0]:
-                passed = int(match[0])
-            if match[1]:
-                failed = int(match[1])
-            if match[2]:
-                errors = int(match[2])
-            if match[3]:
-                skipped = int(match[3])
-
-        # Alternative: count PASSED/FAILED in verbose output
-        if passed == 0 and failed == 0:
-            passed = output.count(" PASSED")
-            failed = output.count(" FAILED")
-            errors = output.count(" ERROR")
-            skipped = output.count(" SKIPPED")
-
+        counts = dict.fromkeys(("passed", "failed", "errors", "skipped"), 0)
+
+        # Find the summary line like "=== 1 passed, 2 failed, 1 error in 0.5s ==="
+        # scanning back from the end; if pytest died before printing it the
+        # counts stay zero
+        for line in reversed(output.rsplit("\n", _SUMMARY_SCAN_LINES)):
+            match = _SUMMARY_RE.match(line)
+            if not match:
+                continue
+            found = False
+            for token in match.group(1).split(","):
+                parts = token.split()
+                if len(parts) < 2 or not parts[0].isdigit():
+                    continue
+                key = _SUMMARY_KINDS.get(parts[1])
+                if key:
+                    counts[key] = int(parts[0])
+                    found = True
+            if found:
+                break
+
+        passed = counts["passed"]
+        failed = counts["failed"]
+        errors = counts["errors"]
+        skipped = counts["skipped"]
         total = passed + failed + errors + skipped
 
         return TestResult(
@@ -283,14 +406,7 @@ class TestRunner:
                 output="Sandbox not initialized",
             )
 
-        env = os.environ.copy()
-        env["SDL_VIDEODRIVER"] = "dummy"
-        env["SDL_AUDIODRIVER"] = "dummy"
-
-        game_dir = self.sandbox.game_dir
-        if game_dir:
-            python_path = env.get("PYTHONPATH", "")
-            env["PYTHONPATH"] = f"{game_dir}:{python_path}" if python_path else str(game_dir)
+        env = self._build_env()
 
         cmd = [
             self.python_executable,
@@ -300,7 +416,6 @@ class TestRunner:
             f"--timeout={self.timeout}",
         ] + test_ids
 
-        import time
         start_time = time.time()
 
         try:
@@ -308,12 +423,13 @@ class TestRunner:
                 cmd,
                 cwd=str(self.sandbox.working_dir),
                 env=env,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
                 timeout=self.timeout + 30,
             )
             elapsed = time.time() - start_time
-            return self._parse_pytest_output(result.stdout + result.stderr, result.returncode, elapsed)
+            return self._parse_pytest_output(result.stdout, result.returncode, elapsed)
 
         except subprocess.TimeoutExpired:
             elapsed = time.time() - start_time
@@ -2,14 +2,108 @@
 
 import os
 import shutil
+import signal
 import subprocess
+import sys
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from harness.fs_utils import link_tree
 
-@dataclass
+# Keep inherited FDs so the child does not have to close every descriptor
+# before exec; nothing sensitive is open when the sandbox spawns gcc, make
+# or a test program, and stdin is never inherited. Each command runs in
+# its own session so a timeout can kill the whole process tree (cc1, ld,
+# test binaries started by make), not just the direct child.
+_SPAWN_KWARGS: Dict[str, Any] = {"stdin": subprocess.DEVNULL}
+if sys.platform != "win32":
+    _SPAWN_KWARGS["close_fds"] = False
+    _SPAWN_KWARGS["start_new_session"] = True
+
+
+@cache
+def _resolve(program: str) -> str:
+    """Resolve a program on PATH once, so each exec skips the PATH search."""
+    return shutil.which(program) or program
+
+
+def _decode(data: Optional[bytes]) -> str:
+    """Decode captured output (None when nothing was captured)."""
+    return data.decode("utf-8", errors="replace") if data else ""
+
+
+def _kill_tree(proc: subprocess.Popen) -> None:
+    """Kill a process started by _run together with everything it spawned."""
+    if sys.platform == "win32":
+        proc.kill()
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _run(cmd: List[str], timeout: float, **kwargs: Any) -> subprocess.CompletedProcess:
+    """Run a command, capturing output as bytes and decoding it once.
+
+    Decoding with a fixed codec uses CPython's fast UTF-8 path instead of
+    the locale-dependent text-mode wrappers, and compiler output that is
+    not valid UTF-8 cannot raise.
+
+    Args:
+        cmd: Command and arguments
+        timeout: Timeout in seconds; the whole process group is killed
+        **kwargs: Extra arguments for subprocess.Popen (cwd, env)
+
+    Returns:
+        CompletedProcess with str stdout and stderr
+
+    Raises:
+        subprocess.TimeoutExpired: With the output captured before the kill
+
+    The process group is also killed when anything else (e.g.
+    KeyboardInterrupt) interrupts the wait.
+    """
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **_SPAWN_KWARGS, **kwargs
+    ) as proc:
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_tree(proc)
+            stdout, stderr = proc.communicate()
+            raise subprocess.TimeoutExpired(cmd, timeout, stdout, stderr) from None
+        except BaseException:
+            # The child is in its own session, so Ctrl-C never reaches it;
+            # without this, Popen.__exit__ would wait on it forever
+            _kill_tree(proc)
+            raise
+    return subprocess.CompletedProcess(cmd, proc.returncode, _decode(stdout), _decode(stderr))
+
+
+# Files tracked for get_changes()
+_SOURCE_SUFFIXES = (".c", ".h", ".cpp")
+
+
+def _read_source(path: str) -> Optional[str]:
+    """Read a source file as UTF-8, or return None for a binary file.
+
+    Binary files are recognised by a NUL byte near the start rather than by
+    a failed decode; stray invalid bytes in a text file are replaced.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if b"\0" in data[:512]:
+        return None
+    return data.decode("utf-8", errors="replace")
+
+
+@dataclass(slots=True)
 class CSandboxConfig:
     """Configuration for the C sandbox environment."""
 
@@ -18,9 +112,13 @@ class CSandboxConfig:
     compiler_flags: List[str] = field(default_factory=lambda: ["-Wall", "-Wextra", "-O2", "-std=c99"])
     linker_flags: List[str] = field(default_factory=lambda: ["-lm"])
     extra_env: Dict[str, str] = field(default_factory=dict)
+    use_ccache: bool = True
+    # Parent for sandbox directories, e.g. /dev/shm to build on tmpfs
+    # (defaults to the system temp directory)
+    temp_root: Optional[Path] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompilationResult:
     """Result of compiling C code."""
 
@@ -33,7 +131,7 @@ class CompilationResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of running compiled C code."""
 
@@ -62,8 +160,16 @@ class CSandbox:
             config: Sandbox configuration (uses defaults if None)
         """
         self.config = config or CSandboxConfig()
+        self._ccache = shutil.which("ccache") if self.config.use_ccache else None
         self._temp_dir: Optional[Path] = None
+        self._source_dir: Optional[Path] = None
         self._original_files: Dict[str, str] = {}
+        self._applied_files: set[str] = set()
+        # Contents by path with the (mtime_ns, size) they were read at;
+        # None marks a binary file
+        self._file_cache: Dict[str, Tuple[Tuple[int, int], Optional[str]]] = {}
+        # Subprocess environment, with the config and sandbox it was built for
+        self._env_cache: Optional[Tuple[CSandboxConfig, Optional[Path], Dict[str, str]]] = None
 
     def setup(self, source_dir: Path) -> Path:
         """Set up the sandbox with code from source directory.
@@ -75,11 +181,14 @@ class CSandbox:
             Path to the sandbox working directory
         """
         # Create temporary directory
-        self._temp_dir = Path(tempfile.mkdtemp(prefix="gdb_c_sandbox_"))
+        self._temp_dir = Path(tempfile.mkdtemp(prefix="gdb_c_sandbox_", dir=self.config.temp_root))
+
+        self._source_dir = Path(source_dir)
+        self._applied_files.clear()
 
-        # Copy source files to sandbox
+        # Mirror source files into the sandbox
         if source_dir.exists():
-            shutil.copytree(source_dir, self._temp_dir / "game", dirs_exist_ok=True)
+            link_tree(Path(source_dir), self._temp_dir / "game")
 
         # Store original file contents for comparison
         self._original_files = self._read_all_files(self._temp_dir / "game")
@@ -89,6 +198,9 @@ class CSandbox:
     def _read_all_files(self, directory: Path) -> Dict[str, str]:
         """Read all C source and header files in a directory.
 
+        Files whose mtime and size match the previous read are not read
+        again.
+
         Args:
             directory: Directory to read from
 
@@ -96,20 +208,33 @@ class CSandbox:
             Dictionary mapping filenames to contents
         """
         files = {}
-        if directory.exists():
-            for ext in ["*.c", "*.h", "*.cpp"]:
-                for src_file in directory.rglob(ext):
-                    rel_path = src_file.relative_to(directory)
-                    try:
-                        files[str(rel_path)] = src_file.read_text()
-                    except UnicodeDecodeError:
-                        # Skip binary files
-                        pass
+        cache: Dict[str, Tuple[Tuple[int, int], Optional[str]]] = {}
+        # One walk for all extensions rather than an rglob per pattern
+        for root, _, names in os.walk(directory):
+            for name in names:
+                if not name.endswith(_SOURCE_SUFFIXES):
+                    continue
+                key = os.path.join(root, name)
+                st = os.stat(key)
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = self._file_cache.get(key)
+                if cached is not None and cached[0] == stamp:
+                    content = cached[1]
+                else:
+                    content = _read_source(key)
+                cache[key] = (stamp, content)
+                if content is not None:
+                    files[os.path.relpath(key, directory)] = content
+        # Keep only what this pass saw so deleted files do not linger
+        self._file_cache = cache
         return files
 
     def apply_changes(self, changes: Dict[str, str]) -> None:
         """Apply code changes to the sandbox.
 
+        Files still in their setup() state whose new content is identical
+        are left alone, so their mtime does not trigger a rebuild.
+
         Args:
             changes: Dictionary mapping filenames to new contents
         """
@@ -117,10 +242,53 @@ class CSandbox:
             raise RuntimeError("Sandbox not set up. Call setup() first.")
 
         game_dir = self._temp_dir / "game"
-        for filename, content in changes.items():
-            file_path = game_dir / filename
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content)
+        writes = {
+            filename: content
+            for filename, content in changes.items()
+            if filename in self._applied_files or self._original_files.get(filename) != content
+        }
+        # Create each missing parent directory once, not once per file
+        for parent in {os.path.dirname(filename) for filename in writes} - {""}:
+            (game_dir / parent).mkdir(parents=True, exist_ok=True)
+
+        for filename, content in writes.items():
+            path = os.path.join(game_dir, filename)
+            # Replace rather than truncate so a hard link back to the
+            # source directory is never written through
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                data = memoryview(content.encode("utf-8"))
+                while data:
+                    data = data[os.write(fd, data) :]
+            finally:
+                os.close(fd)
+            self._applied_files.add(filename)
+
+    def reset(self) -> None:
+        """Revert files written by apply_changes to their setup() state.
+
+        Lets a set-up sandbox be reused for another evaluation of the same
+        source directory without copying the whole tree again. Restored
+        files get a fresh mtime so incremental builds pick them up; other
+        files (including build outputs) are left in place.
+        """
+        if not self._temp_dir or not self._source_dir:
+            raise RuntimeError("Sandbox not set up. Call setup() first.")
+
+        game_dir = self._temp_dir / "game"
+        for filename in self._applied_files:
+            source = self._source_dir / filename
+            target = game_dir / filename
+            if source.is_file():
+                target.unlink(missing_ok=True)
+                shutil.copyfile(source, target)
+            elif target.exists():
+                target.unlink()
+        self._applied_files.clear()
 
     def get_changes(self) -> Dict[str, str]:
         """Get the differences between original and current files.
@@ -135,9 +303,12 @@ class CSandbox:
         current_files = self._read_all_files(self._temp_dir / "game")
         changes = {}
 
+        # Unchanged files come back from the stat cache as the very string
+        # objects stored in _original_files, so comparing them is an
+        # identity check; only rewritten files are compared by content.
         for filename, content in current_files.items():
             original = self._original_files.get(filename)
-            if original != content:
+            if original is not content and original != content:
                 changes[filename] = content
 
         return changes
@@ -147,6 +318,7 @@ class CSandbox:
         source_files: Optional[List[str]] = None,
         output_name: str = "test_program",
         extra_flags: Optional[List[str]] = None,
+        syntax_only: bool = False,
     ) -> CompilationResult:
         """Compile C source files in the sandbox.
 
@@ -155,6 +327,8 @@ class CSandbox:
                          If None, compiles all .c files
             output_name: Name for the output executable
             extra_flags: Additional compiler flags
+            syntax_only: Only check the sources for errors (-fsyntax-only);
+                         no code is generated and nothing is linked
 
         Returns:
             CompilationResult with compilation outcome
@@ -182,27 +356,33 @@ class CSandbox:
             )
 
         # Build compilation command
-        cmd = [self.config.compiler]
+        # -pipe streams between gcc's stages instead of round-tripping
+        # through temporary files
+        cmd = [_resolve(self.config.compiler), "-pipe"]
+        if self._ccache and not syntax_only:
+            cmd.insert(0, self._ccache)
+        env = self._env()
         cmd.extend(self.config.compiler_flags)
         if extra_flags:
             cmd.extend(extra_flags)
         cmd.extend(["-I", str(game_dir)])  # Include game dir for headers
-        cmd.extend([str(s) for s in sources])
-        cmd.extend(["-o", str(output_path)])
-        cmd.extend(self.config.linker_flags)
 
-        import time
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=str(game_dir),
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout,
-            )
-            elapsed = time.time() - start_time
+            if syntax_only:
+                cmd.append("-fsyntax-only")
+                cmd.extend([str(s) for s in sources])
+                result = self._run_compiler(cmd, env)
+                output_path = None
+            elif len(sources) > 1 or self._ccache:
+                result = self._compile_and_link(cmd, sources, output_path, env)
+            else:
+                cmd.extend([str(s) for s in sources])
+                cmd.extend(["-o", str(output_path)])
+                cmd.extend(self.config.linker_flags)
+                result = self._run_compiler(cmd, env)
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
 
             return CompilationResult(
                 success=result.returncode == 0,
@@ -214,18 +394,18 @@ class CSandbox:
             )
 
         except subprocess.TimeoutExpired as e:
-            elapsed = time.time() - start_time
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
             return CompilationResult(
                 success=False,
-                stdout=e.stdout or "" if hasattr(e, "stdout") else "",
-                stderr=e.stderr or "" if hasattr(e, "stderr") else "",
+                stdout=_decode(e.stdout),
+                stderr=_decode(e.stderr),
                 return_code=-1,
                 elapsed_time=elapsed,
                 error=f"Compilation timeout after {self.config.timeout}s",
             )
 
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
             return CompilationResult(
                 success=False,
                 stdout="",
@@ -235,6 +415,84 @@ class CSandbox:
                 error=str(e),
             )
 
+    def _env(self) -> Dict[str, str]:
+        """Get the environment for sandbox subprocesses.
+
+        Built once and reused until the config or sandbox directory changes
+        (SandboxPool swaps configs on reuse), instead of copying os.environ
+        on every call. Callers must not modify the returned dict.
+        """
+        cached = self._env_cache
+        if cached is not None and cached[0] is self.config and cached[1] == self._temp_dir:
+            return cached[2]
+
+        env = {**os.environ, **self.config.extra_env}
+        if self._temp_dir:
+            if self._ccache:
+                # Every sandbox lives in a fresh tempdir; hash paths relative
+                # to it so unchanged translation units hit across sandboxes
+                env["CCACHE_BASEDIR"] = str(self._temp_dir)
+                env["CCACHE_NOHASHDIR"] = "1"
+            if self.config.temp_root:
+                # Keep gcc's scratch files on the same filesystem as the sandbox
+                env["TMPDIR"] = str(self._temp_dir)
+        self._env_cache = (self.config, self._temp_dir, env)
+        return env
+
+    def _run_compiler(
+        self, cmd: List[str], env: Dict[str, str]
+    ) -> subprocess.CompletedProcess:
+        """Run one compiler invocation in the game directory."""
+        return _run(cmd, self.config.timeout, cwd=str(self._temp_dir / "game"), env=env)
+
+    def _compile_and_link(
+        self,
+        cmd: List[str],
+        sources: List[Path],
+        output_path: Path,
+        env: Dict[str, str],
+    ) -> subprocess.CompletedProcess:
+        """Compile each source to an object file in parallel, then link.
+
+        Separate ``-c`` invocations let independent translation units build
+        concurrently and are what ccache can cache.
+
+        Args:
+            cmd: Compiler command and flags, without sources or output
+            sources: Source files to compile
+            output_path: Path of the linked executable
+            env: Environment for the compiler
+
+        Returns:
+            CompletedProcess with the combined output of all steps
+        """
+        obj_dir = self._temp_dir / "obj"
+        obj_dir.mkdir(exist_ok=True)
+        objects = [obj_dir / f"{i}_{src.stem}.o" for i, src in enumerate(sources)]
+        jobs = [
+            cmd + ["-c", str(src), "-o", str(obj)]
+            for src, obj in zip(sources, objects, strict=True)
+        ]
+
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            results = list(pool.map(lambda job: self._run_compiler(job, env), jobs))
+
+        failed = [r for r in results if r.returncode != 0]
+        if not failed:
+            # Link with the plain compiler; ccache cannot cache a link step
+            link_cmd = cmd[1:] if cmd[0] == self._ccache else list(cmd)
+            link_cmd.extend(str(obj) for obj in objects)
+            link_cmd.extend(["-o", str(output_path)])
+            link_cmd.extend(self.config.linker_flags)
+            results.append(self._run_compiler(link_cmd, env))
+
+        return subprocess.CompletedProcess(
+            cmd,
+            failed[0].returncode if failed else results[-1].returncode,
+            "".join(r.stdout for r in results),
+            "".join(r.stderr for r in results),
+        )
+
     def run_make(
         self,
         target: str = "test",
@@ -279,24 +537,15 @@ class CSandbox:
                 error="Makefile not found",
             )
 
-        # Build environment
-        env = os.environ.copy()
-        env.update(self.config.extra_env)
+        env = self._env()
 
-        cmd = ["make", "-C", str(make_dir), target]
+        cmd = [_resolve("make"), "-C", str(make_dir), f"-j{os.cpu_count() or 1}", target]
 
-        import time
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout,
-                env=env,
-            )
-            elapsed = time.time() - start_time
+            result = _run(cmd, self.config.timeout, env=env)
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
 
             return ExecutionResult(
                 success=result.returncode == 0,
@@ -307,18 +556,18 @@ class CSandbox:
             )
 
         except subprocess.TimeoutExpired as e:
-            elapsed = time.time() - start_time
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
             return ExecutionResult(
                 success=False,
-                stdout=e.stdout or "" if hasattr(e, "stdout") else "",
-                stderr=e.stderr or "" if hasattr(e, "stderr") else "",
+                stdout=_decode(e.stdout),
+                stderr=_decode(e.stderr),
                 return_code=-1,
                 elapsed_time=elapsed,
                 error=f"Make timeout after {self.config.timeout}s",
             )
 
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
             return ExecutionResult(
                 success=False,
                 stdout="",
@@ -354,28 +603,17 @@ class CSandbox:
                 error="Executable not found",
             )
 
-        # Build environment
-        run_env = os.environ.copy()
-        run_env.update(self.config.extra_env)
-        if env:
-            run_env.update(env)
+        run_env = {**self._env(), **env} if env else self._env()
 
         cmd = [str(executable)]
         if args:
             cmd.extend(args)
 
-        import time
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout,
-                env=run_env,
-            )
-            elapsed = time.time() - start_time
+            result = _run(cmd, self.config.timeout, env=run_env)
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
 
             return ExecutionResult(
                 success=result.returncode == 0,
@@ -386,18 +624,18 @@ class CSandbox:
             )
 
         except subprocess.TimeoutExpired as e:
-            elapsed = time.time() - start_time
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
             return ExecutionResult(
                 success=False,
-                stdout=e.stdout or "" if hasattr(e, "stdout") else "",
-                stderr=e.stderr or "" if hasattr(e, "stderr") else "",
+                stdout=_decode(e.stdout),
+                stderr=_decode(e.stderr),
                 return_code=-1,
                 elapsed_time=elapsed,
                 error=f"Execution timeout after {self.config.timeout}s",
             )
 
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
             return ExecutionResult(
                 success=False,
                 stdout="",
@@ -0,0 +1,45 @@
+"""Filesystem helpers shared by the sandboxes and the evaluation runner."""
+
+import os
+import shutil
+from pathlib import Path
+
+# Source files are inputs to builds and test runs: compilers and test
+# runners read them but do not rewrite them in place, so they are the only
+# files that may be shared with the task directory through a hard link
+LINK_SUFFIXES = frozenset({".c", ".h", ".cc", ".cpp", ".hpp", ".py"})
+
+
+def link_tree(src: Path, dst: Path) -> None:
+    """Mirror a directory tree, hard-linking source files instead of copying.
+
+    Only files with a LINK_SUFFIXES suffix are linked. Everything else
+    (Makefiles, data files, shipped objects, dependency files or binaries)
+    is copied, since a build or test may rewrite it in place and would
+    otherwise write through the link into the task directory. Making the
+    links read-only would not help: the mode belongs to the shared inode,
+    and sandboxes may run as root. Files that cannot be linked (e.g. across
+    filesystems) are copied too.
+
+    Callers that edit a linked file must replace it (unlink, then write)
+    rather than truncate it.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (created if missing)
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    for root, dirs, files in os.walk(src):
+        target_root = dst / Path(root).relative_to(src)
+        for name in dirs:
+            (target_root / name).mkdir(exist_ok=True)
+        for name in files:
+            source = os.path.join(root, name)
+            target = target_root / name
+            if os.path.splitext(name)[1] in LINK_SUFFIXES:
+                try:
+                    os.link(source, target)
+                    continue
+                except OSError:
+                    pass
+            shutil.copy2(source, target)
@@ -13,26 +13,125 @@ This sandbox handles:
 - Managing build cache for performance
 """
 
+import fnmatch
 import hashlib
 import os
+import re
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from harness.patch_utils import apply_patch, PatchResult
+from harness.patch_utils import apply_patch, apply_patch_file, PatchResult
 
 
 # Julius repository URL
 JULIUS_REPO_URL = "https://github.com/bvschaik/julius.git"
 
+# Commits given as a full SHA-1 can be fetched directly
+_FULL_SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+# Unsharded cache entries (<cache_dir>/julius_<sha256[:16]>) from before
+# entries were keyed by BLAKE2b under <cache_dir>/<key[:2]>/
+_LEGACY_CACHE_RE = re.compile(r"julius_[0-9a-f]{16}")
+
+# Directories list_source_files never descends into
+_SKIP_DIRS = frozenset({".git", "build"})
+
+# Records the cmake arguments a build directory was last configured with
+_CONFIGURE_STAMP = ".gdb_configure_args"
+
 # Default build cache location
 DEFAULT_CACHE_DIR = Path.home() / ".cache" / "gdb_julius"
 
 
+@cache
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process, however many sandboxes use it."""
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def _read_back(f) -> str:
+    """Read captured output from the start of a temporary file."""
+    f.seek(0)
+    return f.read().decode("utf-8", errors="replace")
+
+
+def _run(cmd: List[str], timeout: float, **kwargs) -> subprocess.CompletedProcess:
+    """Run a command with its output spooled to temporary files.
+
+    Verbose builds can print megabytes; writing straight to files keeps that
+    out of pipes drained by Python, and the output is decoded once at the
+    end. On a timeout, the partial output is attached to the exception.
+
+    Args:
+        cmd: Command and arguments
+        timeout: Timeout in seconds
+        **kwargs: Extra arguments for subprocess.run (cwd, env)
+
+    Returns:
+        CompletedProcess with str stdout and stderr
+    """
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        try:
+            result = subprocess.run(cmd, stdout=out, stderr=err, timeout=timeout, **kwargs)
+        except subprocess.TimeoutExpired as e:
+            e.stdout = _read_back(out)
+            e.stderr = _read_back(err)
+            raise
+        return subprocess.CompletedProcess(cmd, result.returncode, _read_back(out), _read_back(err))
+
+
+def _discard_tree(path: Path) -> None:
+    """Remove a directory tree without waiting for it to be deleted.
+
+    The tree is renamed out of the way (atomic, so the path is free
+    immediately) and deleted on a background thread. The thread is not a
+    daemon, so the interpreter still finishes the deletion before exiting.
+
+    Args:
+        path: Directory to remove
+    """
+    trash = path.with_name(f"{path.name}.trash")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}, name="julius-cleanup"
+    ).start()
+
+
+@cache
+def _prune_legacy_cache(cache_dir: Path) -> None:
+    """Delete repository copies left in the cache by the old key layout.
+
+    They can never be hit again and each is a full clone, so they are
+    removed (in the background) the first time a cache directory is used.
+
+    Args:
+        cache_dir: Repository cache directory
+    """
+    try:
+        with os.scandir(cache_dir) as it:
+            legacy = [
+                Path(entry.path)
+                for entry in it
+                if _LEGACY_CACHE_RE.fullmatch(entry.name) and entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return
+    for path in legacy:
+        _discard_tree(path)
+
+
 @dataclass
 class JuliusSandboxConfig:
     """Configuration for the Julius sandbox environment."""
@@ -51,6 +150,16 @@ class JuliusSandboxConfig:
     cc: str = "clang"  # clang recommended for ASan
     cxx: str = "clang++"
 
+    # Compile through ccache when it is installed
+    use_ccache: bool = True
+    # Unity builds merge translation units; off by default because file-local
+    # (static) names that repeat across Julius sources collide when merged
+    unity_build: bool = False
+
+    # Directories to check out (sparse cone mode; top-level files are always
+    # included), e.g. ["src", "cmake", "ext"]. None checks out the whole tree.
+    sparse_paths: Optional[List[str]] = None
+
     # CMake options
     cmake_options: Dict[str, str] = field(default_factory=dict)
 
@@ -99,10 +208,14 @@ class JuliusSandbox:
         self._repo_dir: Optional[Path] = None
         self._build_dir: Optional[Path] = None
         self._original_commit: Optional[str] = None
+        self._ccache = shutil.which("ccache") if self.config.use_ccache else None
+        # Subprocess environments by (abort_on_error, sandbox dir)
+        self._envs: Dict[tuple, Dict[str, str]] = {}
 
         # Ensure cache directory exists
         if self.config.use_cache:
-            self.config.cache_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(self.config.cache_dir)
+            _prune_legacy_cache(self.config.cache_dir)
 
     def clone(
         self,
@@ -137,39 +250,52 @@ class JuliusSandbox:
         # Clone fresh repository
         self._repo_dir = self._temp_dir / "julius"
 
+        # Partial clone: file contents are only downloaded for the commit
+        # (and sparse paths) actually checked out
+        repo = str(self._repo_dir)
         try:
-            # Clone with minimal depth if checking out specific commit
-            cmd = ["git", "clone"]
-            if not commit:
-                cmd.extend(["--depth", "1"])
-            if branch:
-                cmd.extend(["--branch", branch])
-            cmd.extend([JULIUS_REPO_URL, str(self._repo_dir)])
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout,
-            )
-
-            if result.returncode != 0:
-                return CloneResult(
-                    success=False,
-                    stdout=result.stdout,
-                    stderr=result.stderr,
-                    error=f"Git clone failed: {result.stderr}",
-                )
+            if commit and _FULL_SHA_RE.fullmatch(commit):
+                # A full hash can be fetched on its own, so only that commit
+                # is downloaded instead of the whole history
+                fetch = ["git", "-C", repo, "fetch", "--depth", "1", "--no-tags"]
+                steps = [
+                    (["git", "init", "-q", repo], "Git init"),
+                    (["git", "-C", repo, "remote", "add", "origin", JULIUS_REPO_URL], "Git remote"),
+                    (fetch + ["--filter=blob:none", "origin", commit], "Git fetch"),
+                ]
+                checkout = ["git", "checkout", "--detach", "FETCH_HEAD"]
+            else:
+                # Abbreviated hashes can only be resolved against full history
+                cmd = ["git", "clone", "--filter=blob:none"]
+                if commit:
+                    cmd.append("--no-checkout")
+                else:
+                    cmd.extend(["--depth", "1"])
+                if self.config.sparse_paths:
+                    cmd.append("--sparse")
+                if branch:
+                    cmd.extend(["--branch", branch])
+                cmd.extend([JULIUS_REPO_URL, repo])
+                steps = [(cmd, "Git clone")]
+                checkout = ["git", "checkout", commit]
+
+            if self.config.sparse_paths:
+                steps.append((self._sparse_checkout_cmd(repo), "Git sparse-checkout"))
+
+            for cmd, label in steps:
+                result = _run(cmd, self.config.timeout)
+
+                if result.returncode != 0:
+                    return CloneResult(
+                        success=False,
+                        stdout=result.stdout,
+                        stderr=result.stderr,
+                        error=f"{label} failed: {result.stderr}",
+                    )
 
             # Checkout specific commit if requested
             if commit:
-                checkout_result = subprocess.run(
-                    ["git", "checkout", commit],
-                    cwd=str(self._repo_dir),
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                )
+                checkout_result = _run(checkout, 60, cwd=str(self._repo_dir))
 
                 if checkout_result.returncode != 0:
                     return CloneResult(
@@ -227,8 +353,7 @@ class JuliusSandbox:
                 error="Repository not cloned. Call clone() first.",
             )
 
-        patch_content = patch_path.read_text()
-        return apply_patch(patch_content, self._repo_dir)
+        return apply_patch_file(patch_path, self._repo_dir)
 
     def apply_model_fix(self, patch_content: str) -> PatchResult:
         """Apply a model's proposed fix as a patch.
@@ -257,10 +382,50 @@ class JuliusSandbox:
         if not self._repo_dir:
             raise RuntimeError("Repository not cloned. Call clone() first.")
 
+        # Create each missing parent directory once, not once per file
+        for parent in {os.path.dirname(filepath) for filepath in changes} - {""}:
+            os.makedirs(os.path.join(self._repo_dir, parent), exist_ok=True)
+
         for filepath, content in changes.items():
-            target = self._repo_dir / filepath
-            target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text(content)
+            path = os.path.join(self._repo_dir, filepath)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                data = memoryview(content.encode("utf-8"))
+                while data:
+                    data = data[os.write(fd, data) :]
+            finally:
+                os.close(fd)
+
+    def _env(self, abort_on_error: bool) -> Dict[str, str]:
+        """Get the environment for builds and test runs.
+
+        Built once per ASan mode instead of copying os.environ for every
+        subprocess. Callers must not modify the returned dict.
+
+        Args:
+            abort_on_error: Whether ASan aborts on the first error (builds)
+                or reports and continues (test runs)
+
+        Returns:
+            Environment mapping
+        """
+        key = (abort_on_error, self._temp_dir)
+        env = self._envs.get(key)
+        if env is None:
+            env = dict(os.environ)
+            if self.config.enable_asan:
+                env["ASAN_OPTIONS"] = (
+                    f"detect_leaks=1:abort_on_error={int(abort_on_error)}:print_stacktrace=1"
+                )
+            if self._ccache:
+                # Each sandbox clones into a fresh tempdir; hash paths relative
+                # to it so unchanged files hit across sandboxes
+                env["CCACHE_BASEDIR"] = str(self._temp_dir or self._repo_dir)
+                env["CCACHE_NOHASHDIR"] = "1"
+                if self.config.use_cache:
+                    env["CCACHE_DIR"] = str(self.config.cache_dir / "ccache")
+            self._envs[key] = env
+        return env
 
     def build(
         self,
@@ -301,6 +466,17 @@ class JuliusSandbox:
             # Compatibility with older CMakeLists.txt files
             "-DCMAKE_POLICY_VERSION_MINIMUM=3.5",
         ]
+        # Ninja schedules across all cores and checks dependencies faster
+        # than make; fall back to CMake's default generator without it
+        if shutil.which("ninja"):
+            cmake_args.extend(["-G", "Ninja"])
+        if self._ccache:
+            cmake_args.extend([
+                f"-DCMAKE_C_COMPILER_LAUNCHER={self._ccache}",
+                f"-DCMAKE_CXX_COMPILER_LAUNCHER={self._ccache}",
+            ])
+        if self.config.unity_build:
+            cmake_args.extend(["-DCMAKE_UNITY_BUILD=ON", "-DCMAKE_UNITY_BUILD_BATCH_SIZE=16"])
 
         # Add sanitizer flags
         if self.config.enable_asan or self.config.enable_ubsan:
@@ -325,21 +501,31 @@ class JuliusSandbox:
         if extra_cmake_args:
             cmake_args.extend(extra_cmake_args)
 
-        # Set environment for ASan
-        env = os.environ.copy()
-        if self.config.enable_asan:
-            env["ASAN_OPTIONS"] = "detect_leaks=1:abort_on_error=1:print_stacktrace=1"
+        env = self._env(abort_on_error=True)
 
+        # Reconfiguring an already configured tree with the same arguments is
+        # redundant: the generated build re-runs cmake itself if CMakeLists.txt
+        # files change
+        stamp = self._build_dir / _CONFIGURE_STAMP
+        stamp_text = "\n".join(cmake_args)
         try:
-            # Run CMake configure
-            configure_result = subprocess.run(
-                cmake_args,
-                cwd=str(self._build_dir),
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout,
-                env=env,
+            configured = (
+                (self._build_dir / "CMakeCache.txt").exists()
+                and stamp.read_text(encoding="utf-8") == stamp_text
             )
+        except OSError:
+            configured = False
+
+        try:
+            if configured:
+                configure_result = subprocess.CompletedProcess(cmake_args, 0, "", "")
+            else:
+                stamp.unlink(missing_ok=True)
+                configure_result = _run(
+                    cmake_args, self.config.timeout, cwd=str(self._build_dir), env=env
+                )
+                if configure_result.returncode == 0:
+                    stamp.write_text(stamp_text, encoding="utf-8")
 
             if configure_result.returncode != 0:
                 elapsed = time.time() - start_time
@@ -351,19 +537,13 @@ class JuliusSandbox:
                     error=f"CMake configure failed: {configure_result.stderr}",
                 )
 
-            # Run make
-            make_cmd = ["make", "-j4"]
+            # Build with every core unless CMAKE_BUILD_PARALLEL_LEVEL says otherwise
+            jobs = env.get("CMAKE_BUILD_PARALLEL_LEVEL") or str(os.cpu_count() or 4)
+            build_cmd = ["cmake", "--build", str(self._build_dir), "--parallel", jobs]
             if target:
-                make_cmd.append(target)
-
-            build_result = subprocess.run(
-                make_cmd,
-                cwd=str(self._build_dir),
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout,
-                env=env,
-            )
+                build_cmd.extend(["--target", target])
+
+            build_result = _run(build_cmd, self.config.timeout, cwd=str(self._build_dir), env=env)
 
             elapsed = time.time() - start_time
 
@@ -432,49 +612,68 @@ class JuliusSandbox:
                 error="Repository not cloned. Call clone() first.",
             )
 
+        if not test_sources:
+            return BuildResult(
+                success=False,
+                stdout="",
+                stderr="",
+                elapsed_time=0,
+                error="No test sources to build.",
+            )
+
         start_time = time.time()
 
         # Build directory for tests
         test_build_dir = self._temp_dir / "test_build" if self._temp_dir else Path(tempfile.mkdtemp())
         test_build_dir.mkdir(parents=True, exist_ok=True)
 
-        # Compiler command
-        compiler = self.config.cc
+        # Sanitizers must be passed both when compiling and when linking
+        sanitizer_flags = []
+        if self.config.enable_asan:
+            sanitizer_flags.extend(["-fsanitize=address", "-fno-omit-frame-pointer", "-g"])
+        if self.config.enable_ubsan:
+            sanitizer_flags.append("-fsanitize=undefined")
+
         compile_args = [
-            compiler,
+            self.config.cc,
             "-Wall", "-Wextra",
             "-I", str(self._repo_dir / "src"),
             "-I", str(test_dir),
+            *sanitizer_flags,
         ]
+        if self._ccache:
+            compile_args.insert(0, self._ccache)
 
-        # Add sanitizer flags
-        if self.config.enable_asan:
-            compile_args.extend(["-fsanitize=address", "-fno-omit-frame-pointer", "-g"])
-        if self.config.enable_ubsan:
-            compile_args.extend(["-fsanitize=undefined"])
-
-        # Add source files
-        for src in test_sources:
-            compile_args.append(str(test_dir / src))
-
-        # Output
         output_path = test_build_dir / output_name
-        compile_args.extend(["-o", str(output_path)])
+        objects = [test_build_dir / f"{i}_{Path(src).stem}.o" for i, src in enumerate(test_sources)]
+        jobs = [
+            compile_args + ["-c", str(test_dir / src), "-o", str(obj)]
+            for src, obj in zip(test_sources, objects, strict=True)
+        ]
+        link_args = [
+            self.config.cc,
+            *sanitizer_flags,
+            *(str(obj) for obj in objects),
+            "-o", str(output_path),
+            "-lm",
+        ]
 
-        # Link math library
-        compile_args.append("-lm")
-
-        env = os.environ.copy()
-        if self.config.enable_asan:
-            env["ASAN_OPTIONS"] = "detect_leaks=1:abort_on_error=1:print_stacktrace=1"
+        env = self._env(abort_on_error=True)
 
         try:
-            result = subprocess.run(
-                compile_args,
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout,
-                env=env,
+            # Compile translation units in parallel, then link once
+            with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+                results = list(
+                    pool.map(lambda job: _run(job, self.config.timeout, env=env), jobs)
+                )
+            failed = [r for r in results if r.returncode != 0]
+            if not failed:
+                results.append(_run(link_args, self.config.timeout, env=env))
+            result = subprocess.CompletedProcess(
+                link_args,
+                failed[0].returncode if failed else results[-1].returncode,
+                "".join(r.stdout for r in results),
+                "".join(r.stderr for r in results),
             )
 
             elapsed = time.time() - start_time
@@ -545,23 +744,15 @@ class JuliusSandbox:
         start_time = time.time()
         timeout = timeout or self.config.timeout
 
-        # Set up environment for ASan
-        env = os.environ.copy()
-        if self.config.enable_asan:
-            env["ASAN_OPTIONS"] = "detect_leaks=1:abort_on_error=0:print_stacktrace=1"
+        # Report ASan errors and keep going so the test output is complete
+        env = self._env(abort_on_error=False)
 
         cmd = [str(test_executable)]
         if args:
             cmd.extend(args)
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                env=env,
-            )
+            result = _run(cmd, timeout, env=env)
 
             elapsed = time.time() - start_time
 
@@ -608,19 +799,28 @@ class JuliusSandbox:
         if not self._repo_dir:
             return None
 
-        target = self._repo_dir / filepath
-        if target.exists():
-            try:
-                return target.read_text()
-            except UnicodeDecodeError:
-                return None
-        return None
+        try:
+            fd = os.open(os.path.join(self._repo_dir, filepath), os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+        try:
+            chunks = []
+            while chunk := os.read(fd, 1 << 20):
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        try:
+            return b"".join(chunks).decode("utf-8")
+        except UnicodeDecodeError:
+            return None
 
     def list_source_files(self, pattern: str = "*.c") -> List[str]:
         """List source files in the repository.
 
+        Git metadata and in-tree build directories are not searched.
+
         Args:
-            pattern: Glob pattern for files
+            pattern: Glob pattern for file names
 
         Returns:
             List of file paths relative to repository root
@@ -628,11 +828,47 @@ class JuliusSandbox:
         if not self._repo_dir:
             return []
 
+        root = str(self._repo_dir)
         files = []
-        for f in self._repo_dir.rglob(pattern):
-            files.append(str(f.relative_to(self._repo_dir)))
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif fnmatch.fnmatchcase(entry.name, pattern):
+                        files.append(os.path.relpath(entry.path, root))
         return files
 
+    def _sparse_checkout_cmd(self, repo: str) -> List[str]:
+        """Get the command restricting a repository to config.sparse_paths."""
+        return ["git", "-C", repo, "sparse-checkout", "set", "--cone", *self.config.sparse_paths]
+
+    def _cache_path(self, commit: str) -> Path:
+        """Get the cache location for a commit.
+
+        The key only needs to be uniform and filesystem-safe (commit may be
+        any ref), so a short BLAKE2b digest is used; entries are sharded
+        under ``<cache_dir>/<key[:2]>/`` so no single directory grows too large.
+
+        A partial clone only holds the file contents it checked out, so the
+        key also covers the sparse paths and whether the clone is shallow
+        (a full hash is fetched at depth 1); an entry is only ever reused by
+        a clone that needs exactly the objects it has.
+
+        Args:
+            commit: Git commit hash
+
+        Returns:
+            Path of the cached repository
+        """
+        shallow = bool(_FULL_SHA_RE.fullmatch(commit))
+        sparse = "\0".join(sorted(self.config.sparse_paths or ()))
+        key_data = f"{commit}\0{int(shallow)}\0{sparse}".encode()
+        cache_key = hashlib.blake2b(key_data, digest_size=8).hexdigest()
+        return self.config.cache_dir / cache_key[:2] / f"julius_{cache_key}"
+
     def _get_cached_repo(self, commit: str) -> Optional[Path]:
         """Get cached repository for a specific commit.
 
@@ -642,16 +878,63 @@ class JuliusSandbox:
         Returns:
             Path to cached repo or None if not cached
         """
-        cache_key = hashlib.sha256(commit.encode()).hexdigest()[:16]
-        cached_path = self.config.cache_dir / f"julius_{cache_key}"
+        cached_path = self._cache_path(commit)
+        if not cached_path.exists():
+            return None
 
-        if cached_path.exists():
-            # Copy to temp directory
-            dest = self._temp_dir / "julius"
-            shutil.copytree(cached_path, dest)
-            return dest
+        # Borrow the cached object store (git alternates) instead of copying
+        # the whole repository; only the working tree is written
+        dest = self._temp_dir / "julius"
+        repo = str(dest)
+        shallow_file = cached_path / ".git" / "shallow"
+        try:
+            if shallow_file.exists():
+                # git clone cannot share a shallow repository: it falls back
+                # to the pack protocol, which fails on a partial clone's
+                # missing blobs. Point a fresh repository at the cached
+                # objects instead, with the real remote as the promisor for
+                # anything the cache does not hold.
+                self._run_git_steps([
+                    ["git", "init", "-q", repo],
+                    ["git", "-C", repo, "remote", "add", "origin", JULIUS_REPO_URL],
+                    ["git", "-C", repo, "config", "remote.origin.promisor", "true"],
+                    ["git", "-C", repo, "config", "remote.origin.partialclonefilter", "blob:none"],
+                ])
+                objects = (cached_path / ".git" / "objects").resolve()
+                (dest / ".git" / "objects" / "info" / "alternates").write_text(f"{objects}\n")
+                shutil.copyfile(shallow_file, dest / ".git" / "shallow")
+            else:
+                self._run_git_steps(
+                    [["git", "clone", "-q", "--shared", "--no-checkout", str(cached_path), repo]]
+                )
+            steps = []
+            if self.config.sparse_paths:
+                # A partial clone only holds the blobs under its sparse paths
+                steps.append(self._sparse_checkout_cmd(repo))
+            steps.append(["git", "-C", repo, "checkout", "-q", "--detach", commit])
+            self._run_git_steps(steps)
+        except (OSError, subprocess.SubprocessError):
+            # Unusable cache entry: drop it so the fresh clone replaces it
+            shutil.rmtree(dest, ignore_errors=True)
+            _discard_tree(cached_path)
+            return None
+        return dest
 
-        return None
+    def _run_git_steps(self, steps: List[List[str]]) -> None:
+        """Run git commands in order, stopping at the first failure.
+
+        Args:
+            steps: Commands to run
+
+        Raises:
+            subprocess.CalledProcessError: If a command fails
+        """
+        for cmd in steps:
+            result = _run(cmd, self.config.timeout)
+            if result.returncode != 0:
+                raise subprocess.CalledProcessError(
+                    result.returncode, cmd, result.stdout, result.stderr
+                )
 
     def _cache_repo(self, commit: str) -> None:
         """Cache repository for a specific commit.
@@ -662,8 +945,7 @@ class JuliusSandbox:
         if not self._repo_dir:
             return
 
-        cache_key = hashlib.sha256(commit.encode()).hexdigest()[:16]
-        cached_path = self.config.cache_dir / f"julius_{cache_key}"
+        cached_path = self._cache_path(commit)
 
         # Only cache if not already cached
         if not cached_path.exists():
@@ -672,7 +954,7 @@ class JuliusSandbox:
     def cleanup(self) -> None:
         """Clean up temporary directories."""
         if self._temp_dir and self._temp_dir.exists():
-            shutil.rmtree(self._temp_dir)
+            _discard_tree(self._temp_dir)
             self._temp_dir = None
             self._repo_dir = None
             self._build_dir = None
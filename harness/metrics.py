@@ -1,14 +1,67 @@
 """Metrics collection for game performance analysis."""
 
+import threading
 import time
+from array import array
 from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
 import psutil
 
+try:
+    import numpy as np
+except ImportError:  # optional speedup, see the "perf" extra
+    np = None
 
-@dataclass
+
+def _frame_time_stats(
+    frame_times: Sequence[float],
+) -> tuple[float, float, float, float, float, float]:
+    """Aggregate frame times (ms), vectorized with NumPy when it is installed.
+
+    Percentiles are nearest-rank (the value at index ``int(n * q)``) in
+    both paths, so results do not depend on whether NumPy is available.
+
+    Args:
+        frame_times: Non-empty sequence of frame times in milliseconds
+
+    Returns:
+        (avg_frame_time, p95_frame_time, p99_frame_time, avg_fps, min_fps, max_fps)
+    """
+    n = len(frame_times)
+    p95_idx = min(int(n * 0.95), n - 1)
+    p99_idx = min(int(n * 0.99), n - 1)
+
+    if np is not None:
+        # array('d') storage is viewed in place rather than converted
+        times = np.asarray(frame_times, dtype=np.float64)
+        avg_frame_time = float(times.mean())
+        # Partial sort around the two ranks instead of a full sort
+        ranked = np.partition(times, (p95_idx, p99_idx))
+        p95_frame_time = float(ranked[p95_idx])
+        p99_frame_time = float(ranked[p99_idx])
+        positive = times[times > 0]
+        if positive.size:
+            fps = 1000.0 / positive
+            avg_fps, min_fps, max_fps = float(fps.mean()), float(fps.min()), float(fps.max())
+        else:
+            avg_fps = min_fps = max_fps = 0
+    else:
+        sorted_times = sorted(frame_times)
+        avg_frame_time = sum(sorted_times) / n
+        p95_frame_time = sorted_times[p95_idx]
+        p99_frame_time = sorted_times[p99_idx]
+        fps_values = [1000.0 / t for t in sorted_times if t > 0]
+        avg_fps = sum(fps_values) / len(fps_values) if fps_values else 0
+        min_fps = min(fps_values) if fps_values else 0
+        max_fps = max(fps_values) if fps_values else 0
+
+    return avg_frame_time, p95_frame_time, p99_frame_time, avg_fps, min_fps, max_fps
+
+
+@dataclass(slots=True)
 class FrameMetrics:
     """Metrics for a single frame."""
 
@@ -54,36 +107,77 @@ class MetricsCollector:
         print(f"Average FPS: {metrics.avg_fps}")
     """
 
-    def __init__(self, window_size: int = 60):
+    def __init__(self, window_size: int = 60, sample_interval: float = 0.2):
         """Initialize the metrics collector.
 
         Args:
             window_size: Number of frames to use for rolling averages
+            sample_interval: Seconds between memory/CPU samples
         """
         self.window_size = window_size
+        self.sample_interval = sample_interval
         self._frame_times: deque[float] = deque(maxlen=window_size)
-        self._all_frame_times: list[float] = []
+        # Unboxed doubles: 8 bytes per frame instead of a float object each
+        self._all_frame_times = array("d")
         self._memory_samples: list[float] = []
         self._cpu_samples: list[float] = []
         self._events: list[dict[str, Any]] = []
         self._start_time: float | None = None
-        self._last_frame_time: float | None = None
+        # perf_counter_ns() readings; frame times are measured on this clock
+        self._start_ns = 0
+        self._last_frame_ns = 0
         self._frame_count = 0
         self._process: psutil.Process | None = None
         self._running = False
+        # Memory/CPU are sampled on a background thread so the /proc reads
+        # never land inside a measured frame
+        self._sampler: threading.Thread | None = None
+        self._stop_sampling = threading.Event()
+        self._last_memory_mb = 0.0
+        self._last_cpu_percent = 0.0
 
     def start(self) -> None:
-        """Start collecting metrics."""
+        """Start collecting metrics, restarting the sampler if already running."""
+        self._stop_sampler()
         self._start_time = time.time()
-        self._last_frame_time = self._start_time
+        self._start_ns = self._last_frame_ns = time.perf_counter_ns()
         self._frame_count = 0
         self._frame_times.clear()
-        self._all_frame_times = []
+        self._all_frame_times = array("d")
         self._memory_samples = []
         self._cpu_samples = []
         self._events = []
         self._process = psutil.Process()
+        self._last_memory_mb = 0.0
+        self._last_cpu_percent = 0.0
         self._running = True
+        self._stop_sampling.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="metrics-sampler", daemon=True
+        )
+        self._sampler.start()
+
+    def _stop_sampler(self) -> None:
+        """Stop the sampler thread, if any, and wait for it to exit."""
+        self._stop_sampling.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _sample_loop(self) -> None:
+        """Sample memory and CPU usage every sample_interval until stopped."""
+        while True:
+            try:
+                memory_mb = self._process.memory_info().rss / (1024 * 1024)
+                cpu_percent = self._process.cpu_percent()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                return
+            self._memory_samples.append(memory_mb)
+            self._cpu_samples.append(cpu_percent)
+            self._last_memory_mb = memory_mb
+            self._last_cpu_percent = cpu_percent
+            if self._stop_sampling.wait(self.sample_interval):
+                return
 
     def record_frame(self) -> FrameMetrics:
         """Record metrics for the current frame.
@@ -94,36 +188,21 @@ class MetricsCollector:
         if not self._running:
             raise RuntimeError("Metrics collection not started. Call start() first.")
 
-        current_time = time.time()
-        frame_time = (current_time - self._last_frame_time) * 1000  # ms
-        self._last_frame_time = current_time
+        now_ns = time.perf_counter_ns()
+        frame_time = (now_ns - self._last_frame_ns) * 1e-6  # ms
+        self._last_frame_ns = now_ns
 
         self._frame_count += 1
         self._frame_times.append(frame_time)
         self._all_frame_times.append(frame_time)
 
-        # Sample system metrics (not every frame to reduce overhead)
-        memory_mb = 0.0
-        cpu_percent = 0.0
-        if self._frame_count % 10 == 0 and self._process:
-            try:
-                memory_mb = self._process.memory_info().rss / (1024 * 1024)
-                cpu_percent = self._process.cpu_percent()
-                self._memory_samples.append(memory_mb)
-                self._cpu_samples.append(cpu_percent)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-        # Calculate instantaneous FPS
-        fps = 1000.0 / frame_time if frame_time > 0 else 0
-
         return FrameMetrics(
             frame_number=self._frame_count,
             frame_time_ms=frame_time,
-            fps=fps,
-            memory_mb=memory_mb,
-            cpu_percent=cpu_percent,
-            timestamp=current_time,
+            fps=1000.0 / frame_time if frame_time > 0 else 0,
+            memory_mb=self._last_memory_mb,
+            cpu_percent=self._last_cpu_percent,
+            timestamp=self._start_time + (now_ns - self._start_ns) * 1e-9,
         )
 
     def record_event(self, event_type: str, data: dict[str, Any] | None = None) -> None:
@@ -161,22 +240,13 @@ class MetricsCollector:
             raise RuntimeError("Metrics collection not started.")
 
         self._running = False
-        end_time = time.time()
-        elapsed = end_time - self._start_time if self._start_time else 0
+        self._stop_sampler()
+        elapsed = (time.perf_counter_ns() - self._start_ns) * 1e-9 if self._start_time else 0
 
         # Calculate frame time statistics
         if self._all_frame_times:
-            sorted_times = sorted(self._all_frame_times)
-            avg_frame_time = sum(sorted_times) / len(sorted_times)
-            p95_idx = int(len(sorted_times) * 0.95)
-            p99_idx = int(len(sorted_times) * 0.99)
-            p95_frame_time = sorted_times[min(p95_idx, len(sorted_times) - 1)]
-            p99_frame_time = sorted_times[min(p99_idx, len(sorted_times) - 1)]
-
-            fps_values = [1000.0 / t for t in sorted_times if t > 0]
-            avg_fps = sum(fps_values) / len(fps_values) if fps_values else 0
-            min_fps = min(fps_values) if fps_values else 0
-            max_fps = max(fps_values) if fps_values else 0
+            stats = _frame_time_stats(self._all_frame_times)
+            avg_frame_time, p95_frame_time, p99_frame_time, avg_fps, min_fps, max_fps = stats
         else:
             avg_frame_time = 0
             p95_frame_time = 0
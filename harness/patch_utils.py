@@ -1,5 +1,6 @@
 """Utilities for working with git patches and unified diffs."""
 
+import difflib
 import re
 import subprocess
 import tempfile
@@ -221,41 +222,68 @@ def apply_patch(
         patch_file = Path(f.name)
 
     try:
-        cmd = ["git", "apply", f"-p{strip}"]
-        if reverse:
-            cmd.append("-R")
-        cmd.append(str(patch_file))
-
-        result = subprocess.run(
-            cmd,
-            cwd=str(target_dir),
-            capture_output=True,
-            text=True,
-        )
+        result = _git_apply(patch_file, target_dir, reverse, strip)
 
         files_modified = []
         if isinstance(patch, Patch):
             files_modified = [f.new_path for f in patch.files if not f.is_deleted]
             files_modified.extend([f.old_path for f in patch.files if f.is_deleted])
 
-        if result.returncode == 0:
-            return PatchResult(
-                success=True,
-                output=result.stdout,
-                files_modified=files_modified,
-            )
-        else:
-            return PatchResult(
-                success=False,
-                output=result.stdout,
-                error=result.stderr,
-                files_modified=[],
-            )
+        if result.success:
+            result.files_modified = files_modified
+        return result
 
     finally:
         patch_file.unlink()
 
 
+def apply_patch_file(
+    patch_path: Path,
+    target_dir: Path,
+    reverse: bool = False,
+    strip: int = 1,
+) -> PatchResult:
+    """Apply a patch file to a directory using git apply.
+
+    git reads the file itself, so the patch is never loaded into memory or
+    copied to a temporary file.
+
+    Args:
+        patch_path: Path to the patch file
+        target_dir: Directory to apply patch to
+        reverse: If True, reverse the patch (revert changes)
+        strip: Number of leading path components to strip (default: 1 for a/b prefixes)
+
+    Returns:
+        PatchResult with success status and output
+    """
+    return _git_apply(Path(patch_path).resolve(), target_dir, reverse, strip)
+
+
+def _git_apply(patch_file: Path, target_dir: Path, reverse: bool, strip: int) -> PatchResult:
+    """Run git apply on a patch file inside target_dir."""
+    cmd = ["git", "apply", f"-p{strip}"]
+    if reverse:
+        cmd.append("-R")
+    cmd.append(str(patch_file))
+
+    result = subprocess.run(
+        cmd,
+        cwd=str(target_dir),
+        capture_output=True,
+        text=True,
+    )
+
+    if result.returncode == 0:
+        return PatchResult(success=True, output=result.stdout)
+    return PatchResult(
+        success=False,
+        output=result.stdout,
+        error=result.stderr,
+        files_modified=[],
+    )
+
+
 def apply_patch_fallback(
     patch: Patch | str,
     target_dir: Path,
@@ -329,8 +357,6 @@ def create_patch_from_diff(
     Returns:
         Unified diff string
     """
-    import difflib
-
     old_lines = old_content.splitlines(keepends=True)
     new_lines = new_content.splitlines(keepends=True)
 
@@ -476,8 +502,6 @@ def compare_patches(patch1: str, patch2: str) -> float:
     Returns:
         Similarity score
     """
-    import difflib
-
     # Parse both patches
     p1 = parse_unified_diff(patch1)
     p2 = parse_unified_diff(patch2)
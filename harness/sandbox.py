@@ -2,13 +2,96 @@
 
 import os
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+# Directories that never hold game sources
+_SKIP_DIRS = frozenset({"__pycache__", ".git", ".venv", "venv", "node_modules"})
+
+
+def _iter_py_files(root: Path) -> Iterator[Path]:
+    """Yield Python files under root, pruning VCS, cache and venv directories.
+
+    Args:
+        root: Directory to search
+
+    Yields:
+        Paths of .py files
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(Path(entry.path))
+                elif entry.name.endswith(".py"):
+                    yield Path(entry.path)
+
+
+def _restore_tree(source: Path, target: Path) -> None:
+    """Make target match source again after code has run in it.
+
+    Files that differ from their source (by size or mtime; setup() copies
+    with copy2, so untouched files match) are copied back, files and
+    directories that are not in source are removed, and missing ones are
+    restored. __pycache__ directories are always removed: .pyc files are
+    validated by mtime and size only, so bytecode left by one evaluation
+    could otherwise be run in place of a same-size edit made by the next.
+
+    Args:
+        source: Directory the sandbox was set up from
+        target: Sandbox copy of source
+    """
+    stack = [""]
+    while stack:
+        rel = stack.pop()
+        src_dir = os.path.join(source, rel)
+        dst_dir = os.path.join(target, rel)
+        seen = set()
+        with os.scandir(dst_dir) as it:
+            for entry in it:
+                seen.add(entry.name)
+                src = os.path.join(src_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name == "__pycache__" or not os.path.isdir(src):
+                        shutil.rmtree(entry.path)
+                        seen.discard(entry.name)
+                    else:
+                        stack.append(os.path.join(rel, entry.name))
+                    continue
+                try:
+                    src_stat = os.stat(src)
+                except FileNotFoundError:
+                    os.unlink(entry.path)
+                    continue
+                dst_stat = entry.stat(follow_symlinks=False)
+                if (
+                    entry.is_symlink()
+                    or not stat.S_ISREG(src_stat.st_mode)
+                    or (dst_stat.st_size, dst_stat.st_mtime_ns)
+                    != (src_stat.st_size, src_stat.st_mtime_ns)
+                ):
+                    # Unlink first so a planted symlink is never written through
+                    os.unlink(entry.path)
+                    seen.discard(entry.name)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                if entry.name in seen or entry.name == "__pycache__":
+                    continue
+                dst = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    shutil.copytree(entry.path, dst, ignore=shutil.ignore_patterns("__pycache__"))
+                else:
+                    shutil.copy2(entry.path, dst)
+
 
 @dataclass
 class SandboxConfig:
@@ -52,6 +135,7 @@ class Sandbox:
         """
         self.config = config or SandboxConfig()
         self._temp_dir: Path | None = None
+        self._source_dir: Path | None = None
         self._original_files: dict[str, str] = {}
 
     def setup(self, source_dir: Path) -> Path:
@@ -66,6 +150,8 @@ class Sandbox:
         # Create temporary directory
         self._temp_dir = Path(tempfile.mkdtemp(prefix="gdb_sandbox_"))
 
+        self._source_dir = Path(source_dir)
+
         # Copy source files to sandbox
         if source_dir.exists():
             shutil.copytree(source_dir, self._temp_dir / "game", dirs_exist_ok=True)
@@ -86,7 +172,7 @@ class Sandbox:
         """
         files = {}
         if directory.exists():
-            for py_file in directory.rglob("*.py"):
+            for py_file in _iter_py_files(directory):
                 rel_path = py_file.relative_to(directory)
                 files[str(rel_path)] = py_file.read_text()
         return files
@@ -106,6 +192,21 @@ class Sandbox:
             file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.write_text(content)
 
+    def reset(self) -> None:
+        """Return the game directory to its setup() state.
+
+        Lets a set-up sandbox be reused for another evaluation of the same
+        source directory without copying the whole tree again. Besides
+        files written by apply_changes, this reverts anything the game code
+        or its tests wrote at runtime and drops cached bytecode.
+        """
+        if not self._temp_dir or not self._source_dir:
+            raise RuntimeError("Sandbox not set up. Call setup() first.")
+
+        game_dir = self._temp_dir / "game"
+        if self._source_dir.is_dir() and game_dir.is_dir():
+            _restore_tree(self._source_dir, game_dir)
+
     def get_changes(self) -> dict[str, str]:
         """Get the differences between original and current files.
 
@@ -177,7 +278,6 @@ class Sandbox:
         if args:
             cmd.extend(args)
 
-        import time
         start_time = time.time()
 
         try:
@@ -265,7 +365,6 @@ class Sandbox:
             "-x",  # Stop on first failure
         ]
 
-        import time
         start_time = time.time()
 
         try:
@@ -334,3 +433,65 @@ class Sandbox:
         if self._temp_dir:
             return self._temp_dir / "game"
         return None
+
+
+class SandboxPool:
+    """Keeps set-up sandboxes around for reuse across evaluations.
+
+    Sandboxes are keyed by sandbox class and source directory. Acquiring a
+    pooled sandbox resets it instead of copying the source tree again, which
+    also preserves build outputs for incremental C builds.
+    """
+
+    def __init__(self):
+        """Initialize an empty pool."""
+        self._sandboxes: dict[tuple[type, Path], Any] = {}
+
+    def acquire(self, sandbox_cls: type, config: Any, source_dir: Path) -> Any:
+        """Get a set-up sandbox for a source directory.
+
+        Args:
+            sandbox_cls: Sandbox class (Sandbox or CSandbox)
+            config: Configuration for the sandbox
+            source_dir: Directory containing the game code
+
+        Returns:
+            Sandbox ready for apply_changes; hand it back with release()
+        """
+        key = (sandbox_cls, Path(source_dir).resolve())
+        sandbox = self._sandboxes.pop(key, None)
+        if sandbox is not None and sandbox.working_dir is not None:
+            sandbox.config = config
+            sandbox.reset()
+            return sandbox
+
+        sandbox = sandbox_cls(config)
+        sandbox.setup(source_dir)
+        return sandbox
+
+    def release(self, sandbox: Any, source_dir: Path) -> None:
+        """Return a sandbox to the pool for later reuse.
+
+        Args:
+            sandbox: Sandbox obtained from acquire()
+            source_dir: Source directory it was set up from
+        """
+        key = (type(sandbox), Path(source_dir).resolve())
+        previous = self._sandboxes.pop(key, None)
+        if previous is not None and previous is not sandbox:
+            previous.cleanup()
+        self._sandboxes[key] = sandbox
+
+    def close(self) -> None:
+        """Clean up every pooled sandbox."""
+        for sandbox in self._sandboxes.values():
+            sandbox.cleanup()
+        self._sandboxes.clear()
+
+    def __enter__(self) -> "SandboxPool":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - clean up pooled sandboxes."""
+        self.close()
@@ -0,0 +1,178 @@
+"""Persistent on-disk cache for model responses.
+
+Model generation is by far the slowest and most expensive step of an
+evaluation. Responses are cached under a key derived from the prompt, the
+generation context and the model identity/configuration, so re-running a task
+(e.g. while iterating on scoring) replays the stored response instead of
+calling the model again.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Literal
+
+from models.base import GenerationResult, ModelError, ModelInterface
+
+CacheMode = Literal["enabled", "replay", "write-only", "disabled"]
+
+CACHE_MODES: tuple[str, ...] = ("enabled", "replay", "write-only", "disabled")
+
+# Default response cache location (relative to the working directory)
+DEFAULT_CACHE_DIR = Path(".eval_cache")
+
+# Config keys that do not change what the model generates
+_NON_SEMANTIC_CONFIG_KEYS = frozenset({"timeout", "api_key"})
+
+
+class ResponseCache:
+    """Content-addressed store of GenerationResults.
+
+    Entries live at ``<cache_dir>/<key[:2]>/<key>.json`` so no single
+    directory grows too large.
+
+    Modes:
+        enabled: read hits, write misses
+        replay: read hits only; a miss is an error
+        write-only: always generate, overwrite stored entries
+        disabled: no caching
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, mode: CacheMode = "enabled"):
+        """Initialize the response cache.
+
+        Args:
+            cache_dir: Root directory for cache entries
+            mode: Cache mode (see class docstring)
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: '{mode}'. Expected one of {CACHE_MODES}.")
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+
+    @staticmethod
+    def make_key(model: ModelInterface, prompt: str, context: dict[str, Any] | None) -> str:
+        """Compute the cache key for a generation request.
+
+        File contents, by far the largest part of a request, are fed to the
+        hash one at a time rather than serialized into a single JSON string.
+
+        Args:
+            model: Model that would serve the request
+            prompt: Prompt text
+            context: Generation context; callables are ignored
+
+        Returns:
+            Hex digest identifying the request
+        """
+        config = {
+            k: v for k, v in model.get_config().items() if k not in _NON_SEMANTIC_CONFIG_KEYS
+        }
+        context = context or {}
+        ctx = {k: v for k, v in context.items() if k != "files" and not callable(v)}
+        header = json.dumps(
+            {"model": model.get_name(), "config": config, "prompt": prompt, "context": ctx},
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.blake2b(header.encode(), digest_size=32)
+        files = context.get("files") or {}
+        for name in sorted(files):
+            # Length-prefixed so file boundaries are unambiguous
+            data = files[name].encode()
+            digest.update(f"\0{name}\0{len(data)}\0".encode())
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> GenerationResult | None:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached GenerationResult, or None on a miss
+        """
+        if self.mode in ("disabled", "write-only"):
+            return None
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            return None
+        return GenerationResult(
+            content=data["content"],
+            model=data["model"],
+            usage=data.get("usage"),
+            finish_reason=data.get("finish_reason"),
+        )
+
+    def put(self, key: str, result: GenerationResult) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from make_key
+            result: Generation result to store (raw_response is not kept)
+        """
+        if self.mode in ("disabled", "replay"):
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "content": result.content,
+            "model": result.model,
+            "usage": result.usage,
+            "finish_reason": result.finish_reason,
+        }
+        # Write then rename so concurrent readers never see a partial entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, path)
+
+
+class CachedModel(ModelInterface):
+    """Model wrapper that serves generations through a ResponseCache.
+
+    Shares the wrapped model's config object, so changes such as per-task
+    timeouts apply to both.
+    """
+
+    def __init__(self, model: ModelInterface, cache: ResponseCache):
+        """Initialize the cached model.
+
+        Args:
+            model: Model to delegate generation to
+            cache: Response cache to consult
+        """
+        super().__init__(model.config)
+        self.model = model
+        self.cache = cache
+
+    def generate(self, prompt: str, context: dict[str, Any] | None = None) -> GenerationResult:
+        """Return a cached response or generate and cache a new one."""
+        key = self.cache.make_key(self.model, prompt, context)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        if self.cache.mode == "replay":
+            raise ModelError(f"No cached response for {self.model.get_name()} (key {key[:16]})")
+
+        result = self.model.generate(prompt, context)
+        self.cache.put(key, result)
+        return result
+
+    def is_available(self) -> bool:
+        """Check if the wrapped model is available."""
+        return self.model.is_available()
+
+    def get_name(self) -> str:
+        """Get the wrapped model's display name."""
+        return self.model.get_name()
+
+    def get_config(self) -> dict[str, Any]:
+        """Get the wrapped model's configuration."""
+        return self.model.get_config()
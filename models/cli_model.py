@@ -3,6 +3,7 @@
 import json
 import subprocess
 import shutil
+from pathlib import Path
 from typing import Any
 
 from models.base import (
@@ -98,8 +99,6 @@ class CLIModel(ModelInterface):
         - mock:echo - Echoes back the prompt
         - mock:solution - Returns the solution patch from task directory
         """
-        from pathlib import Path
-
         mode = self.config.model_id
 
         if mode == "fail":
@@ -127,7 +126,6 @@ class CLIModel(ModelInterface):
             task_json = task_path / "task.json"
             is_synthetic = False
             if task_json.exists():
-                import json
                 task_data = json.loads(task_json.read_text())
                 is_synthetic = task_data.get("commit") == "synthetic"
 
@@ -242,11 +240,15 @@ class CLIModel(ModelInterface):
                     content = msg.get("content", "")
                     parts.append(f"{role}: {content}\n")
 
-            # Add file contents
+            # Add file contents, emitting identical files once under all
+            # of their names
             if "files" in context:
                 parts.append("Files:\n")
+                aliases: dict[str, list[str]] = {}
                 for filename, content in context["files"].items():
-                    parts.append(f"\n--- {filename} ---\n{content}\n")
+                    aliases.setdefault(content, []).append(filename)
+                for content, filenames in aliases.items():
+                    parts.append(f"\n--- {', '.join(filenames)} ---\n{content}\n")
 
         parts.append(f"User: {prompt}")
 
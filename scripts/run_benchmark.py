@@ -9,9 +9,10 @@ from pathlib import Path
 import click
 
 from evaluation.runner import EvaluationRunner
-from evaluation.report import ReportGenerator
-from harness.sandbox import SandboxConfig
+from evaluation.report import ReportGenerator, append_result
+from harness.sandbox import SandboxConfig, SandboxPool
 from models.base import create_model, ModelError
+from models.cache import CACHE_MODES, DEFAULT_CACHE_DIR
 
 
 def discover_tasks(
@@ -76,6 +77,9 @@ def run_benchmark_for_model(
     output_dir: Path,
     timeout: int,
     verbose: bool,
+    cache_mode: str = "disabled",
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    sandbox_pool: SandboxPool | None = None,
 ) -> tuple[int, int]:
     """Run benchmark for a single model.
 
@@ -85,6 +89,9 @@ def run_benchmark_for_model(
         output_dir: Directory for results
         timeout: Execution timeout
         verbose: Enable verbose output
+        cache_mode: Model response cache mode
+        cache_dir: Model response cache directory
+        sandbox_pool: Optional pool for reusing task sandboxes across models
 
     Returns:
         Tuple of (passed, failed) counts
@@ -119,12 +126,15 @@ def run_benchmark_for_model(
             model=model,
             sandbox_config=sandbox_config,
             verbose=verbose,
+            cache_mode=cache_mode,
+            cache_dir=cache_dir,
+            sandbox_pool=sandbox_pool,
+            log_dir=output_dir / "logs",
         )
 
         result = runner.run()
 
         # Save result
-        result_file = output_dir / f"{task_id}_{model_string.replace(':', '_')}.json"
         result_dict = {
             "task_id": result.task_id,
             "model_name": result.model_name,
@@ -134,8 +144,7 @@ def run_benchmark_for_model(
             "error": result.error,
             "metadata": result.metadata,
         }
-        with open(result_file, "w") as f:
-            json.dump(result_dict, f, indent=2)
+        append_result(output_dir, result_dict)
 
         if result.success:
             click.echo(click.style(" PASSED", fg="green"))
@@ -164,6 +173,10 @@ def run_benchmark_for_model(
 @click.option("--timeout", default=120, type=int, help="Default execution timeout per task (overridden by task-specific timeouts)")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 @click.option("--report/--no-report", default=True, help="Generate HTML report")
+@click.option("--cache-mode", type=click.Choice(CACHE_MODES), default="disabled",
+              help="Model response cache mode")
+@click.option("--cache-dir", type=click.Path(path_type=Path), default=DEFAULT_CACHE_DIR,
+              help="Model response cache directory")
 def main(
     model: tuple[str, ...],
     tasks_dir: Path,
@@ -174,6 +187,8 @@ def main(
     timeout: int,
     verbose: bool,
     report: bool,
+    cache_mode: str,
+    cache_dir: Path,
 ):
     """Run the benchmark suite.
 
@@ -202,24 +217,28 @@ def main(
     click.echo(f"Output: {output_dir}")
     click.echo("=" * 60)
 
-    # Run benchmark for each model
+    # Run benchmark for each model, reusing task sandboxes between models
     all_results = {}
-    for model_string in model:
-        click.echo(f"\nModel: {model_string}")
-        click.echo("-" * 40)
-
-        passed, failed = run_benchmark_for_model(
-            model_string=model_string,
-            tasks=tasks,
-            output_dir=output_dir,
-            timeout=timeout,
-            verbose=verbose,
-        )
-
-        all_results[model_string] = {"passed": passed, "failed": failed}
-        total = passed + failed
-        if total > 0:
-            click.echo(f"  Results: {passed}/{total} passed ({100*passed/total:.1f}%)")
+    with SandboxPool() as sandbox_pool:
+        for model_string in model:
+            click.echo(f"\nModel: {model_string}")
+            click.echo("-" * 40)
+
+            passed, failed = run_benchmark_for_model(
+                model_string=model_string,
+                tasks=tasks,
+                output_dir=output_dir,
+                timeout=timeout,
+                verbose=verbose,
+                cache_mode=cache_mode,
+                cache_dir=cache_dir,
+                sandbox_pool=sandbox_pool if len(model) > 1 else None,
+            )
+
+            all_results[model_string] = {"passed": passed, "failed": failed}
+            total = passed + failed
+            if total > 0:
+                click.echo(f"  Results: {passed}/{total} passed ({100*passed/total:.1f}%)")
 
     # Generate report
     click.echo("\n" + "=" * 60)
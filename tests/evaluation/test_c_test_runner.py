@@ -0,0 +1,34 @@
+"""Tests for the C test runner."""
+
+import pytest
+
+import evaluation.c_test_runner as c_test_runner_module
+
+
+@pytest.fixture
+def runner():
+    # Imported via the module so pytest does not collect CTestRunner itself
+    return c_test_runner_module.CTestRunner(sandbox=None)
+
+
+class TestParseTestOutput:
+    """Tests for parsing C test output formats."""
+
+    def test_results_line(self, runner):
+        """Test the Quake "Results: X/Y tests passed" format."""
+        assert runner._parse_test_output("Results: 7/9 tests passed\n") == (7, 2, 9)
+
+    def test_passed_failed(self, runner):
+        """Test the "X passed, Y failed" format."""
+        assert runner._parse_test_output("4 passed, 1 failed\n") == (4, 1, 5)
+
+    def test_pass_fail_lines(self, runner):
+        """Test PASS/FAIL lines are counted case-insensitively."""
+        output = "PASS test_a\n  pass test_b\nFAIL test_c\nPASSWORD prompt\n"
+        assert runner._parse_test_output(output) == (2, 1, 3)
+
+    def test_compilation_error(self, runner):
+        """Test compiler errors are detected."""
+        output = "r_bsp.c:10:5: error: expected ';' before '}' token\n"
+        assert runner._check_compilation_error(output) == "error: expected ';' before '}' token"
+        assert runner._check_compilation_error("gcc -o test test.c\n") is None
@@ -0,0 +1,283 @@
+"""Tests for results aggregation and report generation."""
+
+import json
+import re
+from html import unescape
+
+import pytest
+
+import evaluation.report as report_module
+from evaluation.report import RESULTS_FILE, ReportGenerator, append_result
+
+
+def _result(model="model-a", success=True, score=1.0, category="bug-fix", tier=1):
+    return {
+        "task_id": f"{category}-{tier}-{score}",
+        "model_name": model,
+        "success": success,
+        "score": score,
+        "metadata": {"task_category": category, "task_tier": tier},
+    }
+
+
+class TestCalculateModelScore:
+    """Tests for ReportGenerator.calculate_model_score."""
+
+    def test_totals(self, tmp_path):
+        """Test overall pass/fail counts and averages."""
+        gen = ReportGenerator(tmp_path)
+        results = [_result(score=1.0), _result(success=False, score=0.5)]
+
+        score = gen.calculate_model_score("model-a", results)
+
+        assert score.total_tasks == 2
+        assert score.passed == 1
+        assert score.failed == 1
+        assert score.pass_rate == 0.5
+        assert score.avg_score == pytest.approx(0.75)
+
+    def test_by_category_and_tier(self, tmp_path):
+        """Test per-category and per-tier breakdowns."""
+        gen = ReportGenerator(tmp_path)
+        results = [
+            _result(category="bug-fix", tier=1, score=1.0),
+            _result(category="bug-fix", tier=2, success=False, score=0.0),
+            _result(category="feature", tier=2, score=0.5),
+        ]
+
+        score = gen.calculate_model_score("model-a", results)
+
+        assert score.by_category["bug-fix"]["total"] == 2
+        assert score.by_category["bug-fix"]["passed"] == 1
+        assert score.by_category["bug-fix"]["pass_rate"] == 0.5
+        assert score.by_category["feature"]["avg_score"] == pytest.approx(0.5)
+        assert score.by_tier[2]["total"] == 2
+        assert score.by_tier[2]["avg_score"] == pytest.approx(0.25)
+
+    def test_missing_metadata(self, tmp_path):
+        """Test results without metadata fall back to defaults."""
+        gen = ReportGenerator(tmp_path)
+        results = [{"model_name": "model-a", "success": True, "score": 1.0, "metadata": None}]
+
+        score = gen.calculate_model_score("model-a", results)
+
+        assert score.by_category["unknown"]["total"] == 1
+        assert score.by_tier[0]["total"] == 1
+
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_vectorized_reduction_matches_python(self, tmp_path, monkeypatch, use_numba):
+        """Test the NumPy/Numba reduction agrees with the pure-Python one."""
+        pytest.importorskip("numpy")
+        if use_numba:
+            pytest.importorskip("numba")
+        else:
+            monkeypatch.setattr(report_module, "_get_reduce_kernel", lambda: None)
+        results = [
+            _result(category=cat, tier=tier, success=(i % 3 == 0), score=i / 10)
+            for i, (cat, tier) in enumerate(
+                [("bug-fix", 1), ("feature", 2), ("bug-fix", 3), ("perf", 1)] * 5
+            )
+        ]
+        expected = ReportGenerator(tmp_path).calculate_model_score("model-a", results)
+
+        monkeypatch.setattr(report_module, "_VECTORIZE_THRESHOLD", 0)
+        score = ReportGenerator(tmp_path).calculate_model_score("model-a", results)
+
+        assert score.passed == expected.passed
+        assert score.avg_score == pytest.approx(expected.avg_score)
+        assert list(score.by_category) == list(expected.by_category)
+        for tier, stats in expected.by_tier.items():
+            assert score.by_tier[tier] == pytest.approx(stats)
+
+    def test_empty(self, tmp_path):
+        """Test empty result sets produce zeroed scores."""
+        score = ReportGenerator(tmp_path).calculate_model_score("model-a", [])
+
+        assert score.total_tasks == 0
+        assert score.pass_rate == 0
+        assert score.avg_score == 0.0
+
+    def test_same_tasks_different_outcomes(self, tmp_path):
+        """Test scores reflect each call's results, not an earlier call with the same tasks."""
+        gen = ReportGenerator(tmp_path)
+        passing = [{**_result(), "task_id": "t1"}, {**_result(), "task_id": "t2"}]
+        failing = [{**r, "success": False, "score": 0.25} for r in passing]
+
+        first = gen.calculate_model_score("model-a", passing)
+        second = gen.calculate_model_score("model-a", failing)
+
+        assert (first.passed, first.avg_score) == (2, 1.0)
+        assert (second.passed, second.avg_score) == (0, 0.25)
+
+
+class TestGenerateReport:
+    """Tests for end-to-end report generation."""
+
+    def test_generate_report(self, tmp_path):
+        """Test results on disk are loaded and ranked."""
+        for i, res in enumerate([_result("model-a"), _result("model-b", success=False, score=0.0)]):
+            (tmp_path / f"result_{i}.json").write_text(json.dumps(res))
+
+        report = ReportGenerator(tmp_path).generate_report(run_id="run1")
+
+        assert report.run_id == "run1"
+        assert report.total_tasks == 2
+        assert [m.model_name for m in report.models] == ["model-a", "model-b"]
+
+    def test_report_rebuilt_when_results_change(self, tmp_path):
+        """Test a cached report is not reused once result files change."""
+        (tmp_path / "result_0.json").write_text(json.dumps(_result("model-a")))
+        gen = ReportGenerator(tmp_path)
+
+        first = gen.generate_report(run_id="run1")
+        assert first.models[0].passed == 1
+
+        (tmp_path / "result_1.json").write_text(
+            json.dumps(_result("model-a", success=False, score=0.0, tier=2))
+        )
+        second = gen.generate_report(run_id="run2")
+
+        assert second.models[0].total_tasks == 2
+        assert second.models[0].passed == 1
+
+    def test_report_reused_when_results_unchanged(self, tmp_path, monkeypatch):
+        """Test unchanged result files skip reloading."""
+        (tmp_path / "result_0.json").write_text(json.dumps(_result("model-a")))
+        gen = ReportGenerator(tmp_path)
+        first = gen.generate_report(run_id="run1")
+
+        def fail_load():
+            raise AssertionError("results reloaded")
+
+        monkeypatch.setattr(gen, "load_results", fail_load)
+        second = gen.generate_report(run_id="run2")
+
+        assert second.run_id == "run2"
+        assert second.models == first.models
+
+    def test_results_jsonl_sink(self, tmp_path):
+        """Test appended JSONL results load alongside per-task files."""
+        (tmp_path / "result_0.json").write_text(json.dumps(_result("model-a")))
+        append_result(tmp_path, _result("model-a", success=False, score=0.0))
+        path = append_result(tmp_path, _result("model-b"))
+        with open(path, "ab") as f:
+            f.write(b'{"task_id": "trunc')  # interrupted writer
+
+        assert path.name == RESULTS_FILE
+        assert len(path.read_bytes().splitlines()) == 3
+
+        report = ReportGenerator(tmp_path).generate_report(run_id="run1")
+
+        assert report.total_tasks == 3
+        assert {m.model_name: m.total_tasks for m in report.models} == {
+            "model-a": 2,
+            "model-b": 1,
+        }
+
+    def test_missing_results_dir(self, tmp_path):
+        """Test a missing results directory yields an empty report."""
+        report = ReportGenerator(tmp_path / "missing").generate_report()
+
+        assert report.total_tasks == 0
+        assert report.models == []
+
+    def test_save_report_writes_tasks_sidecar(self, tmp_path):
+        """Test task results are written as JSON Lines next to the report."""
+        results_dir = tmp_path / "results"
+        results_dir.mkdir()
+        (results_dir / "result_0.json").write_text(json.dumps(_result("model-a")))
+        gen = ReportGenerator(results_dir)
+        report = gen.generate_report(run_id="run1")
+
+        output_path = tmp_path / "report.json"
+        gen.save_report(report, output_path)
+
+        saved = json.loads(output_path.read_text())
+        tasks_path = tmp_path / "report.tasks.jsonl"
+        assert saved["tasks_file"] == str(tasks_path)
+        lines = tasks_path.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == report.task_results
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_save_report_pretty(self, tmp_path, monkeypatch, pretty, use_orjson):
+        """Test JSON reports are compact unless pretty output is requested."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(report_module, "orjson", None)
+        gen = ReportGenerator(tmp_path)
+        report = gen.generate_report(run_id="run1")
+        report.models.append(gen.calculate_model_score("model-a", [_result(tier=2)]))
+
+        output_path = tmp_path / "out" / "report.json"
+        output_path.parent.mkdir()
+        gen.save_report(report, output_path, pretty=pretty)
+
+        text = output_path.read_text()
+        assert ("\n" in text) == pretty
+        assert json.loads(text)["models"][0]["by_tier"]["2"]["total"] == 1
+
+
+class TestHTMLReport:
+    """Tests for HTML report rendering."""
+
+    def test_render_html(self, tmp_path):
+        """Test the leaderboard and category tables are rendered."""
+        (tmp_path / "result_0.json").write_text(json.dumps(_result("model-a")))
+        gen = ReportGenerator(tmp_path)
+        report = gen.generate_report(run_id="run1")
+
+        html = gen.generate_html(report)
+
+        assert "<title>Game Development Benchmark - run1</title>" in html
+        assert '<td class="pass-rate high">100.0%</td>' in html
+        assert "model-a - By Category" in html
+        assert html.rstrip().endswith("</html>")
+
+    def test_template_matches_renderer(self, tmp_path):
+        """Test the Jinja template and string renderer produce the same content."""
+        (tmp_path / "result_0.json").write_text(
+            json.dumps(_result("<b>model</b> & 'co'", category="<script>", score=0.66666))
+        )
+        (tmp_path / "result_1.json").write_text(json.dumps(_result("model-b", success=False)))
+        gen = ReportGenerator(tmp_path)
+        report = gen.generate_report(run_id="run<1>")
+
+        def normalize(page):
+            page = re.sub(r"\s*(<[^>]*>)\s*", r"\1", page)
+            return unescape(re.sub(r"\s+", " ", page))
+
+        rendered = gen.generate_html(report)
+        templated = gen.generate_html(report, use_template=True)
+
+        assert "<b>model</b>" not in rendered
+        assert "<b>model</b>" not in templated
+        assert normalize(rendered) == normalize(templated)
+
+
+class TestAggregateByModel:
+    """Tests for ReportGenerator.aggregate_by_model."""
+
+    def test_single_model(self, tmp_path):
+        """Test results from one model are grouped under that model."""
+        results = [_result("model-a"), _result("model-a", score=0.5)]
+
+        by_model = ReportGenerator(tmp_path).aggregate_by_model(results)
+
+        assert list(by_model) == ["model-a"]
+        assert by_model["model-a"] == results
+
+    def test_multiple_models(self, tmp_path):
+        """Test results are split per model in first-seen order."""
+        results = [_result("model-a"), _result("model-b"), _result("model-a", score=0.5)]
+
+        by_model = ReportGenerator(tmp_path).aggregate_by_model(results)
+
+        assert list(by_model) == ["model-a", "model-b"]
+        assert len(by_model["model-a"]) == 2
+        assert len(by_model["model-b"]) == 1
+
+    def test_empty(self, tmp_path):
+        """Test no results produce no groups."""
+        assert ReportGenerator(tmp_path).aggregate_by_model([]) == {}
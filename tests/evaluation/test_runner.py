@@ -0,0 +1,354 @@
+"""Tests for the main evaluation runner."""
+
+import json
+
+import pytest
+
+import evaluation.runner as runner_module
+from evaluation.c_parser import parse_c_code_blocks
+from evaluation.runner import EvaluationRunner
+from harness.sandbox import Sandbox, SandboxConfig, SandboxPool
+from models.base import GenerationResult, ModelConfig, ModelError, ModelInterface
+
+
+class StubModel(ModelInterface):
+    """Model stub returning a fixed response."""
+
+    def __init__(self, content="```python main.py\nprint('fixed')\n```", fail=False):
+        super().__init__(ModelConfig(name="stub", provider="mock", model_id="stub"))
+        self.content = content
+        self.fail = fail
+        self.calls = 0
+
+    def generate(self, prompt, context=None):
+        self.calls += 1
+        if self.fail:
+            raise ModelError("stub model called")
+        return GenerationResult(content=self.content, model="stub")
+
+    def is_available(self):
+        return True
+
+
+@pytest.fixture
+def task_dir(tmp_path):
+    """Minimal pygame task with no test phase."""
+    task = tmp_path / "task"
+    (task / "game").mkdir(parents=True)
+    (task / "game" / "main.py").write_text("print('broken')\n")
+    (task / "prompt.md").write_text("Fix the game.")
+    (task / "task.json").write_text(json.dumps({
+        "id": "pong-999",
+        "name": "Stub task",
+        "category": "bug-fix",
+        "tier": 1,
+        "engine": "pygame",
+        "description": "Stub",
+        "evaluation": ["gameplay"],
+    }))
+    return task
+
+
+class TestCheckpoints:
+    """Tests for checkpoint/resume support."""
+
+    def test_checkpoint_written(self, task_dir, tmp_path):
+        """Test each phase is recorded in the checkpoint."""
+        runner = EvaluationRunner(task_dir, StubModel(), checkpoint_dir=tmp_path / "ckpt")
+
+        result = runner.run()
+
+        assert result.error is None
+        checkpoint = json.loads((tmp_path / "ckpt" / "pong-999_mock_stub.ckpt.json").read_text())
+        assert checkpoint["stage"] == "evaluated"
+        assert checkpoint["changes"] == {"main.py": "print('fixed')"}
+        assert "print('fixed')" in checkpoint["model_response"]
+
+    def test_resume_skips_model(self, task_dir, tmp_path):
+        """Test resuming reuses the checkpointed model response."""
+        EvaluationRunner(task_dir, StubModel(), checkpoint_dir=tmp_path / "ckpt").run()
+
+        model = StubModel(fail=True)
+        result = EvaluationRunner(
+            task_dir, model, checkpoint_dir=tmp_path / "ckpt", resume=True
+        ).run()
+
+        assert model.calls == 0
+        assert result.error is None
+        assert result.applied_changes == {"main.py": "print('fixed')"}
+
+    def test_resume_skips_evaluation(self, task_dir, tmp_path, monkeypatch):
+        """Test resuming a finished evaluation reuses the stored phase results."""
+        first = EvaluationRunner(task_dir, StubModel(), checkpoint_dir=tmp_path / "ckpt").run()
+
+        calls = []
+        monkeypatch.setattr(
+            EvaluationRunner, "run_evaluation_phases", lambda self, sandbox: calls.append(sandbox)
+        )
+        result = EvaluationRunner(
+            task_dir, StubModel(fail=True), checkpoint_dir=tmp_path / "ckpt", resume=True
+        ).run()
+
+        assert calls == []
+        assert result.error is None
+        assert result.score == first.score
+        checkpoint = json.loads((tmp_path / "ckpt" / "pong-999_mock_stub.ckpt.json").read_text())
+        assert checkpoint["stage"] == "evaluated"
+
+    def test_no_resume_regenerates(self, task_dir, tmp_path):
+        """Test checkpoints are ignored unless resuming."""
+        EvaluationRunner(task_dir, StubModel(), checkpoint_dir=tmp_path / "ckpt").run()
+
+        model = StubModel()
+        EvaluationRunner(task_dir, model, checkpoint_dir=tmp_path / "ckpt").run()
+
+        assert model.calls == 1
+
+
+class TestParseCodeBlocks:
+    """Tests for EvaluationRunner.parse_code_blocks."""
+
+    @pytest.fixture
+    def runner(self, tmp_path):
+        return EvaluationRunner(tmp_path, StubModel())
+
+    def test_python_block_with_filename(self, runner):
+        """Test ```python filename.py blocks."""
+        response = "Here is the fix:\n```python game.py\nx = 1\n```\nDone."
+        assert runner.parse_code_blocks(response) == {"game.py": "x = 1"}
+
+    def test_no_fences(self, runner):
+        """Test responses without code blocks yield no changes."""
+        assert runner.parse_code_blocks("I could not find the bug.") == {}
+        assert parse_c_code_blocks("I could not find the bug.") == {}
+
+    def test_bare_block_defaults_to_main(self, runner):
+        """Test blocks without a filename default to main.py."""
+        assert runner.parse_code_blocks("```python\nx = 1\n```") == {"main.py": "x = 1"}
+        assert runner.parse_code_blocks("```\nx = 1\n```") == {"main.py": "x = 1"}
+
+    def test_filename_from_comment(self, runner):
+        """Test the filename can come from a leading comment."""
+        response = "```python\n# File: player.py\nx = 1\n```"
+        assert runner.parse_code_blocks(response) == {"player.py": "# File: player.py\nx = 1"}
+
+    def test_multiple_blocks(self, runner):
+        """Test several files in one response."""
+        response = "```python a.py\na = 1\n```\ntext\n```python b.py\nb = 2\n```"
+        assert runner.parse_code_blocks(response) == {"a.py": "a = 1", "b.py": "b = 2"}
+
+    def test_other_languages_skipped(self, runner):
+        """Test non-Python blocks do not shift fence pairing."""
+        response = "```bash\npip install pygame\n```\n```python main.py\nx = 1\n```"
+        assert runner.parse_code_blocks(response) == {"main.py": "x = 1"}
+
+    def test_inline_backticks_ignored(self, runner):
+        """Test inline triple backticks are not treated as fences."""
+        response = "Use ```x``` inline.\n```python main.py\nx = 1\n```"
+        assert runner.parse_code_blocks(response) == {"main.py": "x = 1"}
+
+    def test_unclosed_and_empty(self, runner):
+        """Test unclosed fences and plain text yield no changes."""
+        assert runner.parse_code_blocks("```python main.py\nx = 1\n") == {}
+        assert runner.parse_code_blocks("no code here") == {}
+        assert runner.parse_code_blocks("`" * 5000) == {}
+
+
+class TestBuildContext:
+    """Tests for context building from sandbox files."""
+
+    def test_python_context_reads_all_files(self, tmp_path):
+        """Test every Python file in the game tree is included."""
+        game_dir = tmp_path / "game"
+        (game_dir / "pkg").mkdir(parents=True)
+        for i in range(12):
+            (game_dir / "pkg" / f"mod{i}.py").write_text(f"x = {i}\n")
+        (game_dir / "main.py").write_text("import pkg\n")
+        sandbox = type("FakeSandbox", (), {"game_dir": game_dir})()
+
+        context = EvaluationRunner(tmp_path, StubModel())._build_python_context(sandbox)
+
+        assert len(context["files"]) == 13
+        assert context["files"]["main.py"] == "import pkg\n"
+        assert context["files"]["pkg/mod11.py"] == "x = 11\n"
+
+    def test_c_context_reads_sources_and_headers(self, tmp_path):
+        """Test C sources and headers are included, other files are not."""
+        game_dir = tmp_path / "game"
+        game_dir.mkdir()
+        (game_dir / "main.c").write_text("int main(void) { return 0; }\n")
+        (game_dir / "game.h").write_text("#define X 1\n")
+        (game_dir / "Makefile").write_text("all:\n")
+        sandbox = type("FakeSandbox", (), {"game_dir": game_dir})()
+
+        context = EvaluationRunner(tmp_path, StubModel())._build_c_context(sandbox)
+
+        assert sorted(context["files"]) == ["game.h", "main.c"]
+
+    def test_skips_vcs_and_build_dirs(self, tmp_path):
+        """Test .git, __pycache__, build and venv directories are not searched."""
+        game_dir = tmp_path / "game"
+        for name in (".git", "__pycache__", "build", ".venv"):
+            (game_dir / name).mkdir(parents=True)
+            (game_dir / name / "stale.py").write_text("x = 0\n")
+        (game_dir / "main.py").write_text("x = 1\n")
+        sandbox = type("FakeSandbox", (), {"game_dir": game_dir})()
+
+        context = EvaluationRunner(tmp_path, StubModel())._build_python_context(sandbox)
+
+        assert list(context["files"]) == ["main.py"]
+
+    def test_unchanged_files_served_from_cache(self, tmp_path, monkeypatch):
+        """Test unchanged files are not re-read; edited ones are."""
+        game_dir = tmp_path / "game"
+        game_dir.mkdir()
+        (game_dir / "main.py").write_text("x = 1\n")
+        sandbox = type("FakeSandbox", (), {"game_dir": game_dir})()
+        runner = EvaluationRunner(tmp_path, StubModel())
+        runner._build_python_context(sandbox)
+
+        def fail_read(path):
+            raise AssertionError(f"re-read {path}")
+
+        monkeypatch.setattr(runner_module, "_read_utf8", fail_read)
+        assert runner._build_python_context(sandbox)["files"] == {"main.py": "x = 1\n"}
+
+        monkeypatch.undo()
+        (game_dir / "main.py").write_text("x = 22\n")
+        assert runner._build_python_context(sandbox)["files"] == {"main.py": "x = 22\n"}
+
+    def test_invalid_utf8_is_replaced(self, tmp_path):
+        """Test undecodable bytes are replaced instead of dropping the file."""
+        game_dir = tmp_path / "game"
+        game_dir.mkdir()
+        (game_dir / "main.c").write_bytes(b"/* \xff */\n")
+        sandbox = type("FakeSandbox", (), {"game_dir": game_dir})()
+
+        context = EvaluationRunner(tmp_path, StubModel())._build_c_context(sandbox)
+
+        assert context["files"]["main.c"] == "/* \ufffd */\n"
+
+    def test_files_to_modify_keeps_other_files(self, task_dir):
+        """Test files outside files_to_modify are still sent as context."""
+        game_dir = task_dir / "game"
+        (game_dir / "helpers.py").write_text("y = 2\n")
+        data = json.loads((task_dir / "task.json").read_text())
+        data["files_to_modify"] = ["main.py"]
+        (task_dir / "task.json").write_text(json.dumps(data))
+        sandbox = type("FakeSandbox", (), {"game_dir": game_dir})()
+        runner = EvaluationRunner(task_dir, StubModel())
+        runner.load_task()
+
+        context = runner.build_context(sandbox)
+
+        assert sorted(context["files"]) == ["helpers.py", "main.py"]
+        assert context["files"]["helpers.py"] == "y = 2\n"
+        assert not any(callable(value) for value in context.values())
+
+
+class TestCalculateScore:
+    """Tests for combining phase results into a task score."""
+
+    def test_averages_phases(self, tmp_path):
+        """Test test pass rate and pass/fail phases are averaged."""
+        runner = EvaluationRunner(tmp_path, StubModel())
+        score = runner.calculate_score({
+            "test": {"passed": 1, "total": 4},
+            "gameplay": {"success": True},
+            "performance": {"status": "failed"},
+        })
+        assert score == pytest.approx((0.25 + 1.0 + 0.0) / 3)
+
+    def test_ignores_empty_and_placeholder_phases(self, tmp_path):
+        """Test phases without data do not count toward the average."""
+        runner = EvaluationRunner(tmp_path, StubModel())
+        assert runner.calculate_score({}) == 0.0
+        assert runner.calculate_score({
+            "test": {"passed": 0, "total": 0},
+            "gameplay": {"status": "not_implemented"},
+            "performance": None,
+        }) == 0.0
+
+
+class TestOutputTail:
+    """Tests for trimming long test output."""
+
+    def test_short_output_kept(self, task_dir, tmp_path):
+        """Test output under the limit is stored as is."""
+        runner = EvaluationRunner(task_dir, StubModel(), log_dir=tmp_path / "logs")
+        runner.load_task()
+
+        assert runner._output_tail("1 passed") == "1 passed"
+        assert not (tmp_path / "logs").exists()
+
+    def test_long_output_logged(self, task_dir, tmp_path):
+        """Test long output keeps its tail and is logged in full."""
+        runner = EvaluationRunner(task_dir, StubModel(), log_dir=tmp_path / "logs")
+        runner.load_task()
+        output = "x" * 10000 + "\n3 failed, 2 passed"
+
+        tail = runner._output_tail(output)
+
+        assert tail.endswith("3 failed, 2 passed")
+        assert len(tail) < 5000
+        log_path = tmp_path / "logs" / "pong-999_mock_stub.log"
+        assert str(log_path) in tail
+        assert log_path.read_text() == output
+
+
+class TestLoadTask:
+    """Tests for task and prompt loading."""
+
+    def test_load_task_and_prompt(self, task_dir):
+        """Test task.json and prompt.md are parsed."""
+        runner = EvaluationRunner(task_dir, StubModel())
+
+        config = runner.load_task()
+
+        assert config.id == "pong-999"
+        assert config.timeout == 60
+        assert runner.load_prompt() == "Fix the game."
+
+    def test_reload_after_edit(self, task_dir):
+        """Test edited task files are not served from the cache."""
+        runner = EvaluationRunner(task_dir, StubModel())
+        runner.load_task()
+        runner.load_prompt()
+
+        data = json.loads((task_dir / "task.json").read_text())
+        data["timeout"] = 5
+        (task_dir / "task.json").write_text(json.dumps(data))
+        (task_dir / "prompt.md").write_text("Fix the game, please.")
+
+        assert EvaluationRunner(task_dir, StubModel()).load_task().timeout == 5
+        assert EvaluationRunner(task_dir, StubModel()).load_prompt() == "Fix the game, please."
+
+    def test_edit_replaces_cache_entry(self, task_dir):
+        """Test each task file keeps a single cache entry across edits."""
+        task_json = task_dir / "task.json"
+        key = str(task_json.resolve())
+        EvaluationRunner(task_dir, StubModel()).load_task()
+        size = len(runner_module._TASK_CACHE)
+
+        data = json.loads(task_json.read_text())
+        data["timeout"] = 5
+        task_json.write_text(json.dumps(data))
+        EvaluationRunner(task_dir, StubModel()).load_task()
+
+        assert len(runner_module._TASK_CACHE) == size
+        assert runner_module._TASK_CACHE[key][1].timeout == 5
+
+
+class TestSandboxReuse:
+    """Tests for running evaluations against a sandbox pool."""
+
+    def test_pooled_sandbox_reset_between_runs(self, task_dir):
+        """Test a pooled sandbox is returned and reset for the next run."""
+        with SandboxPool() as pool:
+            result = EvaluationRunner(task_dir, StubModel(), sandbox_pool=pool).run()
+            assert result.error is None
+            assert len(pool._sandboxes) == 1
+
+            sandbox = pool.acquire(Sandbox, SandboxConfig(), task_dir / "game")
+            assert (sandbox.game_dir / "main.py").read_text() == "print('broken')\n"
+            pool.release(sandbox, task_dir / "game")
@@ -0,0 +1,114 @@
+"""Tests for the pytest runner."""
+
+import subprocess
+import sys
+
+import pytest
+
+import evaluation.test_runner as test_runner_module
+
+
+@pytest.fixture
+def runner():
+    # Imported via the module so pytest does not collect TestRunner itself
+    return test_runner_module.TestRunner(sandbox=None)
+
+
+class TestParsePytestOutput:
+    """Tests for parsing pytest's text summary."""
+
+    def test_verbose_summary(self, runner):
+        """Test the final "=== ... in Ns ===" line is parsed."""
+        output = (
+            "tests/test_game.py::test_a PASSED\n"
+            "tests/test_game.py::test_b FAILED\n"
+            "=========== 1 failed, 3 passed, 1 skipped, 2 errors in 0.52s ===========\n"
+        )
+
+        result = runner._parse_pytest_output(output, 1, 0.5)
+
+        assert (result.passed, result.failed, result.skipped, result.errors) == (3, 1, 1, 2)
+        assert result.total == 7
+        assert not result.success
+
+    def test_quiet_summary_followed_by_stderr(self, runner):
+        """Test a summary without rules is found before trailing stderr."""
+        output = "..\n2 passed, 1 warning in 0.10s\nsome warning on stderr\n"
+
+        result = runner._parse_pytest_output(output, 0, 0.1)
+
+        assert result.passed == 2
+        assert result.total == 2
+        assert result.success
+
+    def test_counts_in_test_output_ignored(self, runner):
+        """Test numbers printed by tests do not leak into the counts."""
+        output = (
+            "captured: 99 passed checks\n"
+            "======================== 1 passed in 0.01s ========================\n"
+        )
+
+        assert runner._parse_pytest_output(output, 0, 0.0).passed == 1
+
+    def test_missing_summary(self, runner):
+        """Test output without a summary yields zero counts."""
+        result = runner._parse_pytest_output("Segmentation fault\n", -11, 0.0)
+
+        assert result.total == 0
+        assert not result.success
+
+
+class TestRun:
+    """Tests for running pytest in a sandbox directory."""
+
+    def test_output_streamed_to_log(self, tmp_path):
+        """Test results come from the JSON report and output from the log."""
+        (tmp_path / "game").mkdir()
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_sample.py").write_text(
+            "def test_ok():\n    pass\n\n"
+            "def test_bad():\n    print('diagnostic')\n    assert False\n"
+        )
+        sandbox = type(
+            "FakeSandbox", (), {"working_dir": tmp_path, "game_dir": tmp_path / "game"}
+        )()
+
+        result = test_runner_module.TestRunner(sandbox, timeout=60).run()
+
+        assert (result.passed, result.failed, result.total) == (1, 1, 2)
+        assert not result.success
+        assert "diagnostic" in result.output
+        assert result.output == (tmp_path / ".pytest_out.log").read_text()
+        assert result.test_cases is None
+
+        result = test_runner_module.TestRunner(sandbox, timeout=60, collect_cases=True).run()
+
+        assert sorted(case["outcome"] for case in result.test_cases) == ["failed", "passed"]
+
+    def test_runaway_output_killed(self, tmp_path, monkeypatch):
+        """Test a process flooding its log is killed at the size cap."""
+        monkeypatch.setattr(test_runner_module, "_MAX_OUTPUT_BYTES", 10_000)
+        monkeypatch.setattr(test_runner_module, "_OUTPUT_CHECK_INTERVAL", 0.01)
+        cmd = [sys.executable, "-c", "while True: print('x' * 1000, flush=True)"]
+
+        return_code, overflowed = test_runner_module._run_logged(
+            cmd, tmp_path, {}, tmp_path / "out.log", timeout=30
+        )
+
+        assert overflowed
+        assert return_code != 0
+
+    def test_timeout_kills_process(self, tmp_path):
+        """Test a hung process is killed at the deadline."""
+        cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            test_runner_module._run_logged(cmd, tmp_path, {}, tmp_path / "out.log", timeout=0.2)
+
+    def test_read_tail(self, tmp_path):
+        """Test only the last bytes of long output are read."""
+        path = tmp_path / "out.log"
+        path.write_bytes(b"a" * 100 + b"end")
+
+        assert test_runner_module._read_tail(path, limit=5) == "aaend"
+        assert test_runner_module._read_tail(tmp_path / "missing.log") == ""
@@ -0,0 +1,321 @@
+"""Tests for the C sandbox module."""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import harness.c_sandbox as c_sandbox_module
+from harness.c_sandbox import CSandbox, CSandboxConfig
+
+requires_gcc = pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc not installed")
+
+HELLO_C = '#include <stdio.h>\nint main(void) { puts("hello"); return 0; }\n'
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """Create a minimal C project."""
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "main.c").write_text(HELLO_C)
+    return source
+
+
+@pytest.fixture
+def spawned(monkeypatch):
+    """Replace subprocess.Popen in the sandbox; returns the (cmd, kwargs) calls."""
+    calls = []
+
+    class FakePopen:
+        def __init__(self, cmd, **kwargs):
+            calls.append((cmd, kwargs))
+            self.pid = 0
+            self.returncode = 0
+
+        def communicate(self, timeout=None):
+            return b"", b""
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return None
+
+    monkeypatch.setattr(c_sandbox_module.subprocess, "Popen", FakePopen)
+    return calls
+
+
+class TestRun:
+    """Tests for the _run subprocess helper."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX sleep")
+    def test_interrupt_kills_child(self, monkeypatch):
+        """Test an interrupted wait kills the child instead of hanging on it."""
+        started = []
+
+        class InterruptedPopen(subprocess.Popen):
+            def communicate(self, input=None, timeout=None):
+                started.append(self)
+                raise KeyboardInterrupt
+
+        monkeypatch.setattr(c_sandbox_module.subprocess, "Popen", InterruptedPopen)
+
+        begin = time.monotonic()
+        with pytest.raises(KeyboardInterrupt):
+            c_sandbox_module._run(["sleep", "30"], timeout=60)
+
+        assert time.monotonic() - begin < 10
+        assert started[0].returncode is not None
+
+
+class TestCSandbox:
+    """Tests for the CSandbox class."""
+
+    @requires_gcc
+    def test_compile_and_run(self, source_dir):
+        """Test a program compiles and its output is captured."""
+        with CSandbox() as sandbox:
+            sandbox.setup(source_dir)
+            compiled = sandbox.compile()
+            assert compiled.success, compiled.stderr
+
+            result = sandbox.run_executable(compiled.executable_path)
+
+        assert result.success
+        assert result.stdout == "hello\n"
+
+    @requires_gcc
+    def test_invalid_utf8_output_replaced(self, tmp_path):
+        """Test output that is not valid UTF-8 is decoded with replacements."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "main.c").write_text(
+            '#include <stdio.h>\nint main(void) { fputs("\\xff!\\n", stdout); return 0; }\n'
+        )
+
+        with CSandbox(CSandboxConfig(use_ccache=False)) as sandbox:
+            sandbox.setup(source)
+            result = sandbox.run_executable(sandbox.compile().executable_path)
+
+        assert result.stdout == "\ufffd!\n"
+
+    @requires_gcc
+    def test_compile_multiple_sources(self, tmp_path):
+        """Test multi-file projects are compiled per file and linked."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "util.h").write_text("int answer(void);\n")
+        (source / "util.c").write_text('#include "util.h"\nint answer(void) { return 42; }\n')
+        (source / "main.c").write_text(
+            '#include <stdio.h>\n#include "util.h"\n'
+            'int main(void) { printf("%d\\n", answer()); return 0; }\n'
+        )
+
+        with CSandbox(CSandboxConfig(use_ccache=False)) as sandbox:
+            sandbox.setup(source)
+            compiled = sandbox.compile()
+            assert compiled.success, compiled.stderr
+
+            result = sandbox.run_executable(compiled.executable_path)
+
+        assert result.stdout == "42\n"
+
+    @requires_gcc
+    def test_compile_error_reported(self, tmp_path):
+        """Test a failing translation unit fails the build without linking."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "main.c").write_text(HELLO_C)
+        (source / "broken.c").write_text("int broken(void) { return }\n")
+
+        with CSandbox(CSandboxConfig(use_ccache=False)) as sandbox:
+            sandbox.setup(source)
+            compiled = sandbox.compile()
+
+        assert not compiled.success
+        assert compiled.executable_path is None
+        assert "broken.c" in compiled.stderr
+
+    @requires_gcc
+    def test_syntax_only(self, tmp_path):
+        """Test syntax_only reports errors without producing an executable."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "main.c").write_text(HELLO_C)
+
+        with CSandbox() as sandbox:
+            sandbox.setup(source)
+            checked = sandbox.compile(syntax_only=True)
+            assert checked.success, checked.stderr
+            assert checked.executable_path is None
+            assert not (sandbox.working_dir / "test_program").exists()
+
+            sandbox.apply_changes({"main.c": "int main(void) { return }\n"})
+            assert not sandbox.compile(syntax_only=True).success
+
+    def test_apply_changes_does_not_touch_source(self, source_dir):
+        """Test edits and resets never write through to the source directory."""
+        with CSandbox() as sandbox:
+            sandbox.setup(source_dir)
+            assert (sandbox.game_dir / "main.c").read_text() == HELLO_C
+
+            sandbox.apply_changes({"main.c": "int main(void) { return 1; }\n"})
+            assert (source_dir / "main.c").read_text() == HELLO_C
+            assert sandbox.get_changes() == {"main.c": "int main(void) { return 1; }\n"}
+
+            sandbox.reset()
+            assert (sandbox.game_dir / "main.c").read_text() == HELLO_C
+            assert sandbox.get_changes() == {}
+
+    def test_apply_changes_creates_directories(self, source_dir):
+        """Test new files in new subdirectories are written as UTF-8."""
+        with CSandbox() as sandbox:
+            sandbox.setup(source_dir)
+            sandbox.apply_changes(
+                {"src/a.c": "/* caf\u00e9 */\n", "src/a.h": "", "b.h": "int b;\n"}
+            )
+
+            assert (sandbox.game_dir / "src" / "a.c").read_bytes() == b"/* caf\xc3\xa9 */\n"
+            assert (sandbox.game_dir / "src" / "a.h").read_text() == ""
+            changes = sandbox.get_changes()
+
+        assert sorted(changes) == ["b.h", os.path.join("src", "a.c"), os.path.join("src", "a.h")]
+
+    def test_apply_unchanged_content_skips_write(self, source_dir):
+        """Test re-applying a file's setup() content does not touch it."""
+        with CSandbox() as sandbox:
+            sandbox.setup(source_dir)
+            main = sandbox.game_dir / "main.c"
+            mtime = main.stat().st_mtime_ns
+
+            sandbox.apply_changes({"main.c": HELLO_C})
+            assert main.stat().st_mtime_ns == mtime
+
+            sandbox.apply_changes({"main.c": "int main(void) { return 1; }\n"})
+            sandbox.apply_changes({"main.c": HELLO_C})
+            assert main.read_text() == HELLO_C
+
+    def test_get_changes_rereads_only_modified_files(self, source_dir, monkeypatch):
+        """Test get_changes serves unchanged files from the stat cache."""
+        (source_dir / "util.h").write_text("int answer(void);\n")
+        with CSandbox() as sandbox:
+            sandbox.setup(source_dir)
+            (sandbox.game_dir / "util.h").unlink()
+            (sandbox.game_dir / "util.h").write_text("int answer(int x);\n")
+
+            read = []
+            real_read_source = c_sandbox_module._read_source
+
+            def tracking_read_source(path):
+                read.append(os.path.basename(path))
+                return real_read_source(path)
+
+            monkeypatch.setattr(c_sandbox_module, "_read_source", tracking_read_source)
+            changes = sandbox.get_changes()
+
+        assert changes == {"util.h": "int answer(int x);\n"}
+        assert read == ["util.h"]
+
+    def test_binary_files_skipped(self, source_dir):
+        """Test files with NUL bytes are not tracked and bad UTF-8 is replaced."""
+        (source_dir / "blob.c").write_bytes(b"\x7fELF\0\0\0")
+        (source_dir / "latin1.h").write_bytes(b"/* caf\xe9 */\n")
+        with CSandbox() as sandbox:
+            sandbox.setup(source_dir)
+            (sandbox.game_dir / "blob.c").unlink()
+            (sandbox.game_dir / "blob.c").write_bytes(b"\0changed")
+
+            assert sandbox.get_changes() == {}
+            assert sandbox._original_files["latin1.h"] == "/* caf\ufffd */\n"
+
+    def test_spawn_does_not_close_fds(self, source_dir, spawned):
+        """Test subprocesses are spawned with close_fds=False and no stdin."""
+        with CSandbox(CSandboxConfig(use_ccache=False)) as sandbox:
+            sandbox.setup(source_dir)
+            sandbox.compile()
+            sandbox.run_executable(source_dir / "main.c")
+
+        assert len(spawned) == 2
+        for _, kwargs in spawned:
+            assert kwargs["stdin"] == subprocess.DEVNULL
+            if sys.platform != "win32":
+                assert kwargs["close_fds"] is False
+                assert kwargs["start_new_session"] is True
+
+    def test_compile_uses_pipe(self, source_dir, spawned):
+        """Test gcc is asked to pipe between stages instead of using temp files."""
+        with CSandbox(CSandboxConfig(use_ccache=False)) as sandbox:
+            sandbox.setup(source_dir)
+            sandbox.compile()
+
+        cmd = spawned[0][0]
+        assert os.path.basename(cmd[0]) == "gcc"
+        assert cmd[1] == "-pipe"
+
+    def test_compile_through_ccache(self, source_dir, spawned, monkeypatch):
+        """Test ccache wraps the compiler with paths hashed relative to the sandbox."""
+        monkeypatch.setattr(c_sandbox_module.shutil, "which", lambda name: f"/usr/bin/{name}")
+        with CSandbox() as sandbox:
+            sandbox.setup(source_dir)
+            sandbox.compile()
+            working_dir = sandbox.working_dir
+
+        cmd, kwargs = spawned[0]
+        assert cmd[0] == "/usr/bin/ccache"
+        assert os.path.basename(cmd[1]) == "gcc"
+        assert kwargs["env"]["CCACHE_BASEDIR"] == str(working_dir)
+        assert kwargs["env"]["CCACHE_NOHASHDIR"] == "1"
+
+    def test_env_built_once(self, source_dir, spawned):
+        """Test the subprocess environment is reused until the config changes."""
+        with CSandbox(CSandboxConfig(use_ccache=False, extra_env={"A": "1"})) as sandbox:
+            sandbox.setup(source_dir)
+            sandbox.compile()
+            sandbox.run_executable(source_dir / "main.c")
+            sandbox.run_executable(source_dir / "main.c", env={"B": "2"})
+            sandbox.config = CSandboxConfig(use_ccache=False, extra_env={"A": "3"})
+            sandbox.compile()
+
+        envs = [kwargs["env"] for _, kwargs in spawned]
+        assert envs[0] is envs[1]
+        assert envs[0]["A"] == "1"
+        assert envs[2]["B"] == "2" and "B" not in envs[0]
+        assert envs[3]["A"] == "3"
+
+    def test_temp_root(self, source_dir, tmp_path, spawned):
+        """Test sandboxes are created under temp_root and gcc scratch goes there."""
+        temp_root = tmp_path / "shm"
+        temp_root.mkdir()
+        with CSandbox(CSandboxConfig(use_ccache=False, temp_root=temp_root)) as sandbox:
+            sandbox.setup(source_dir)
+            sandbox.compile()
+            working_dir = sandbox.working_dir
+
+        assert working_dir.parent == temp_root
+        assert spawned[0][1]["env"]["TMPDIR"] == str(working_dir)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses process groups")
+    def test_timeout_kills_process_tree(self, tmp_path):
+        """Test a timeout kills grandchildren, not just the direct child."""
+        pid_file = tmp_path / "child.pid"
+        script = tmp_path / "spawn.sh"
+        script.write_text(f"#!/bin/sh\nsleep 30 &\necho $! > {pid_file}\nwait\n")
+        script.chmod(0o755)
+
+        sandbox = CSandbox(CSandboxConfig(timeout=1))
+        result = sandbox.run_executable(script)
+
+        assert not result.success
+        assert "timeout" in result.error
+        # A surviving grandchild would hold the output pipe open until it exits
+        assert result.elapsed_time < 10
+        child = int(pid_file.read_text())
+        time.sleep(0.1)
+        # Killed orphans may linger as zombies until init reaps them
+        stat = Path(f"/proc/{child}/stat")
+        assert not stat.exists() or stat.read_text().split(") ")[1].startswith("Z")
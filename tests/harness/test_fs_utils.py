@@ -0,0 +1,49 @@
+"""Tests for the filesystem helpers."""
+
+from harness.fs_utils import link_tree
+
+
+class TestLinkTree:
+    """Tests for hard-link based tree mirroring."""
+
+    def test_mirrors_tree(self, tmp_path):
+        """Test source files are linked and everything else is copied."""
+        src = tmp_path / "tests"
+        (src / "data").mkdir(parents=True)
+        (src / "test_game.py").write_text("def test(): pass\n")
+        (src / "test_math.c").write_text("int main(void) { return 0; }\n")
+        (src / "data" / "level.txt").write_text("###\n")
+        (src / "test_bin").write_text("binary")
+        (src / "test_bin").chmod(0o755)
+
+        dst = tmp_path / "sandbox" / "tests"
+        link_tree(src, dst)
+
+        assert (dst / "test_game.py").read_text() == "def test(): pass\n"
+        assert (dst / "data" / "level.txt").read_text() == "###\n"
+        for name in ("test_game.py", "test_math.c"):
+            assert (dst / name).stat().st_ino == (src / name).stat().st_ino
+        for name in ("data/level.txt", "test_bin"):
+            assert (dst / name).stat().st_ino != (src / name).stat().st_ino
+
+    def test_in_place_writes_stay_in_sandbox(self, tmp_path):
+        """Test rewriting build files and outputs in place leaves the task untouched."""
+        src = tmp_path / "tests"
+        src.mkdir()
+        shipped = {
+            "Makefile": "test:\n\tcc test.c\n",
+            "test.o": "\0obj",
+            "test.d": "test.o: test.c\n",
+            "expected.txt": "42\n",
+        }
+        for name, content in shipped.items():
+            (src / name).write_text(content)
+
+        dst = tmp_path / "sandbox" / "tests"
+        link_tree(src, dst)
+        for name in shipped:
+            with open(dst / name, "w") as f:
+                f.write("overwritten")
+
+        for name, content in shipped.items():
+            assert (src / name).read_text() == content
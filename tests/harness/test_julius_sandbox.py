@@ -0,0 +1,455 @@
+"""Tests for the Julius sandbox module."""
+
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+import harness.julius_sandbox as julius_sandbox_module
+from harness.julius_sandbox import JuliusSandbox, JuliusSandboxConfig
+
+
+@pytest.fixture
+def sandbox(tmp_path):
+    """Create a sandbox with a fake cloned repository."""
+    sandbox = JuliusSandbox(JuliusSandboxConfig(use_cache=False))
+    sandbox._temp_dir = tmp_path
+    sandbox._repo_dir = tmp_path / "julius"
+    sandbox._repo_dir.mkdir()
+    return sandbox
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    """Record subprocess.run commands instead of running them."""
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(julius_sandbox_module.subprocess, "run", fake_run)
+    return calls
+
+
+class TestRun:
+    """Tests for the output-spooling subprocess helper."""
+
+    def test_output_decoded(self):
+        """Test stdout and stderr are captured and invalid UTF-8 is replaced."""
+        code = "import sys; sys.stdout.buffer.write(b'ok\\xff'); sys.stderr.write('err')"
+
+        result = julius_sandbox_module._run([sys.executable, "-c", code], 30)
+
+        assert result.returncode == 0
+        assert result.stdout == "ok\ufffd"
+        assert result.stderr == "err"
+
+    def test_timeout_keeps_partial_output(self):
+        """Test output written before a timeout is attached to the exception."""
+        code = "import time; print('started', flush=True); time.sleep(30)"
+
+        with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+            julius_sandbox_module._run([sys.executable, "-c", code], 1)
+
+        assert exc_info.value.stdout == "started\n"
+
+
+class TestBuild:
+    """Tests for JuliusSandbox.build."""
+
+    def test_builds_through_cmake_with_all_cores(self, sandbox, commands, monkeypatch):
+        """Test the build step uses cmake --build with one job per core."""
+        monkeypatch.delenv("CMAKE_BUILD_PARALLEL_LEVEL", raising=False)
+        monkeypatch.setattr(julius_sandbox_module.os, "cpu_count", lambda: 12)
+
+        result = sandbox.build(target="julius")
+
+        assert result.success
+        build_dir = str(sandbox.build_dir)
+        assert commands[1] == [
+            "cmake", "--build", build_dir, "--parallel", "12", "--target", "julius"
+        ]
+
+    def test_parallel_level_from_environment(self, sandbox, commands, monkeypatch):
+        """Test CMAKE_BUILD_PARALLEL_LEVEL overrides the core count."""
+        monkeypatch.setenv("CMAKE_BUILD_PARALLEL_LEVEL", "3")
+
+        sandbox.build()
+
+        assert commands[1][-2:] == ["--parallel", "3"]
+
+    @pytest.mark.parametrize("ninja", [None, "/usr/bin/ninja"])
+    def test_ninja_generator_when_available(self, sandbox, commands, monkeypatch, ninja):
+        """Test Ninja is selected only when it is installed."""
+        monkeypatch.setattr(julius_sandbox_module.shutil, "which", lambda name: ninja)
+
+        sandbox.build()
+
+        assert ("Ninja" in commands[0]) == (ninja is not None)
+
+    def test_configure_skipped_when_unchanged(self, sandbox, commands):
+        """Test cmake is only re-run for a configured tree when its arguments change."""
+        sandbox.build()
+        (sandbox.build_dir / "CMakeCache.txt").write_text("")
+        sandbox.build()
+        assert [cmd[1] for cmd in commands] == [str(sandbox.repo_dir), "--build", "--build"]
+
+        sandbox.config.build_type = "Release"
+        sandbox.build()
+        assert commands[3][:2] == ["cmake", str(sandbox.repo_dir)]
+
+    def test_ccache_launcher(self, sandbox, monkeypatch):
+        """Test ccache is used as the compiler launcher with sandbox-relative hashing."""
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append((cmd, kwargs))
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setattr(julius_sandbox_module.subprocess, "run", fake_run)
+        monkeypatch.setattr(sandbox, "_ccache", "/usr/bin/ccache")
+
+        sandbox.build()
+
+        cmake_args, kwargs = calls[0]
+        assert "-DCMAKE_C_COMPILER_LAUNCHER=/usr/bin/ccache" in cmake_args
+        assert not any(arg.startswith("-DCMAKE_UNITY_BUILD") for arg in cmake_args)
+        assert kwargs["env"]["CCACHE_BASEDIR"] == str(sandbox.working_dir)
+
+    def test_unity_build_opt_in(self, sandbox, commands):
+        """Test unity builds are only requested when configured."""
+        sandbox.config.unity_build = True
+
+        sandbox.build()
+
+        assert "-DCMAKE_UNITY_BUILD=ON" in commands[0]
+
+    def test_env_built_once_per_asan_mode(self, sandbox):
+        """Test builds and test runs reuse their environments with distinct ASan modes."""
+        build_env = sandbox._env(abort_on_error=True)
+        run_env = sandbox._env(abort_on_error=False)
+
+        assert sandbox._env(abort_on_error=True) is build_env
+        assert "abort_on_error=1" in build_env["ASAN_OPTIONS"]
+        assert "abort_on_error=0" in run_env["ASAN_OPTIONS"]
+
+
+class TestBuildTest:
+    """Tests for JuliusSandbox.build_test."""
+
+    def test_compiles_each_source_then_links(self, sandbox, commands, monkeypatch, tmp_path):
+        """Test sources are compiled with -c separately and linked in one step."""
+        monkeypatch.setattr(sandbox, "_ccache", None)
+
+        result = sandbox.build_test(tmp_path, ["test_a.c", "test_b.c"])
+
+        assert result.success, result.error
+        compiles, link = commands[:2], commands[2]
+        assert sorted(cmd[cmd.index("-c") + 1] for cmd in compiles) == [
+            str(tmp_path / "test_a.c"), str(tmp_path / "test_b.c")
+        ]
+        objects = [cmd[cmd.index("-o") + 1] for cmd in compiles]
+        assert all(obj in link for obj in objects)
+        assert "-fsanitize=address" in link and "-lm" in link
+        assert link[link.index("-o") + 1] == str(sandbox.working_dir / "test_build" / "test_runner")
+
+    def test_no_sources(self, sandbox, commands, tmp_path):
+        """Test an empty source list is reported without running the compiler."""
+        result = sandbox.build_test(tmp_path, [])
+
+        assert not result.success
+        assert result.error == "No test sources to build."
+        assert commands == []
+
+    def test_compile_failure_skips_link(self, sandbox, monkeypatch, tmp_path):
+        """Test a failing translation unit fails the build without linking."""
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, int(str(tmp_path / "broken.c") in cmd))
+
+        monkeypatch.setattr(julius_sandbox_module.subprocess, "run", fake_run)
+
+        result = sandbox.build_test(tmp_path, ["ok.c", "broken.c"])
+
+        assert not result.success
+        assert result.error.startswith("Test compilation failed")
+        assert len(calls) == 2
+
+
+class TestFileAccess:
+    """Tests for direct file reads and writes in the repository."""
+
+    def test_apply_and_read_back(self, sandbox):
+        """Test changes are written as UTF-8, creating directories, and read back."""
+        sandbox.apply_file_changes(
+            {"src/city/a.c": "/* caf\u00e9 */\n", "src/city/b.c": "", "c.h": "int c;\n"}
+        )
+
+        assert (sandbox.repo_dir / "src" / "city" / "a.c").read_bytes() == b"/* caf\xc3\xa9 */\n"
+        assert sandbox.get_file_content("src/city/a.c") == "/* caf\u00e9 */\n"
+        assert sandbox.get_file_content("src/city/b.c") == ""
+        assert sandbox.get_file_content("c.h") == "int c;\n"
+
+    def test_apply_truncates(self, sandbox):
+        """Test shorter content replaces a file entirely."""
+        sandbox.apply_file_changes({"a.c": "int long_name;\n"})
+        sandbox.apply_file_changes({"a.c": "int a;\n"})
+
+        assert sandbox.get_file_content("a.c") == "int a;\n"
+
+    def test_missing_or_binary_file(self, sandbox):
+        """Test missing and non-UTF-8 files read as None."""
+        (sandbox.repo_dir / "icon.bin").write_bytes(b"\xff\xfe")
+
+        assert sandbox.get_file_content("missing.c") is None
+        assert sandbox.get_file_content("icon.bin") is None
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestApplyBuggyPatch:
+    """Tests for JuliusSandbox.apply_buggy_patch."""
+
+    def test_patch_file_applied(self, sandbox, tmp_path, monkeypatch):
+        """Test the patch file is applied in place by git, from any working directory."""
+        (sandbox.repo_dir / "city.c").write_text("int tax = 5;\n")
+        patch = tmp_path / "buggy.patch"
+        patch.write_text(
+            "--- a/city.c\n+++ b/city.c\n@@ -1 +1 @@\n-int tax = 5;\n+int tax = -5;\n"
+        )
+
+        monkeypatch.chdir(tmp_path)
+
+        result = sandbox.apply_buggy_patch(Path("buggy.patch"))
+
+        assert result.success, result.error
+        assert (sandbox.repo_dir / "city.c").read_text() == "int tax = -5;\n"
+
+    def test_bad_patch_reported(self, sandbox, tmp_path):
+        """Test a patch that does not apply fails with git's error."""
+        patch = tmp_path / "buggy.patch"
+        patch.write_text("--- a/missing.c\n+++ b/missing.c\n@@ -1 +1 @@\n-a\n+b\n")
+
+        result = sandbox.apply_buggy_patch(patch)
+
+        assert not result.success
+        assert "missing.c" in result.error
+
+
+class TestListSourceFiles:
+    """Tests for JuliusSandbox.list_source_files."""
+
+    def test_lists_matching_files_outside_git_and_build(self, sandbox):
+        """Test nested sources are listed and .git/build are skipped."""
+        repo = sandbox.repo_dir
+        for rel in ("src/core/a.c", "src/core/a.h", "src/b.c", ".git/x.c", "build/gen.c"):
+            (repo / rel).parent.mkdir(parents=True, exist_ok=True)
+            (repo / rel).write_text("")
+
+        assert sorted(sandbox.list_source_files()) == [
+            os.path.join("src", "b.c"),
+            os.path.join("src", "core", "a.c"),
+        ]
+        assert sandbox.list_source_files("*.h") == [os.path.join("src", "core", "a.h")]
+
+
+class TestClone:
+    """Tests for JuliusSandbox.clone."""
+
+    def test_full_hash_fetched_shallow(self, commands):
+        """Test a full commit hash is fetched alone at depth 1 without file contents."""
+        commit = "0123456789abcdef0123456789abcdef01234567"
+        with JuliusSandbox(JuliusSandboxConfig(use_cache=False)) as sandbox:
+            result = sandbox.clone(commit=commit)
+
+        assert result.success
+        assert commands[0][:3] == ["git", "init", "-q"]
+        assert commands[1][3:] == ["remote", "add", "origin", julius_sandbox_module.JULIUS_REPO_URL]
+        assert commands[2][3:] == [
+            "fetch", "--depth", "1", "--no-tags", "--filter=blob:none", "origin", commit
+        ]
+        assert commands[3] == ["git", "checkout", "--detach", "FETCH_HEAD"]
+
+    def test_abbreviated_hash_cloned_with_history(self, commands):
+        """Test an abbreviated hash falls back to a full clone and checkout."""
+        with JuliusSandbox(JuliusSandboxConfig(use_cache=False)) as sandbox:
+            sandbox.clone(commit="2c12e32")
+
+        assert commands[0][:3] == ["git", "clone", "--filter=blob:none"]
+        assert "--no-checkout" in commands[0]
+        assert "--depth" not in commands[0]
+        assert commands[1] == ["git", "checkout", "2c12e32"]
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_sparse_paths(self, tmp_path, monkeypatch):
+        """Test only the configured directories (and top-level files) are checked out."""
+        origin = tmp_path / "origin"
+        for path in ("src/city.c", "res/icon.png", "CMakeLists.txt"):
+            (origin / path).parent.mkdir(parents=True, exist_ok=True)
+            (origin / path).write_text(path)
+        git = ["git", "-C", str(origin), "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run(git[:3] + ["init", "-q"], check=True)
+        subprocess.run(git[:3] + ["config", "uploadpack.allowFilter", "true"], check=True)
+        subprocess.run(git + ["add", "."], check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "init"], check=True)
+        monkeypatch.setattr(julius_sandbox_module, "JULIUS_REPO_URL", origin.as_uri())
+
+        config = JuliusSandboxConfig(use_cache=False, sparse_paths=["src"])
+        with JuliusSandbox(config) as sandbox:
+            result = sandbox.clone()
+            assert result.success, result.error
+            checked_out = sorted(
+                str(path.relative_to(sandbox.repo_dir))
+                for path in sandbox.repo_dir.rglob("*")
+                if path.is_file() and ".git" not in path.parts
+            )
+
+        assert checked_out == ["CMakeLists.txt", os.path.join("src", "city.c")]
+
+
+class TestCleanup:
+    """Tests for JuliusSandbox.cleanup."""
+
+    def test_temp_dir_removed_in_background(self, tmp_path):
+        """Test the sandbox directory is moved aside at once and deleted later."""
+        temp_dir = tmp_path / "gdb_julius_test"
+        (temp_dir / "build").mkdir(parents=True)
+        (temp_dir / "build" / "city.o").write_bytes(b"\0")
+        sandbox = JuliusSandbox(JuliusSandboxConfig(use_cache=False))
+        sandbox._temp_dir = temp_dir
+
+        sandbox.cleanup()
+
+        assert sandbox.working_dir is None
+        assert not temp_dir.exists()
+        for thread in threading.enumerate():
+            if thread.name == "julius-cleanup":
+                thread.join()
+        assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestRepoCache:
+    """Tests for the per-commit repository cache."""
+
+    def test_cached_commit_cloned_locally(self, tmp_path, monkeypatch):
+        """Test a cached commit is checked out from the cache, not the network."""
+        origin = tmp_path / "origin"
+        origin.mkdir()
+        (origin / "main.c").write_text("int main(void) { return 0; }\n")
+        git = ["git", "-C", str(origin), "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run(git[:3] + ["init", "-q"], check=True)
+        subprocess.run(git + ["add", "."], check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "init"], check=True)
+        commit = subprocess.run(
+            git + ["rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+        config = JuliusSandboxConfig(cache_dir=tmp_path / "cache")
+        seed = JuliusSandbox(config)
+        seed._repo_dir = origin
+        seed._cache_repo(commit)
+        monkeypatch.setattr(julius_sandbox_module, "JULIUS_REPO_URL", str(tmp_path / "missing"))
+
+        with JuliusSandbox(config) as sandbox:
+            result = sandbox.clone(commit=commit)
+            assert result.success, result.error
+            assert result.stdout == "Using cached repository"
+            assert (sandbox.repo_dir / "main.c").read_text() == "int main(void) { return 0; }\n"
+            alternates = sandbox.repo_dir / ".git" / "objects" / "info" / "alternates"
+            assert alternates.exists()
+
+    @pytest.mark.parametrize("abbreviated", [False, True])
+    def test_sparse_partial_clone_reused(self, tmp_path, monkeypatch, abbreviated):
+        """Test sparse partial clones (shallow or not) are served from the cache."""
+        origin = tmp_path / "origin"
+        for path in ("src/city.c", "res/icon.png", "CMakeLists.txt"):
+            (origin / path).parent.mkdir(parents=True, exist_ok=True)
+            (origin / path).write_text(path)
+        git = ["git", "-C", str(origin), "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run(git[:3] + ["init", "-q"], check=True)
+        subprocess.run(git[:3] + ["config", "uploadpack.allowFilter", "true"], check=True)
+        subprocess.run(git[:3] + ["config", "uploadpack.allowAnySHA1InWant", "true"], check=True)
+        subprocess.run(git + ["add", "."], check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "init"], check=True)
+        commit = subprocess.run(
+            git + ["rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        if abbreviated:
+            commit = commit[:7]
+        monkeypatch.setattr(julius_sandbox_module, "JULIUS_REPO_URL", origin.as_uri())
+
+        config = JuliusSandboxConfig(cache_dir=tmp_path / "cache", sparse_paths=["src"])
+        with JuliusSandbox(config) as sandbox:
+            assert sandbox.clone(commit=commit).success
+
+        monkeypatch.setattr(julius_sandbox_module, "JULIUS_REPO_URL", str(tmp_path / "missing"))
+        with JuliusSandbox(config) as sandbox:
+            result = sandbox.clone(commit=commit)
+            assert result.success, result.error
+            assert result.stdout == "Using cached repository"
+            assert (sandbox.repo_dir / "src" / "city.c").read_text() == "src/city.c"
+            assert not (sandbox.repo_dir / "res").exists()
+
+        # A different sparse set needs blobs this entry does not have
+        other = JuliusSandboxConfig(cache_dir=tmp_path / "cache", sparse_paths=["res"])
+        assert JuliusSandbox(other)._cache_path(commit) != JuliusSandbox(config)._cache_path(commit)
+
+    def test_unusable_entry_replaced(self, tmp_path, monkeypatch):
+        """Test a cache entry that cannot be checked out is dropped."""
+        config = JuliusSandboxConfig(cache_dir=tmp_path / "cache")
+        sandbox = JuliusSandbox(config)
+        sandbox._temp_dir = tmp_path / "sandbox"
+        sandbox._temp_dir.mkdir()
+        broken = sandbox._cache_path("2c12e32")
+        broken.mkdir(parents=True)
+
+        assert sandbox._get_cached_repo("2c12e32") is None
+        for thread in threading.enumerate():
+            if thread.name == "julius-cleanup":
+                thread.join()
+        assert not broken.exists()
+        assert not (sandbox._temp_dir / "julius").exists()
+
+    def test_cache_dir_created_once(self, tmp_path, monkeypatch):
+        """Test the cache directory is created by the first sandbox only."""
+        created = []
+        monkeypatch.setattr(
+            julius_sandbox_module.Path, "mkdir", lambda self, **kwargs: created.append(self)
+        )
+        config = JuliusSandboxConfig(cache_dir=tmp_path / "cache")
+
+        JuliusSandbox(config)
+        JuliusSandbox(config)
+
+        assert created == [tmp_path / "cache"]
+
+    def test_legacy_entries_pruned(self, tmp_path):
+        """Test unsharded entries from the old key layout are deleted on first use."""
+        cache_dir = tmp_path / "cache"
+        legacy = cache_dir / "julius_0123456789abcdef"
+        (legacy / ".git").mkdir(parents=True)
+        (cache_dir / "ab" / "julius_ab23456789abcdef").mkdir(parents=True)
+        (cache_dir / "notes.txt").write_text("keep")
+
+        JuliusSandbox(JuliusSandboxConfig(cache_dir=cache_dir))
+        for thread in threading.enumerate():
+            if thread.name == "julius-cleanup":
+                thread.join()
+
+        assert sorted(path.name for path in cache_dir.iterdir()) == ["ab", "notes.txt"]
+
+    def test_cache_path_sharded(self, sandbox):
+        """Test cache entries are keyed by a short digest under a two-level layout."""
+        path = sandbox._cache_path("a" * 40)
+
+        assert path.parent.parent == sandbox.config.cache_dir
+        assert path.name.startswith(f"julius_{path.parent.name}")
+        assert len(path.name) == len("julius_") + 16
+        assert sandbox._cache_path("a" * 40) == path != sandbox._cache_path("b" * 40)
@@ -0,0 +1,134 @@
+"""Tests for the metrics module."""
+
+import dataclasses
+import threading
+import time
+from array import array
+
+import pytest
+
+import harness.metrics as metrics_module
+from harness.metrics import MetricsCollector
+
+FRAME_TIMES = [16.0, 17.0, 0.0, 33.0, 15.5, 16.5, 50.0, 16.0, 16.2, 20.0]
+
+
+class TestFrameTimeStats:
+    """Tests for frame time aggregation."""
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_stats(self, monkeypatch, use_numpy):
+        """Test averages, nearest-rank percentiles and FPS with and without NumPy."""
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(metrics_module, "np", None)
+
+        avg, p95, p99, avg_fps, min_fps, max_fps = metrics_module._frame_time_stats(FRAME_TIMES)
+
+        fps = [1000.0 / t for t in FRAME_TIMES if t > 0]
+        assert avg == pytest.approx(sum(FRAME_TIMES) / len(FRAME_TIMES))
+        assert p95 == 50.0
+        assert p99 == 50.0
+        assert avg_fps == pytest.approx(sum(fps) / len(fps))
+        assert min_fps == pytest.approx(20.0)
+        assert max_fps == pytest.approx(1000.0 / 15.5)
+
+    def test_percentiles_nearest_rank(self):
+        """Test percentiles pick the value at index int(n * q)."""
+        times = [float(i) for i in range(1, 201)]
+
+        _, p95, p99, *_ = metrics_module._frame_time_stats(times)
+
+        assert (p95, p99) == (191.0, 199.0)
+
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_array_storage(self, monkeypatch, use_numpy):
+        """Test array('d') frame storage aggregates exactly like a list."""
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(metrics_module, "np", None)
+
+        stats = metrics_module._frame_time_stats(array("d", FRAME_TIMES))
+
+        assert stats == metrics_module._frame_time_stats(FRAME_TIMES)
+
+
+class TestMetricsCollector:
+    """Tests for the MetricsCollector class."""
+
+    def test_collects_frames(self):
+        """Test a short session is aggregated."""
+        with MetricsCollector() as collector:
+            for _ in range(5):
+                collector.record_frame()
+            metrics = collector.stop()
+
+        assert metrics.total_frames == 5
+        assert metrics.avg_frame_time_ms >= 0
+
+    def test_frame_times_from_monotonic_clock(self, monkeypatch):
+        """Test frame times come from perf_counter_ns, not the wall clock."""
+        readings = iter([1_000_000_000, 1_016_500_000, 1_050_000_000, 1_060_000_000])
+        monkeypatch.setattr(metrics_module.time, "perf_counter_ns", lambda: next(readings))
+        collector = MetricsCollector()
+        collector.start()
+
+        first = collector.record_frame()
+        second = collector.record_frame()
+        metrics = collector.stop()
+
+        assert first.frame_time_ms == pytest.approx(16.5)
+        assert second.frame_time_ms == pytest.approx(33.5)
+        assert first.fps == pytest.approx(1000.0 / 16.5)
+        assert second.timestamp - first.timestamp == pytest.approx(0.0335, abs=1e-6)
+        assert metrics.elapsed_time_s == pytest.approx(0.06)
+
+    def test_frame_metrics_fields(self):
+        """Test fps is a regular dataclass field that serializes with the frame."""
+        frame = metrics_module.FrameMetrics(
+            frame_number=1, frame_time_ms=20.0, fps=50.0, memory_mb=0.0, cpu_percent=0.0
+        )
+
+        assert dataclasses.asdict(frame)["fps"] == 50.0
+
+    def test_system_metrics_sampled_off_frame(self, monkeypatch):
+        """Test memory/CPU are sampled by a background thread and reported per frame."""
+        class FakeProcess:
+            def memory_info(self):
+                return type("MemInfo", (), {"rss": 64 * 1024 * 1024})()
+
+            def cpu_percent(self):
+                return 12.5
+
+        monkeypatch.setattr(metrics_module.psutil, "Process", FakeProcess)
+        collector = MetricsCollector(sample_interval=0.01)
+        collector.start()
+        while not collector._last_cpu_percent:
+            time.sleep(0.001)
+
+        frame = collector.record_frame()
+        sampler = collector._sampler
+        metrics = collector.stop()
+
+        assert (frame.memory_mb, frame.cpu_percent) == (64.0, 12.5)
+        assert not sampler.is_alive()
+        assert metrics.avg_memory_mb == 64.0
+        assert metrics.peak_memory_mb == 64.0
+        assert metrics.avg_cpu_percent == 12.5
+
+    def test_restart_replaces_sampler(self):
+        """Test calling start() again stops the previous sampler thread."""
+        collector = MetricsCollector(sample_interval=0.01)
+        collector.start()
+        first = collector._sampler
+
+        collector.start()
+        samplers = [t for t in threading.enumerate() if t.name == "metrics-sampler"]
+        second = collector._sampler
+        collector.stop()
+
+        assert not first.is_alive()
+        assert samplers == [second]
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from harness.sandbox import Sandbox, SandboxConfig
+from harness.sandbox import Sandbox, SandboxConfig, SandboxPool
 
 
 class TestSandbox:
@@ -95,6 +95,75 @@ class TestSandbox:
 
         sandbox.cleanup()
 
+    def test_reset(self, tmp_path):
+        """Test reset reverts applied changes and removes new files."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "main.py").write_text("print('original')")
+
+        sandbox = Sandbox()
+        sandbox.setup(source_dir)
+        sandbox.apply_changes({"main.py": "print('modified')", "extra.py": "x = 1"})
+
+        sandbox.reset()
+
+        assert (sandbox.game_dir / "main.py").read_text() == "print('original')"
+        assert not (sandbox.game_dir / "extra.py").exists()
+        assert sandbox.get_changes() == {}
+
+        sandbox.cleanup()
+
+    def test_reset_reverts_runtime_writes(self, tmp_path):
+        """Test reset undoes files written by the game itself and drops bytecode."""
+        source_dir = tmp_path / "source"
+        (source_dir / "data").mkdir(parents=True)
+        (source_dir / "main.py").write_text("print('original')")
+        (source_dir / "data" / "save.txt").write_text("level 1")
+        (source_dir / "data" / "keep.txt").write_text("keep")
+        outside = tmp_path / "outside.txt"
+        outside.write_text("untouched")
+
+        sandbox = Sandbox()
+        sandbox.setup(source_dir)
+        game_dir = sandbox.game_dir
+        (game_dir / "data" / "save.txt").write_text("level 9")
+        (game_dir / "data" / "keep.txt").unlink()
+        (game_dir / "data" / "keep.txt").symlink_to(outside)
+        (game_dir / "main.py").unlink()
+        (game_dir / "scores.db").write_text("x")
+        (game_dir / "logs").mkdir()
+        (game_dir / "logs" / "run.log").write_text("x")
+        (game_dir / "__pycache__").mkdir()
+        (game_dir / "__pycache__" / "main.cpython-311.pyc").write_bytes(b"\0")
+
+        sandbox.reset()
+
+        assert (game_dir / "data" / "save.txt").read_text() == "level 1"
+        assert not (game_dir / "data" / "keep.txt").is_symlink()
+        assert (game_dir / "data" / "keep.txt").read_text() == "keep"
+        assert outside.read_text() == "untouched"
+        assert (game_dir / "main.py").read_text() == "print('original')"
+        assert sorted(p.name for p in game_dir.iterdir()) == ["data", "main.py"]
+
+        sandbox.cleanup()
+
+    def test_get_changes_ignores_cache_dirs(self, tmp_path):
+        """Test files under __pycache__ and venv directories are not tracked."""
+        source_dir = tmp_path / "source"
+        (source_dir / "pkg").mkdir(parents=True)
+        (source_dir / "pkg" / "mod.py").write_text("x = 1")
+
+        sandbox = Sandbox()
+        sandbox.setup(source_dir)
+        for name in ("__pycache__", ".venv"):
+            (sandbox.game_dir / name).mkdir()
+            (sandbox.game_dir / name / "stale.py").write_text("x = 0")
+        (sandbox.game_dir / "pkg" / "mod.py").write_text("x = 2")
+
+        assert sandbox.get_changes() == {os.path.join("pkg", "mod.py"): "x = 2"}
+
+        sandbox.cleanup()
+
 
 class TestSandboxConfig:
     """Tests for SandboxConfig."""
@@ -111,3 +180,46 @@ class TestSandboxConfig:
         config = SandboxConfig(timeout=120, headless=False)
         assert config.timeout == 120
         assert config.headless is False
+
+
+class TestSandboxPool:
+    """Tests for SandboxPool."""
+
+    def test_reuses_sandbox(self, tmp_path):
+        """Test a released sandbox is reset and handed out again."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "main.py").write_text("print('original')")
+
+        with SandboxPool() as pool:
+            first = pool.acquire(Sandbox, SandboxConfig(), source_dir)
+            first.apply_changes({"main.py": "print('modified')"})
+            pool.release(first, source_dir)
+
+            second = pool.acquire(Sandbox, SandboxConfig(timeout=5), source_dir)
+
+            assert second is first
+            assert second.config.timeout == 5
+            assert (second.game_dir / "main.py").read_text() == "print('original')"
+            pool.release(second, source_dir)
+            working_dir = second.working_dir
+
+        assert not working_dir.exists()
+
+    def test_separate_sources(self, tmp_path):
+        """Test different source directories get different sandboxes."""
+        dirs = []
+        for name in ("a", "b"):
+            source_dir = tmp_path / name
+            source_dir.mkdir()
+            (source_dir / "main.py").write_text(name)
+            dirs.append(source_dir)
+
+        with SandboxPool() as pool:
+            a = pool.acquire(Sandbox, SandboxConfig(), dirs[0])
+            pool.release(a, dirs[0])
+            b = pool.acquire(Sandbox, SandboxConfig(), dirs[1])
+
+            assert b is not a
+            assert (b.game_dir / "main.py").read_text() == "b"
+            b.cleanup()
@@ -0,0 +1,92 @@
+"""Tests for the model response cache."""
+
+import pytest
+
+from models.base import GenerationResult, ModelConfig, ModelError, ModelInterface
+from models.cache import CachedModel, ResponseCache
+
+
+class CountingModel(ModelInterface):
+    """Model stub that counts generate calls."""
+
+    def __init__(self, model_id="stub"):
+        super().__init__(ModelConfig(name=model_id, provider="mock", model_id=model_id))
+        self.calls = 0
+
+    def generate(self, prompt, context=None):
+        self.calls += 1
+        return GenerationResult(content=f"response {self.calls}", model=self.config.model_id)
+
+    def is_available(self):
+        return True
+
+
+class TestResponseCache:
+    """Tests for ResponseCache and CachedModel."""
+
+    def test_hit_skips_generation(self, tmp_path):
+        """Test a repeated request is served from the cache."""
+        inner = CountingModel()
+        model = CachedModel(inner, ResponseCache(tmp_path))
+
+        first = model.generate("fix it", {"files": {"main.py": "x = 1"}})
+        second = model.generate("fix it", {"files": {"main.py": "x = 1"}})
+
+        assert inner.calls == 1
+        assert second.content == first.content
+
+    def test_key_covers_context_and_model(self, tmp_path):
+        """Test different files or model configs miss the cache."""
+        inner = CountingModel()
+        model = CachedModel(inner, ResponseCache(tmp_path))
+
+        model.generate("fix it", {"files": {"main.py": "x = 1"}})
+        model.generate("fix it", {"files": {"main.py": "x = 2"}})
+        inner.config.temperature = 0.5
+        model.generate("fix it", {"files": {"main.py": "x = 2"}})
+
+        assert inner.calls == 3
+
+    def test_file_boundaries_in_key(self, tmp_path):
+        """Test moving text between files changes the key."""
+        model = CountingModel()
+        first = ResponseCache.make_key(model, "fix it", {"files": {"a.py": "xy", "b.py": ""}})
+        second = ResponseCache.make_key(model, "fix it", {"files": {"a.py": "x", "b.py": "y"}})
+
+        assert first != second
+        assert len(first) == 64
+
+    def test_timeout_not_part_of_key(self, tmp_path):
+        """Test per-task timeout changes still hit the cache."""
+        inner = CountingModel()
+        model = CachedModel(inner, ResponseCache(tmp_path))
+
+        model.generate("fix it")
+        model.config.timeout = 999
+        model.generate("fix it")
+
+        assert inner.calls == 1
+
+    def test_replay_miss_raises(self, tmp_path):
+        """Test replay mode refuses to call the model."""
+        model = CachedModel(CountingModel(), ResponseCache(tmp_path, mode="replay"))
+
+        with pytest.raises(ModelError):
+            model.generate("fix it")
+
+    def test_write_only_always_generates(self, tmp_path):
+        """Test write-only mode refreshes entries without reading them."""
+        inner = CountingModel()
+        model = CachedModel(inner, ResponseCache(tmp_path, mode="write-only"))
+        model.generate("fix it")
+        model.generate("fix it")
+
+        replay = CachedModel(CountingModel(), ResponseCache(tmp_path, mode="replay"))
+
+        assert inner.calls == 2
+        assert replay.generate("fix it").content == "response 2"
+
+    def test_invalid_mode(self, tmp_path):
+        """Test unknown cache modes are rejected."""
+        with pytest.raises(ValueError):
+            ResponseCache(tmp_path, mode="sometimes")
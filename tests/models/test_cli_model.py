@@ -0,0 +1,26 @@
+"""Tests for the CLI model module."""
+
+from models.base import ModelConfig
+from models.cli_model import CLIModel
+
+
+class TestBuildFullPrompt:
+    """Tests for CLIModel._build_full_prompt."""
+
+    def test_duplicate_files_emitted_once(self):
+        """Test files with identical contents share one listing."""
+        model = CLIModel(ModelConfig(name="mock", provider="mock", model_id="mock"))
+        context = {
+            "files": {
+                "a.h": "#pragma once\n",
+                "main.c": "int main(void) { return 0; }\n",
+                "b.h": "#pragma once\n",
+            }
+        }
+
+        prompt = model._build_full_prompt("Fix it.", context)
+
+        assert prompt.count("#pragma once") == 1
+        assert "--- a.h, b.h ---" in prompt
+        assert "--- main.c ---" in prompt
+        assert prompt.endswith("User: Fix it.")